@@ -1,32 +1,247 @@
 import os
-from flask import Flask, jsonify, request, render_template
+import json
+import hashlib
+import importlib
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_EXCEPTION
+import orjson
+from flask import Flask, jsonify, request, render_template, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_caching import Cache
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 # Import services
-from services.news_service import NewsService
-from services.market_service import MarketService
 from services.unified_broker_service import UnifiedBrokerService
-from services.sentiment_service import SentimentService
-from services.prediction_service import PredictionService
+from services.provider_guard import ProviderGuard, ProviderUnavailable, is_error_payload
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, which also serializes numpy values natively"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class OrjsonFlask(Flask):
+    """Flask app whose jsonify/request.json go through orjson"""
+    json_provider_class = OrjsonProvider
 
 # Create Flask app
-app = Flask(__name__, 
-            static_folder='static',
-            template_folder='templates')
+app = OrjsonFlask(__name__, 
+                  static_folder='static',
+                  template_folder='templates')
 
 # Enable CORS
 CORS(app)
 
+# Cache upstream broker/news/market calls (Redis when configured, in-process otherwise)
+cache = Cache(app, config={
+    'CACHE_TYPE': 'RedisCache' if os.getenv('REDIS_URL') else 'SimpleCache',
+    'CACHE_REDIS_URL': os.getenv('REDIS_URL'),
+    'CACHE_DEFAULT_TIMEOUT': 60
+})
+
 # Initialize services
-news_service = NewsService()
-market_service = MarketService()
 broker_service = UnifiedBrokerService()
-sentiment_service = SentimentService()
-prediction_service = PredictionService()
+
+# Heavier services (news scraping, yfinance, xgboost) are imported on first use
+_service_classes = {
+    'news': ('services.news_service', 'NewsService'),
+    'market': ('services.market_service', 'MarketService'),
+    'sentiment': ('services.sentiment_service', 'SentimentService'),
+    'prediction': ('services.prediction_service', 'PredictionService')
+}
+_services = {}
+_services_lock = threading.Lock()
+
+def get_service(name):
+    """Import and construct a service the first time it's needed"""
+    service = _services.get(name)
+    if service is None:
+        with _services_lock:
+            if name not in _services:
+                module_name, class_name = _service_classes[name]
+                _services[name] = getattr(importlib.import_module(module_name), class_name)()
+            service = _services[name]
+    return service
+
+# Rate limits and circuit breakers for upstream providers
+provider_guards = {
+    'broker': ProviderGuard('broker', '300/second'),
+    'news': ProviderGuard('news', '5/minute')
+}
+
+# Shared pool for fanning out independent upstream calls
+executor = ThreadPoolExecutor(max_workers=8)
+
+def gather(*futures):
+    """Wait for all futures, failing fast on the first exception"""
+    done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+    for future in done:
+        if future.exception() is not None:
+            for other in pending:
+                other.cancel()
+            raise future.exception()
+    return [future.result() for future in futures]
+
+# Requests currently being computed, so concurrent duplicates can share the result
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def single_flight(key, fn, *args):
+    """Run fn once per key at a time; concurrent callers with the same key wait for that result"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+    
+    if is_leader:
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    
+    return future.result()
+
+def api_route(success_key=None):
+    """Wrap a handler's result in the JSON response envelope and turn exceptions into 500s"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                result = fn(*args, **kwargs)
+                return jsonify({"success": True, success_key: result} if success_key else result)
+            except Exception as e:
+                app.logger.exception(e)
+                return jsonify({"success": False, "error": str(e)}), 500
+        return wrapper
+    return decorator
+
+# Cached data helpers
+def current_account():
+    """Cache key for the connected broker account so portfolios don't collide"""
+    return broker_service.connected_broker or 'anonymous'
+
+def guarded_call(provider, account, fn, *args):
+    """Call a provider through its guard, serving the last good result while it's unavailable"""
+    last_good_key = f"last_good:{provider}:{account}"
+    try:
+        result = provider_guards[provider].call(fn, *args)
+    except ProviderUnavailable as e:
+        last_good = cache.get(last_good_key)
+        return last_good if last_good is not None else {"success": False, "error": str(e)}
+    
+    if not is_error_payload(result):
+        cache.set(last_good_key, result, timeout=0)
+    return result
+
+def cacheable(result):
+    """Whether a fetched result may be memoized; errors are retried on the next request"""
+    return not is_error_payload(result)
+
+@cache.memoize(timeout=30, response_filter=cacheable)
+def fetch_portfolio(account):
+    """Get portfolio for an account, cached for 30 seconds"""
+    if not broker_service.connected_broker:
+        return broker_service.get_portfolio()
+    return guarded_call('broker', account, broker_service.get_portfolio)
+
+@cache.memoize(timeout=300, response_filter=cacheable)
+def fetch_news(account):
+    """Get news for an account's portfolio, cached for 5 minutes"""
+    news_service = get_service('news')
+    if not news_service.newsapi:
+        return news_service.get_news_for_portfolio(fetch_portfolio(account))
+    return guarded_call('news', account, news_service.get_news_for_portfolio, fetch_portfolio(account))
+
+@cache.memoize(timeout=60, response_filter=cacheable)
+def fetch_market_data(account):
+    """Get market data for an account's portfolio, cached for 1 minute"""
+    return get_service('market').get_market_data(fetch_portfolio(account))
+
+@cache.memoize(timeout=300, response_filter=cacheable)
+def fetch_sentiment(account):
+    """Get sentiment for an account's news, cached as long as the news itself"""
+    return get_service('sentiment').analyze_sentiment(fetch_news(account))
+
+@cache.memoize(timeout=600, response_filter=cacheable)
+def fetch_macro():
+    """Get macroeconomic indicators, cached for 10 minutes"""
+    return get_service('market').get_macro_indicators()
+
+def stream_news(account):
+    """Yield news articles as they're fetched, then fill the fetch_news cache with them"""
+    cache_key = fetch_news.make_cache_key(fetch_news.uncached, account)
+    news = cache.get(cache_key)
+    
+    if news is None:
+        portfolio = fetch_portfolio(account)
+        news_service = get_service('news')
+        if news_service.newsapi:
+            articles = provider_guards['news'].stream(news_service.iter_news_for_portfolio, portfolio)
+        else:
+            articles = news_service.iter_news_for_portfolio(portfolio)
+        
+        news = []
+        try:
+            for article in articles:
+                news.append(article)
+                yield article
+        except ProviderUnavailable:
+            last_good = cache.get(f"last_good:news:{account}")
+            if last_good is None:
+                raise
+            yield from last_good
+            return
+        
+        cache.set(cache_key, news, timeout=fetch_news.cache_timeout)
+        cache.set(f"last_good:news:{account}", news, timeout=0)
+    else:
+        yield from news
+
+def _digest(data):
+    """Stable digest of JSON-like data, usable as a cache key across workers"""
+    return hashlib.md5(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+
+def predict_margin(portfolio, market_data, sentiment):
+    """Predict optimal margin, reusing results for identical inputs for 30 seconds"""
+    key = f"optimize:{_digest(portfolio)}:{_digest(sentiment)}"
+    optimized_margin = cache.get(key)
+    if optimized_margin is None:
+        optimized_margin = get_service('prediction').predict_optimal_margin(
+            portfolio, market_data, sentiment
+        )
+        cache.set(key, optimized_margin, timeout=30)
+    return optimized_margin
+
+def compute_optimized_margin(account):
+    """Gather portfolio, market data and sentiment for an account and predict its margin"""
+    portfolio = fetch_portfolio(account)
+    
+    # Market data and news/sentiment only depend on the portfolio, so fetch them concurrently
+    market_data, sentiment = gather(
+        executor.submit(fetch_market_data, account),
+        executor.submit(fetch_sentiment, account)
+    )
+    
+    return predict_margin(portfolio, market_data, sentiment)
+
+def invalidate_account_cache():
+    """Drop cached portfolio-derived data after the account changes"""
+    for helper in (fetch_portfolio, fetch_news, fetch_market_data, fetch_sentiment):
+        cache.delete_memoized(helper)
 
 # Routes
 @app.route('/')
@@ -35,164 +250,131 @@ def index():
     return render_template('index.html')
 
 @app.route('/api/brokers', methods=['GET'])
+@api_route('brokers')
 def get_supported_brokers():
     """Get list of supported brokers"""
-    try:
-        brokers = broker_service.get_supported_brokers()
-        return jsonify({"success": True, "brokers": brokers})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    return broker_service.get_supported_brokers()
 
 @app.route('/api/portfolio', methods=['GET'])
+@api_route()
 def get_portfolio():
     """Get user's portfolio from broker API"""
-    try:
-        # In production, this would be authenticated
-        portfolio = broker_service.get_portfolio()
-        return jsonify(portfolio)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    # In production, this would be authenticated
+    return fetch_portfolio(current_account())
 
 @app.route('/api/news', methods=['GET'])
 def get_news():
-    """Get relevant financial news based on user portfolio"""
-    try:
-        # Get news related to user portfolio
-        portfolio = broker_service.get_portfolio()
-        news = news_service.get_news_for_portfolio(portfolio)
-        return jsonify({"success": True, "news": news})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """Stream relevant financial news based on user portfolio as NDJSON, one article per line"""
+    account = current_account()
+    
+    def generate():
+        try:
+            for article in stream_news(account):
+                yield app.json.dumps(article) + "\n"
+        except Exception as e:
+            yield app.json.dumps({"success": False, "error": str(e)}) + "\n"
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
 
 @app.route('/api/sentiment', methods=['GET'])
+@api_route('sentiment')
 def get_sentiment():
     """Get sentiment analysis for portfolio holdings"""
-    try:
-        # Get news and analyze sentiment
-        portfolio = broker_service.get_portfolio()
-        news = news_service.get_news_for_portfolio(portfolio)
-        sentiment = sentiment_service.analyze_sentiment(news)
-        return jsonify({"success": True, "sentiment": sentiment})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Get news and analyze sentiment
+    return fetch_sentiment(current_account())
 
 @app.route('/api/margin/optimize', methods=['GET'])
+@api_route('optimized_margin')
 def optimize_margin():
     """Get optimized margin requirements"""
-    try:
-        # Get all necessary data
-        portfolio = broker_service.get_portfolio()
-        news = news_service.get_news_for_portfolio(portfolio)
-        market_data = market_service.get_market_data(portfolio)
-        sentiment = sentiment_service.analyze_sentiment(news)
-        
-        # Make prediction
-        optimized_margin = prediction_service.predict_optimal_margin(
-            portfolio, market_data, sentiment
-        )
-        
-        return jsonify({"success": True, "optimized_margin": optimized_margin})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Concurrent requests for the same account share one computation
+    account = current_account()
+    return single_flight(f"optimize:{account}", compute_optimized_margin, account)
 
 @app.route('/api/macro', methods=['GET'])
+@api_route('macro_data')
 def get_macro():
     """Get macroeconomic indicators"""
-    try:
-        macro_data = market_service.get_macro_indicators()
-        return jsonify({"success": True, "macro_data": macro_data})
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    return fetch_macro()
+
+@app.route('/api/health/providers', methods=['GET'])
+@api_route('providers')
+def get_provider_health():
+    """Get circuit breaker and rate limit status for upstream providers"""
+    return {name: guard.status() for name, guard in provider_guards.items()}
 
 @app.route('/api/broker/connect', methods=['POST'])
+@api_route()
 def connect_broker():
     """Connect to broker API"""
-    try:
-        data = request.json
-        result = broker_service.connect(data.get('broker'), data.get('credentials'))
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = request.json
+    result = broker_service.connect(data.get('broker'), data.get('credentials'))
+    invalidate_account_cache()
+    return result
 
 @app.route('/api/broker/disconnect', methods=['POST'])
+@api_route()
 def disconnect_broker():
     """Disconnect from broker API"""
-    try:
-        result = broker_service.disconnect()
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    result = broker_service.disconnect()
+    invalidate_account_cache()
+    return result
 
 # Pledge related endpoints
 @app.route('/api/pledge/holdings', methods=['GET'])
+@api_route()
 def get_pledged_holdings():
     """Get pledged holdings"""
-    try:
-        result = broker_service.get_pledged_holdings()
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    return broker_service.get_pledged_holdings()
 
 @app.route('/api/pledge/create', methods=['POST'])
+@api_route()
 def create_pledge():
     """Create a new pledge request"""
-    try:
-        data = request.json
-        result = broker_service.create_pledge_request(
-            data.get('stock_id'),
-            data.get('quantity'),
-            data.get('reason')
-        )
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = request.json
+    result = broker_service.create_pledge_request(
+        data.get('stock_id'),
+        data.get('quantity'),
+        data.get('reason')
+    )
+    return result
 
 @app.route('/api/pledge/unpledge', methods=['POST'])
+@api_route()
 def unpledge():
     """Create an unpledge request"""
-    try:
-        data = request.json
-        result = broker_service.unpledge_request(
-            data.get('pledge_id'),
-            data.get('quantity'),
-            data.get('reason')
-        )
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = request.json
+    result = broker_service.unpledge_request(
+        data.get('pledge_id'),
+        data.get('quantity'),
+        data.get('reason')
+    )
+    return result
 
 @app.route('/api/pledge/status/<pledge_id>', methods=['GET'])
+@api_route()
 def get_pledge_status(pledge_id):
     """Get status of a specific pledge request"""
-    try:
-        result = broker_service.get_pledge_status(pledge_id)
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    return broker_service.get_pledge_status(pledge_id)
 
 @app.route('/api/pledge/request-otp', methods=['POST'])
+@api_route()
 def request_pledge_otp():
     """Request OTP for pledge authorization"""
-    try:
-        data = request.json
-        result = broker_service.request_pledge_otp(data.get('pledge_id'))
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = request.json
+    return broker_service.request_pledge_otp(data.get('pledge_id'))
 
 @app.route('/api/pledge/authorize', methods=['POST'])
+@api_route()
 def authorize_pledge():
     """Authorize a pledge request using OTP"""
-    try:
-        data = request.json
-        result = broker_service.authorize_pledge(
-            data.get('pledge_id'),
-            data.get('otp')
-        )
-        return jsonify(result)
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = request.json
+    result = broker_service.authorize_pledge(
+        data.get('pledge_id'),
+        data.get('otp')
+    )
+    return result
 
 if __name__ == '__main__':
-    # Run the app on 0.0.0.0 to make it externally accessible
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Development server only; production runs under gunicorn via wsgi.py
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1')
\ No newline at end of file
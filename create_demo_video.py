@@ -1,6 +1,10 @@
 import time
+import functools
 import os
 import sys
+import multiprocessing
+import shutil
+import subprocess
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from services.broker_service import BrokerService
@@ -12,7 +16,9 @@ from models.model_trainer import MarginOptimizerModelTrainer
 
 # Configure demo parameters
 NUM_FRAMES = 50
-OUTPUT_DIR = "demo_frames"
+OUTPUT_DIR = "demo_frames"  # Only used with --frames or when ffmpeg isn't installed
+VIDEO_PATH = "demo_video.mp4"
+FPS = 10
 WIDTH, HEIGHT = 1280, 720
 BG_COLOR = (240, 245, 250)
 TEXT_COLOR = (30, 50, 70)
@@ -25,38 +31,228 @@ def create_directory(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
 
-def generate_demo_frame(frame_num, total_frames, portfolio, market_data, news_data, sentiment_data, optimization_result=None):
-    # Create a blank image
+def _load_fonts():
+    """Load the title, heading, regular and small fonts"""
+    # Use default if custom font fails
+    try:
+        title_font = ImageFont.truetype("arial.ttf", 36)
+        heading_font = ImageFont.truetype("arial.ttf", 24)
+        regular_font = ImageFont.truetype("arial.ttf", 18)
+        small_font = ImageFont.truetype("arial.ttf", 14)
+    except IOError:
+        title_font = ImageFont.load_default()
+        heading_font = ImageFont.load_default()
+        regular_font = ImageFont.load_default()
+        small_font = ImageFont.load_default()
+    
+    return title_font, heading_font, regular_font, small_font
+
+# Fonts are loaded once at import rather than on every frame
+TITLE_FONT, HEADING_FONT, REGULAR_FONT, SMALL_FONT = _load_fonts()
+
+# Pulse animation curve for the optimization highlight, one value per frame
+PULSE = np.abs(np.sin(np.arange(NUM_FRAMES) / 5))
+
+@functools.lru_cache(maxsize=32)
+def render_pie(pos_percent, neu_percent, neg_percent, radius):
+    """Rasterize the sentiment pie once per distribution as an RGBA sprite"""
+    yy, xx = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    
+    # Angle of each pixel, clockwise from 3 o'clock like ImageDraw.pieslice
+    theta = np.degrees(np.arctan2(yy, xx)) % 360
+    angle_pos = pos_percent * 3.6  # Convert to degrees (100% = 360 degrees)
+    angle_neu = neu_percent * 3.6
+    
+    # 0 = positive, 1 = neutral, 2 = negative segment
+    segment = np.where(theta < angle_pos, 0, np.where((theta < angle_pos + angle_neu) | (neg_percent == 0), 1, 2))
+    palette = np.array([POSITIVE_COLOR, NEUTRAL_COLOR, NEGATIVE_COLOR], dtype=np.uint8)
+    
+    pie = np.empty((2 * radius + 1, 2 * radius + 1, 4), dtype=np.uint8)
+    pie[..., :3] = palette[segment]
+    pie[..., 3] = np.where(xx ** 2 + yy ** 2 <= radius ** 2, 255, 0)
+    return Image.fromarray(pie, 'RGBA')
+
+def count_sentiment(sentiment_data):
+    """Histogram of sentiment labels; anything not positive/negative counts as neutral"""
+    labels = np.array([score.get('label', 'neutral') for score in sentiment_data.values()])
+    positive = int((labels == 'positive').sum())
+    negative = int((labels == 'negative').sum())
+    return {'positive': positive, 'negative': negative, 'neutral': len(labels) - positive - negative}
+
+# Rendered news cards, keyed by article and card size
+_news_cards = {}
+
+def render_news_card(news, width, height):
+    """Render a news card image once per article and reuse it afterwards"""
+    key = (news.get('url') or news.get('title'), news.get('published_at'), width, height)
+    card = _news_cards.get(key)
+    if card is not None:
+        return card
+    
+    card = Image.new('RGB', (width + 1, height + 1), BG_COLOR)
+    draw = ImageDraw.Draw(card)
+    
+    # Draw news card
+    draw.rounded_rectangle([(0, 0), (width, height)], radius=5, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR)
+    
+    # Draw news content
+    title = news.get('title', 'News Title')
+    title_lines = wrap_text(title, REGULAR_FONT, width - 20)
+    
+    for j, line in enumerate(title_lines):
+        draw.text((10, 10 + j * 25), line, font=REGULAR_FONT, fill=TEXT_COLOR)
+    
+    source = news.get('source', 'Source')
+    date = news.get('published_at', 'Date')[:10]
+    draw.text((10, 70), f"Source: {source}", font=SMALL_FONT, fill=TEXT_COLOR)
+    draw.text((10, 90), f"Date: {date}", font=SMALL_FONT, fill=TEXT_COLOR)
+    
+    summary = news.get('summary', '')
+    summary_lines = wrap_text(summary, SMALL_FONT, width - 20)
+    
+    for j, line in enumerate(summary_lines[:3]):  # Show only first 3 lines of summary
+        draw.text((10, 110 + j * 20), line, font=SMALL_FONT, fill=TEXT_COLOR)
+    
+    _news_cards[key] = card
+    return card
+
+def build_static_background(portfolio, market_data, news_data, sentiment_counts):
+    """Render everything that stays the same across frames into a reusable image"""
     img = Image.new('RGB', (WIDTH, HEIGHT), BG_COLOR)
+    draw_static_elements(img, portfolio, market_data, news_data, sentiment_counts)
+    return img
+
+def draw_static_elements(img, portfolio, market_data, news_data, sentiment_counts):
+    """Draw the title, panels, sentiment pie, market table, news cards and footer"""
     draw = ImageDraw.Draw(img)
     
-    try:
-        # Load fonts (use default if custom font fails)
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 36)
-            heading_font = ImageFont.truetype("arial.ttf", 24)
-            regular_font = ImageFont.truetype("arial.ttf", 18)
-            small_font = ImageFont.truetype("arial.ttf", 14)
-        except IOError:
-            title_font = ImageFont.load_default()
-            heading_font = ImageFont.load_default()
-            regular_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
+    # Draw title
+    draw.text((WIDTH//2, 40), "AI Margin Optimizer for F&O Large Traders", 
+              font=TITLE_FONT, fill=HIGHLIGHT_COLOR, anchor="mm")
+    draw.text((WIDTH//2, 80), "Reduce over-pledging of collateral by 20-30% using AI-powered optimization", 
+              font=REGULAR_FONT, fill=TEXT_COLOR, anchor="mm")
+    
+    # Draw header bar
+    draw.rectangle([(0, 100), (WIDTH, 102)], fill=HIGHLIGHT_COLOR)
+    
+    # Draw account summary (left panel)
+    draw.text((50, 130), "Account Summary", font=HEADING_FONT, fill=TEXT_COLOR)
+    draw.rectangle([(30, 160), (380, 340)], outline=HIGHLIGHT_COLOR, width=2)
+    
+    account_value = portfolio.get('total_value', 1500000)
+    current_margin = portfolio.get('used_margin', 350000)
+    
+    draw.text((50, 180), f"Account Value:", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((360, 180), f"₹{account_value:,.2f}", font=REGULAR_FONT, fill=TEXT_COLOR, anchor="ra")
+    
+    draw.text((50, 210), f"Current Margin:", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((360, 210), f"₹{current_margin:,.2f}", font=REGULAR_FONT, fill=TEXT_COLOR, anchor="ra")
+    
+    draw.text((50, 240), f"Optimized Margin:", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((50, 270), f"Potential Savings:", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((50, 300), f"Reduction:", font=REGULAR_FONT, fill=TEXT_COLOR)
+    
+    # Draw confidence bar outline
+    draw.rectangle([(40, 330), (360, 340)], outline=HIGHLIGHT_COLOR, width=1)
+    
+    # Draw sentiment analysis (right panel)
+    draw.text((WIDTH - 220, 130), "News Sentiment", font=HEADING_FONT, fill=TEXT_COLOR)
+    draw.rectangle([(WIDTH - 380, 160), (WIDTH - 30, 340)], outline=HIGHLIGHT_COLOR, width=2)
+    
+    positive = sentiment_counts['positive']
+    negative = sentiment_counts['negative']
+    neutral = sentiment_counts['neutral']
+    
+    total = positive + negative + neutral
+    if total > 0:
+        pos_percent = int(positive / total * 100)
+        neg_percent = int(negative / total * 100)
+        neu_percent = 100 - pos_percent - neg_percent
+    else:
+        pos_percent = neu_percent = neg_percent = 0
+    
+    # Draw pie chart
+    center_x, center_y = WIDTH - 205, 220
+    radius = 80
+    
+    # Paste the pre-rasterized sentiment pie
+    if total > 0:
+        pie = render_pie(pos_percent, neu_percent, neg_percent, radius)
+        img.paste(pie, (center_x - radius, center_y - radius), pie)
+    else:
+        # Empty pie
+        draw.ellipse([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
+                      outline=TEXT_COLOR)
+    
+    # Draw sentiment legend
+    draw.rectangle([(WIDTH - 340, 300), (WIDTH - 320, 310)], fill=POSITIVE_COLOR)
+    draw.text((WIDTH - 310, 305), f"Positive: {positive} ({pos_percent}%)", font=SMALL_FONT, fill=TEXT_COLOR, anchor="lm")
+    
+    draw.rectangle([(WIDTH - 340, 320), (WIDTH - 320, 330)], fill=NEUTRAL_COLOR)
+    draw.text((WIDTH - 310, 325), f"Neutral: {neutral} ({neu_percent}%)", font=SMALL_FONT, fill=TEXT_COLOR, anchor="lm")
+    
+    draw.rectangle([(WIDTH - 340, 340), (WIDTH - 320, 350)], fill=NEGATIVE_COLOR)
+    draw.text((WIDTH - 310, 345), f"Negative: {negative} ({neg_percent}%)", font=SMALL_FONT, fill=TEXT_COLOR, anchor="lm")
+    
+    # Draw market data (center)
+    draw.text((WIDTH//2, 130), "Market Overview", font=HEADING_FONT, fill=TEXT_COLOR, anchor="mt")
+    
+    # Draw table headers
+    y_pos = 170
+    draw.text((WIDTH//2 - 150, y_pos), "Index", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((WIDTH//2 - 50, y_pos), "Value", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((WIDTH//2 + 50, y_pos), "Change", font=REGULAR_FONT, fill=TEXT_COLOR)
+    draw.text((WIDTH//2 + 150, y_pos), "% Change", font=REGULAR_FONT, fill=TEXT_COLOR)
+    
+    y_pos += 30
+    draw.line([(WIDTH//2 - 200, y_pos - 10), (WIDTH//2 + 200, y_pos - 10)], fill=TEXT_COLOR, width=1)
+    
+    # Draw table rows
+    indices = market_data.get('indices', {})
+    for i, (index, details) in enumerate(indices.items()):
+        if i >= 3:  # Only show top 3 indices
+            break
+            
+        change_color = POSITIVE_COLOR if details.get('change_1d', 0) >= 0 else NEGATIVE_COLOR
+        change_symbol = "▲" if details.get('change_1d', 0) >= 0 else "▼"
         
-        # Draw title
-        draw.text((WIDTH//2, 40), "AI Margin Optimizer for F&O Large Traders", 
-                  font=title_font, fill=HIGHLIGHT_COLOR, anchor="mm")
-        draw.text((WIDTH//2, 80), "Reduce over-pledging of collateral by 20-30% using AI-powered optimization", 
-                  font=regular_font, fill=TEXT_COLOR, anchor="mm")
+        draw.text((WIDTH//2 - 150, y_pos), index, font=REGULAR_FONT, fill=TEXT_COLOR)
+        draw.text((WIDTH//2 - 50, y_pos), f"{details.get('current', 0):,.2f}", font=REGULAR_FONT, fill=TEXT_COLOR)
         
-        # Draw header bar
-        draw.rectangle([(0, 100), (WIDTH, 102)], fill=HIGHLIGHT_COLOR)
+        change_text = f"{change_symbol} {abs(details.get('change_1d', 0)):,.2f}"
+        draw.text((WIDTH//2 + 50, y_pos), change_text, font=REGULAR_FONT, fill=change_color)
         
-        # Draw account summary (left panel)
-        draw.text((50, 130), "Account Summary", font=heading_font, fill=TEXT_COLOR)
-        draw.rectangle([(30, 160), (380, 340)], outline=HIGHLIGHT_COLOR, width=2)
+        percent_text = f"{change_symbol} {abs(details.get('change_percent_1d', 0)):,.2f}%"
+        draw.text((WIDTH//2 + 150, y_pos), percent_text, font=REGULAR_FONT, fill=change_color)
+        
+        y_pos += 30
+    
+    # Draw news section at bottom
+    draw.text((WIDTH//2, 440), "Recent News Affecting Your Portfolio", font=HEADING_FONT, fill=TEXT_COLOR, anchor="mt")
+    
+    # Draw news items from pre-rendered cards
+    news_items = news_data if isinstance(news_data, list) else []
+    for i, news in enumerate(news_items[:3]):
+        # Calculate position for this news item
+        x_start = 30 + i * (WIDTH // 3)
+        x_end = x_start + (WIDTH // 3) - 30
+        
+        img.paste(render_news_card(news, x_end - x_start, 170), (x_start, 480))
+    
+    # Draw footer
+    draw.rectangle([(0, HEIGHT - 40), (WIDTH, HEIGHT)], fill=(230, 235, 240))
+    draw.text((WIDTH//2, HEIGHT - 20), "© 2025 AI Margin Optimizer | Powered by ML & AI | For demonstration purposes only", 
+             font=SMALL_FONT, fill=TEXT_COLOR, anchor="mm")
+
+def generate_demo_frame(frame_num, total_frames, portfolio, market_data, news_data, sentiment_data, optimization_result=None, static_bg=None):
+    # Start from the prebuilt static background when one is provided
+    img = static_bg.copy() if static_bg is not None else Image.new('RGB', (WIDTH, HEIGHT), BG_COLOR)
+    draw = ImageDraw.Draw(img)
+    
+    try:
+        if static_bg is None:
+            draw_static_elements(img, portfolio, market_data, news_data, count_sentiment(sentiment_data))
         
-        account_value = portfolio.get('total_value', 1500000)
         current_margin = portfolio.get('used_margin', 350000)
         
         # If optimization result exists, use those values
@@ -71,166 +267,24 @@ def generate_demo_frame(frame_num, total_frames, portfolio, market_data, news_da
             confidence = 0
             savings = 0
         
-        draw.text((50, 180), f"Account Value:", font=regular_font, fill=TEXT_COLOR)
-        draw.text((360, 180), f"₹{account_value:,.2f}", font=regular_font, fill=TEXT_COLOR, anchor="ra")
-        
-        draw.text((50, 210), f"Current Margin:", font=regular_font, fill=TEXT_COLOR)
-        draw.text((360, 210), f"₹{current_margin:,.2f}", font=regular_font, fill=TEXT_COLOR, anchor="ra")
-        
-        draw.text((50, 240), f"Optimized Margin:", font=regular_font, fill=TEXT_COLOR)
-        draw.text((360, 240), f"₹{optimized_margin:,.2f}", font=regular_font, fill=POSITIVE_COLOR, anchor="ra")
-        
-        draw.text((50, 270), f"Potential Savings:", font=regular_font, fill=TEXT_COLOR)
-        draw.text((360, 270), f"₹{savings:,.2f}", font=regular_font, fill=POSITIVE_COLOR, anchor="ra")
-        
-        draw.text((50, 300), f"Reduction:", font=regular_font, fill=TEXT_COLOR)
-        draw.text((360, 300), f"{reduction_percent}%", font=regular_font, fill=POSITIVE_COLOR, anchor="ra")
+        draw.text((360, 240), f"₹{optimized_margin:,.2f}", font=REGULAR_FONT, fill=POSITIVE_COLOR, anchor="ra")
+        draw.text((360, 270), f"₹{savings:,.2f}", font=REGULAR_FONT, fill=POSITIVE_COLOR, anchor="ra")
+        draw.text((360, 300), f"{reduction_percent}%", font=REGULAR_FONT, fill=POSITIVE_COLOR, anchor="ra")
         
         # Draw confidence bar
         confidence_width = int(320 * confidence)
-        draw.rectangle([(40, 330), (360, 340)], outline=HIGHLIGHT_COLOR, width=1)
         draw.rectangle([(40, 330), (40 + confidence_width, 340)], fill=HIGHLIGHT_COLOR)
-        draw.text((200, 360), f"AI Confidence: {int(confidence * 100)}%", font=small_font, fill=TEXT_COLOR, anchor="mm")
+        draw.text((200, 360), f"AI Confidence: {int(confidence * 100)}%", font=SMALL_FONT, fill=TEXT_COLOR, anchor="mm")
         
         # Draw optimization button
         button_color = HIGHLIGHT_COLOR if frame_num > total_frames // 3 else (180, 180, 180)
         draw.rounded_rectangle([(80, 380), (330, 420)], radius=5, fill=button_color)
-        draw.text((205, 400), "Optimize Margin", font=regular_font, fill=(255, 255, 255), anchor="mm")
-        
-        # Draw sentiment analysis (right panel)
-        draw.text((WIDTH - 220, 130), "News Sentiment", font=heading_font, fill=TEXT_COLOR)
-        draw.rectangle([(WIDTH - 380, 160), (WIDTH - 30, 340)], outline=HIGHLIGHT_COLOR, width=2)
-        
-        # Count sentiment
-        positive = 0
-        negative = 0
-        neutral = 0
-        for score in sentiment_data.values():
-            if score.get('label') == 'positive':
-                positive += 1
-            elif score.get('label') == 'negative':
-                negative += 1
-            else:
-                neutral += 1
-        
-        total = positive + negative + neutral
-        if total > 0:
-            pos_percent = int(positive / total * 100)
-            neg_percent = int(negative / total * 100)
-            neu_percent = 100 - pos_percent - neg_percent
-        else:
-            pos_percent = neu_percent = neg_percent = 0
-        
-        # Draw pie chart
-        center_x, center_y = WIDTH - 205, 220
-        radius = 80
-        
-        # Draw sentiment pie segments
-        if total > 0:
-            # Positive segment
-            if pos_percent > 0:
-                angle_pos = pos_percent * 3.6  # Convert to degrees (100% = 360 degrees)
-                draw.pieslice([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
-                              start=0, end=angle_pos, fill=POSITIVE_COLOR)
-            
-            # Neutral segment
-            if neu_percent > 0:
-                angle_neu = neu_percent * 3.6
-                draw.pieslice([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
-                              start=angle_pos, end=angle_pos + angle_neu, fill=NEUTRAL_COLOR)
-            
-            # Negative segment
-            if neg_percent > 0:
-                draw.pieslice([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
-                              start=angle_pos + angle_neu, end=360, fill=NEGATIVE_COLOR)
-        else:
-            # Empty pie
-            draw.ellipse([center_x - radius, center_y - radius, center_x + radius, center_y + radius], 
-                          outline=TEXT_COLOR)
-        
-        # Draw sentiment legend
-        draw.rectangle([(WIDTH - 340, 300), (WIDTH - 320, 310)], fill=POSITIVE_COLOR)
-        draw.text((WIDTH - 310, 305), f"Positive: {positive} ({pos_percent}%)", font=small_font, fill=TEXT_COLOR, anchor="lm")
-        
-        draw.rectangle([(WIDTH - 340, 320), (WIDTH - 320, 330)], fill=NEUTRAL_COLOR)
-        draw.text((WIDTH - 310, 325), f"Neutral: {neutral} ({neu_percent}%)", font=small_font, fill=TEXT_COLOR, anchor="lm")
-        
-        draw.rectangle([(WIDTH - 340, 340), (WIDTH - 320, 350)], fill=NEGATIVE_COLOR)
-        draw.text((WIDTH - 310, 345), f"Negative: {negative} ({neg_percent}%)", font=small_font, fill=TEXT_COLOR, anchor="lm")
-        
-        # Draw market data (center)
-        draw.text((WIDTH//2, 130), "Market Overview", font=heading_font, fill=TEXT_COLOR, anchor="mt")
-        
-        # Draw table headers
-        y_pos = 170
-        draw.text((WIDTH//2 - 150, y_pos), "Index", font=regular_font, fill=TEXT_COLOR)
-        draw.text((WIDTH//2 - 50, y_pos), "Value", font=regular_font, fill=TEXT_COLOR)
-        draw.text((WIDTH//2 + 50, y_pos), "Change", font=regular_font, fill=TEXT_COLOR)
-        draw.text((WIDTH//2 + 150, y_pos), "% Change", font=regular_font, fill=TEXT_COLOR)
-        
-        y_pos += 30
-        draw.line([(WIDTH//2 - 200, y_pos - 10), (WIDTH//2 + 200, y_pos - 10)], fill=TEXT_COLOR, width=1)
-        
-        # Draw table rows
-        indices = market_data.get('indices', {})
-        for i, (index, details) in enumerate(indices.items()):
-            if i >= 3:  # Only show top 3 indices
-                break
-                
-            change_color = POSITIVE_COLOR if details.get('change_1d', 0) >= 0 else NEGATIVE_COLOR
-            change_symbol = "▲" if details.get('change_1d', 0) >= 0 else "▼"
-            
-            draw.text((WIDTH//2 - 150, y_pos), index, font=regular_font, fill=TEXT_COLOR)
-            draw.text((WIDTH//2 - 50, y_pos), f"{details.get('current', 0):,.2f}", font=regular_font, fill=TEXT_COLOR)
-            
-            change_text = f"{change_symbol} {abs(details.get('change_1d', 0)):,.2f}"
-            draw.text((WIDTH//2 + 50, y_pos), change_text, font=regular_font, fill=change_color)
-            
-            percent_text = f"{change_symbol} {abs(details.get('change_percent_1d', 0)):,.2f}%"
-            draw.text((WIDTH//2 + 150, y_pos), percent_text, font=regular_font, fill=change_color)
-            
-            y_pos += 30
-        
-        # Draw news section at bottom
-        draw.text((WIDTH//2, 440), "Recent News Affecting Your Portfolio", font=heading_font, fill=TEXT_COLOR, anchor="mt")
-        
-        # Draw news items
-        news_items = news_data if isinstance(news_data, list) else []
-        for i, news in enumerate(news_items[:3]):
-            # Calculate position for this news item
-            x_start = 30 + i * (WIDTH // 3)
-            x_end = x_start + (WIDTH // 3) - 30
-            
-            # Draw news card
-            draw.rounded_rectangle([(x_start, 480), (x_end, 650)], radius=5, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR)
-            
-            # Draw news content
-            title = news.get('title', 'News Title')
-            title_lines = wrap_text(title, regular_font, x_end - x_start - 20)
-            
-            for j, line in enumerate(title_lines):
-                draw.text((x_start + 10, 490 + j * 25), line, font=regular_font, fill=TEXT_COLOR)
-            
-            source = news.get('source', 'Source')
-            date = news.get('published_at', 'Date')[:10]
-            draw.text((x_start + 10, 550), f"Source: {source}", font=small_font, fill=TEXT_COLOR)
-            draw.text((x_start + 10, 570), f"Date: {date}", font=small_font, fill=TEXT_COLOR)
-            
-            summary = news.get('summary', '')
-            summary_lines = wrap_text(summary, small_font, x_end - x_start - 20)
-            
-            for j, line in enumerate(summary_lines[:3]):  # Show only first 3 lines of summary
-                draw.text((x_start + 10, 590 + j * 20), line, font=small_font, fill=TEXT_COLOR)
-        
-        # Draw footer
-        draw.rectangle([(0, HEIGHT - 40), (WIDTH, HEIGHT)], fill=(230, 235, 240))
-        draw.text((WIDTH//2, HEIGHT - 20), "© 2025 AI Margin Optimizer | Powered by ML & AI | For demonstration purposes only", 
-                 font=small_font, fill=TEXT_COLOR, anchor="mm")
+        draw.text((205, 400), "Optimize Margin", font=REGULAR_FONT, fill=(255, 255, 255), anchor="mm")
         
         # Animation effect - Highlight optimization results
         if frame_num > total_frames // 2 and optimization_result:
             # Pulsating highlight
-            pulse = abs(np.sin(frame_num / 5))
+            pulse = PULSE[frame_num] if frame_num < NUM_FRAMES else abs(np.sin(frame_num / 5))
             highlight_alpha = int(150 + 105 * pulse)  # 150-255 range
             highlight_width = int(2 + 3 * pulse)  # 2-5 range
             
@@ -246,46 +300,111 @@ def generate_demo_frame(frame_num, total_frames, portfolio, market_data, news_da
     except Exception as e:
         # If there's an error, at least show it on the image
         draw.text((WIDTH//2, HEIGHT//2), f"Error generating frame: {str(e)}", 
-                 font=regular_font, fill=NEGATIVE_COLOR, anchor="mm")
+                 font=REGULAR_FONT, fill=NEGATIVE_COLOR, anchor="mm")
         
     return img
 
+@functools.lru_cache(maxsize=4096)
 def wrap_text(text, font, max_width):
     """Wrap text to fit within specified width"""
     words = text.split()
+    
+    # Measure each word once instead of re-measuring the whole line per word
+    word_widths = [font.getlength(word) for word in words]
+    space_width = font.getlength(' ')
+    
     lines = []
     current_line = []
+    current_width = 0
     
-    for word in words:
-        # Add word to current line
-        current_line.append(word)
-        
-        # Check if current line is too wide
-        line_text = ' '.join(current_line)
-        try:
-            line_width = font.getsize(line_text)[0]
-        except:
-            # If getsize is not available, estimate width
-            line_width = len(line_text) * 7  # rough estimate
-        
-        if line_width > max_width:
-            # Line is too wide, remove last word and start new line
-            if len(current_line) > 1:
-                current_line.pop()
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                # Single word is too long, just add it anyway
-                lines.append(line_text)
-                current_line = []
+    for word, word_width in zip(words, word_widths):
+        added_width = word_width if not current_line else space_width + word_width
+        
+        if current_line and current_width + added_width > max_width:
+            # Line is too wide, start a new line with this word
+            lines.append(' '.join(current_line))
+            current_line = [word]
+            current_width = word_width
+        else:
+            # Add word to current line (a single over-long word gets a line of its own)
+            current_line.append(word)
+            current_width += added_width
     
     # Add the last line if there's anything left
     if current_line:
         lines.append(' '.join(current_line))
     
-    return lines
+    return tuple(lines)
+
+def _init_worker(shared_data):
+    """Pool initializer: receive the demo data once per worker instead of once per frame"""
+    global _shared_data
+    _shared_data = shared_data
+
+def render_shared_frame(frame_num):
+    """Render a single frame from the worker's shared data"""
+    total_frames, portfolio, market_data, news_data, sentiment_data, optimization_result, static_bg, output_dir = _shared_data
+    
+    # Optimization result only appears after the first third of the animation
+    if frame_num < total_frames // 3:
+        optimization_result = None
+    
+    return generate_demo_frame(frame_num, total_frames, portfolio, market_data, news_data, sentiment_data, optimization_result, static_bg)
+
+def render_frame_bytes(frame_num):
+    """Render a single frame as raw RGB bytes for the ffmpeg pipe"""
+    return render_shared_frame(frame_num).tobytes()
 
-def create_demo_video():
+def render_and_save(frame_num):
+    """Render a single frame and save it as PNG"""
+    output_dir = _shared_data[-1]
+    render_shared_frame(frame_num).save(f"{output_dir}/frame_{frame_num:04d}.png")
+    return frame_num
+
+def encode_video(ffmpeg, frames):
+    """
+    Pipe raw frames straight into ffmpeg to encode VIDEO_PATH
+    
+    Args:
+        ffmpeg (str): Path to the ffmpeg executable
+        frames (iterable): Raw RGB bytes of each frame, in order
+        
+    Returns:
+        bool: Whether ffmpeg wrote the video
+    """
+    proc = subprocess.Popen([
+        ffmpeg, '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{WIDTH}x{HEIGHT}', '-r', str(FPS), '-i', '-',
+        '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', '23', VIDEO_PATH
+    ], stdin=subprocess.PIPE)
+    
+    try:
+        for done, frame_bytes in enumerate(frames, 1):
+            proc.stdin.write(frame_bytes)
+            print(f"Encoded frame {done}/{NUM_FRAMES}")
+    except BrokenPipeError:
+        # ffmpeg exited early; its exit status below says so
+        pass
+    finally:
+        # Always let ffmpeg see end of input and reap it, even if a frame failed to render
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
+    
+    if proc.returncode != 0:
+        print(f"Error creating video: ffmpeg exited with status {proc.returncode}")
+        return False
+    return True
+
+def create_demo_video(write_frames=False):
+    """
+    Render the demo and encode it, or save its frames as PNGs
+    
+    Args:
+        write_frames (bool): Save PNG frames to OUTPUT_DIR (for create_video.py) even if ffmpeg is installed
+    """
     print("Creating demo video frames...")
     
     # Initialize services
@@ -341,36 +460,44 @@ def create_demo_video():
             "ICICIBANK.NS": {"score": 0.55, "label": "positive"}
         }
     
-    # Create optimization result at certain point in animation
-    optimization_result = None
+    # Generate optimization result once; frames before NUM_FRAMES // 3 don't show it
+    optimization_result = prediction.predict_optimal_margin(portfolio, market_data, sentiment_data)
+    print("Optimization result:")
+    print(f"Current margin: {optimization_result.get('current_margin')}")
+    print(f"Optimized margin: {optimization_result.get('optimized_margin')}")
+    print(f"Reduction: {optimization_result.get('reduction_percent')}%")
     
-    # Create output directory
-    create_directory(OUTPUT_DIR)
+    # Draw the parts that never change once; each frame only adds the animated values
+    sentiment_counts = count_sentiment(sentiment_data)
+    static_bg = build_static_background(portfolio, market_data, news_data, sentiment_counts)
     
-    # Generate frames
-    for i in range(NUM_FRAMES):
-        print(f"Generating frame {i+1}/{NUM_FRAMES}")
-        
-        # After certain point, show optimization result
-        if i >= NUM_FRAMES // 3:
-            if not optimization_result:
-                # Generate optimization result once
-                optimization_result = prediction.predict_optimal_margin(portfolio, market_data, sentiment_data)
-                print("Optimization result:")
-                print(f"Current margin: {optimization_result.get('current_margin')}")
-                print(f"Optimized margin: {optimization_result.get('optimized_margin')}")
-                print(f"Reduction: {optimization_result.get('reduction_percent')}%")
-        
-        # Generate the frame
-        frame = generate_demo_frame(i, NUM_FRAMES, portfolio, market_data, news_data, sentiment_data, optimization_result)
-        
-        # Save the frame
-        frame.save(f"{OUTPUT_DIR}/frame_{i:04d}.png")
+    # Frames are independent, so render them across all cores
+    shared_data = (NUM_FRAMES, portfolio, market_data, news_data, sentiment_data, optimization_result, static_bg, OUTPUT_DIR)
+    ffmpeg = shutil.which('ffmpeg')
+    encode = ffmpeg and not write_frames
+    
+    with multiprocessing.Pool(os.cpu_count(), initializer=_init_worker, initargs=(shared_data,)) as pool:
+        if encode:
+            # Pipe raw frames straight into the encoder instead of writing PNGs; imap keeps them in order
+            video_saved = encode_video(ffmpeg, pool.imap(render_frame_bytes, range(NUM_FRAMES)))
+        else:
+            create_directory(OUTPUT_DIR)
+            for done, _ in enumerate(pool.imap_unordered(render_and_save, range(NUM_FRAMES)), 1):
+                print(f"Generated frame {done}/{NUM_FRAMES}")
     
-    print(f"Demo frames generated in '{OUTPUT_DIR}' directory")
     print(f"Total frames: {NUM_FRAMES}")
-    print("To create a video, you can use:")
-    print(f"ffmpeg -r 10 -i {OUTPUT_DIR}/frame_%04d.png -c:v libx264 -pix_fmt yuv420p -crf 23 demo_video.mp4")
+    if encode:
+        if not video_saved:
+            print("No video was written. Run with --frames to save PNG frames instead.")
+            sys.exit(1)
+        print(f"Demo video saved to '{VIDEO_PATH}'")
+    else:
+        if not ffmpeg:
+            print("ffmpeg not found")
+        print(f"Demo frames generated in '{OUTPUT_DIR}' directory")
+        print("To create a video, run create_video.py or use:")
+        print(f"ffmpeg -r {FPS} -i {OUTPUT_DIR}/frame_%04d.png -c:v libx264 -pix_fmt yuv420p -crf 23 {VIDEO_PATH}")
 
 if __name__ == "__main__":
-    create_demo_video()
\ No newline at end of file
+    # --frames: save PNG frames for create_video.py instead of encoding directly
+    create_demo_video(write_frames='--frames' in sys.argv[1:])
@@ -1,6 +1,10 @@
 import time
+import functools
 import os
 import sys
+import multiprocessing
+import shutil
+import subprocess
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 import math
@@ -8,7 +12,11 @@ import random
 
 # Configure demo parameters
 NUM_FRAMES = 600  # 60 seconds at 10fps
-OUTPUT_DIR = "detailed_sharma_demo_frames"
+SCENE_FRAMES = 60  # 6 seconds per scene
+OUTPUT_DIR = "detailed_sharma_demo_frames"  # Only used when ffmpeg isn't installed
+VIDEO_PATH = "detailed_sharma_demo_video.mp4"
+FPS = 10
+FRAME_CHUNK = 8  # Consecutive frames handed to a worker at a time, so it mostly stays within one scene
 WIDTH, HEIGHT = 1280, 720
 BG_COLOR = (240, 245, 250)
 TEXT_COLOR = (30, 50, 70)
@@ -17,6 +25,17 @@ POSITIVE_COLOR = (25, 135, 84)
 NEGATIVE_COLOR = (220, 53, 69)
 NEUTRAL_COLOR = (108, 117, 125)
 
+def _load_fonts(sizes):
+    """Load Arial at each size, falling back to the default font for all of them"""
+    try:
+        return {size: ImageFont.truetype("arial.ttf", size) for size in sizes}
+    except IOError:
+        default_font = ImageFont.load_default()
+        return {size: default_font for size in sizes}
+
+# Fonts are loaded once at import rather than in every helper on every frame
+FONTS = _load_fonts((12, 14, 16, 18, 20, 22, 24, 28, 36))
+
 def create_directory(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
@@ -29,38 +48,121 @@ def draw_text_with_shadow(draw, text, position, font, color, shadow_color=(200,
     # Draw text
     draw.text(position, text, font=font, fill=color)
 
-def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", progress=0):
-    """Draw a simple businessman character
+# Drawing context used only to measure text
+TEXT_MEASURE = ImageDraw.Draw(Image.new('L', (1, 1)))
+
+@functools.lru_cache(maxsize=4096)
+def _text_mask(text, font, anchor, start, spacing):
+    """
+    Rasterize text once into a coverage mask
     
     Args:
-        draw: ImageDraw object
-        x, y: Center position of the character
-        size: Size scale
-        expression: "happy", "thinking", "excited", "neutral"
-        action: "idle", "pointing", "thumbsup", "phone", "tablet"
-        progress: Animation progress (0-1)
+        text (str): Text to rasterize
+        font (ImageFont): Font to draw with
+        anchor (str): Pillow text anchor, or None
+        start (tuple): Sub-pixel part of the anchor point, as ImageDraw.text uses it
+        spacing (int): Pixels between lines of multiline text
+        
+    Returns:
+        tuple: (mask, origin), origin being where the anchor point's whole pixel falls in the mask
     """
-    # Businessman colors
-    suit_color = (40, 60, 80)
-    skin_color = (240, 200, 170)
-    hair_color = (50, 40, 30)
+    # textbbox, unlike font.getbbox, also measures multiline text
+    left, top, right, bottom = TEXT_MEASURE.textbbox((0, 0), text, font=font, anchor=anchor, spacing=spacing)
+    # One pixel of slack on each side for glyphs shifted by the sub-pixel start
+    origin_x, origin_y = max(1 - left, 0), max(1 - top, 0)
+    mask = Image.new('L', (origin_x + right + 1, origin_y + bottom + 1), 0)
+    ImageDraw.Draw(mask).text(
+        (origin_x + start[0], origin_y + start[1]), text,
+        font=font, fill=255, anchor=anchor, spacing=spacing
+    )
+    return mask, (origin_x, origin_y)
+
+def paste_text(img, position, text, font, fill, anchor=None, spacing=4):
+    """
+    Draw text like ImageDraw.text, reusing the rasterized glyphs of earlier frames
     
-    # Animation effects
-    bob_y = int(math.sin(progress * 2 * math.pi) * size * 0.03)
+    Args:
+        img (Image): Frame to draw on
+        position (tuple): Anchor point of the text
+        text (str): Text to draw
+        font (ImageFont): Font to draw with
+        fill (tuple): Text color
+        anchor (str): Pillow text anchor, e.g. "mm"; top-left when None
+        spacing (int): Pixels between lines of multiline text
+    """
+    x_start, x = math.modf(position[0])
+    y_start, y = math.modf(position[1])
+    mask, (origin_x, origin_y) = _text_mask(text, font, anchor, (x_start, y_start), spacing)
+    img.paste(fill, (int(x) - origin_x, int(y) - origin_y), mask)
+
+def draw_text_lines(img, position, lines, font, fill, line_height):
+    """
+    Draw stacked lines of text as a single multiline label
+    
+    Args:
+        img (Image): Image to draw on
+        position (tuple): Top-left of the first line
+        lines (list): Lines of text, top to bottom
+        font (ImageFont): Font for every line
+        fill (tuple): Text color
+        line_height (int): Distance in pixels from one line's top to the next
+    """
+    # Multiline text advances by the height of "A" plus spacing
+    spacing = line_height - font.getbbox("A")[3]
+    paste_text(img, position, "\n".join(lines), font, fill, spacing=spacing)
+
+# Businessman animation curves over one scene, indexed by frame within the scene:
+# a full sine cycle for the bob, and the pointing arm's swing angle
+BOB_SIN = np.sin(np.arange(SCENE_FRAMES) / SCENE_FRAMES * 2 * np.pi)
+ARM_ANGLE = np.radians(30 + 20 * BOB_SIN)
+ARM_COS = np.cos(ARM_ANGLE)
+ARM_SIN = np.sin(ARM_ANGLE)
+
+# Businessman colors
+SUIT_COLOR = (40, 60, 80)
+SKIN_COLOR = (240, 200, 170)
+HAIR_COLOR = (50, 40, 30)
+
+# Broker logos grid on the login screen
+LOGO_SIZE = 80
+LOGO_GAP = 20
+LOGO_COLS = 3
+LOGIN_GRID_WIDTH = (LOGO_SIZE * LOGO_COLS) + (LOGO_GAP * (LOGO_COLS - 1))
+
+@functools.lru_cache(maxsize=32)
+def _render_businessman_layer(size, expression, action):
+    """Rasterize the businessman once per pose as a cropped RGBA sprite
+    
+    The bob moves every part of the figure by the same amount, so it is applied
+    as the paste offset rather than baked into the sprite. The pointing arm
+    swings with the animation, so draw_businessman draws it on top.
+    
+    Returns:
+        tuple: (sprite, (dx, dy)) where dx, dy is the sprite's offset from the character's center
+    """
+    suit_color = SUIT_COLOR
+    skin_color = SKIN_COLOR
+    hair_color = HAIR_COLOR
+    
+    # Draw around the center of a transparent layer big enough for any pose
+    half = size + 100
+    layer = Image.new('RGBA', (2 * half, 2 * half), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    x = y = half
     
     # Draw head
     head_radius = int(size * 0.25)
     draw.ellipse(
-        [(x - head_radius, y - head_radius*2 - head_radius + bob_y), 
-         (x + head_radius, y - head_radius*2 + head_radius + bob_y)], 
+        [(x - head_radius, y - head_radius*2 - head_radius), 
+         (x + head_radius, y - head_radius*2 + head_radius)], 
         fill=skin_color, outline=(0, 0, 0)
     )
     
     # Draw hair
     hair_height = int(head_radius * 0.6)
     draw.ellipse(
-        [(x - head_radius, y - head_radius*2 - head_radius + bob_y), 
-         (x + head_radius, y - head_radius*2 - head_radius + hair_height + bob_y)], 
+        [(x - head_radius, y - head_radius*2 - head_radius), 
+         (x + head_radius, y - head_radius*2 - head_radius + hair_height)], 
         fill=hair_color
     )
     
@@ -68,43 +170,43 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     if expression == "happy":
         # Smile
         draw.arc(
-            [(x - head_radius*0.6, y - head_radius*2 - head_radius*0.3 + bob_y), 
-             (x + head_radius*0.6, y - head_radius*2 + head_radius*0.3 + bob_y)], 
+            [(x - head_radius*0.6, y - head_radius*2 - head_radius*0.3), 
+             (x + head_radius*0.6, y - head_radius*2 + head_radius*0.3)], 
             start=0, end=180, fill=(0, 0, 0), width=2
         )
     elif expression == "thinking":
         # Thoughtful expression
         draw.arc(
-            [(x - head_radius*0.6, y - head_radius*2 + bob_y), 
-             (x + head_radius*0.6, y - head_radius*2 + head_radius*0.5 + bob_y)], 
+            [(x - head_radius*0.6, y - head_radius*2), 
+             (x + head_radius*0.6, y - head_radius*2 + head_radius*0.5)], 
             start=200, end=340, fill=(0, 0, 0), width=2
         )
         # Thought bubble
         bubble_x = x + head_radius + 20
-        bubble_y = y - head_radius*2 - 20 + bob_y
+        bubble_y = y - head_radius*2 - 20
         draw.ellipse([(bubble_x, bubble_y), (bubble_x + 15, bubble_y + 15)], fill=(255, 255, 255), outline=(0, 0, 0))
         draw.ellipse([(bubble_x + 10, bubble_y - 20), (bubble_x + 30, bubble_y)], fill=(255, 255, 255), outline=(0, 0, 0))
         draw.ellipse([(bubble_x + 25, bubble_y - 50), (bubble_x + 65, bubble_y - 10)], fill=(255, 255, 255), outline=(0, 0, 0))
     elif expression == "excited":
         # Wide smile and raised eyebrows
         draw.arc(
-            [(x - head_radius*0.7, y - head_radius*2 - head_radius*0.2 + bob_y), 
-             (x + head_radius*0.7, y - head_radius*2 + head_radius*0.4 + bob_y)], 
+            [(x - head_radius*0.7, y - head_radius*2 - head_radius*0.2), 
+             (x + head_radius*0.7, y - head_radius*2 + head_radius*0.4)], 
             start=0, end=180, fill=(0, 0, 0), width=3
         )
         # Exclamation marks
-        draw.text((x + head_radius + 10, y - head_radius*2 + bob_y), "!", font=ImageFont.load_default(), fill=(0, 0, 0))
-        draw.text((x + head_radius + 25, y - head_radius*2 + bob_y), "!", font=ImageFont.load_default(), fill=(0, 0, 0))
+        draw.text((x + head_radius + 10, y - head_radius*2), "!", font=ImageFont.load_default(), fill=(0, 0, 0))
+        draw.text((x + head_radius + 25, y - head_radius*2), "!", font=ImageFont.load_default(), fill=(0, 0, 0))
     else:  # neutral
         # Neutral line
         draw.line(
-            [(x - head_radius*0.5, y - head_radius*2 + bob_y), 
-             (x + head_radius*0.5, y - head_radius*2 + bob_y)], 
+            [(x - head_radius*0.5, y - head_radius*2), 
+             (x + head_radius*0.5, y - head_radius*2)], 
             fill=(0, 0, 0), width=2
         )
     
     # Draw eyes
-    eye_y = y - head_radius*2 - head_radius*0.2 + bob_y
+    eye_y = y - head_radius*2 - head_radius*0.2
     draw.ellipse([(x - head_radius*0.5, eye_y - 5), (x - head_radius*0.2, eye_y + 5)], fill=(255, 255, 255), outline=(0, 0, 0))
     draw.ellipse([(x + head_radius*0.2, eye_y - 5), (x + head_radius*0.5, eye_y + 5)], fill=(255, 255, 255), outline=(0, 0, 0))
     
@@ -124,8 +226,8 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     
     # Suit
     draw.rectangle(
-        [(x - body_width, y - body_height + bob_y), 
-         (x + body_width, y + bob_y)], 
+        [(x - body_width, y - body_height), 
+         (x + body_width, y)], 
         fill=suit_color, outline=(0, 0, 0)
     )
     
@@ -133,20 +235,20 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     collar_width = int(body_width * 0.5)
     collar_height = int(body_height * 0.3)
     draw.polygon(
-        [(x, y - body_height + bob_y), 
-         (x - collar_width, y - body_height + collar_height + bob_y),
-         (x, y - body_height + collar_height*1.2 + bob_y),
-         (x + collar_width, y - body_height + collar_height + bob_y)], 
+        [(x, y - body_height), 
+         (x - collar_width, y - body_height + collar_height),
+         (x, y - body_height + collar_height*1.2),
+         (x + collar_width, y - body_height + collar_height)], 
         fill=(255, 255, 255), outline=(220, 220, 220)
     )
     
     # Tie
     tie_width = int(body_width * 0.15)
     draw.polygon(
-        [(x, y - body_height + collar_height*0.8 + bob_y),
-         (x - tie_width, y - body_height + collar_height*1.5 + bob_y),
-         (x, y - body_height/2 + bob_y),
-         (x + tie_width, y - body_height + collar_height*1.5 + bob_y)],
+        [(x, y - body_height + collar_height*0.8),
+         (x - tie_width, y - body_height + collar_height*1.5),
+         (x, y - body_height/2),
+         (x + tie_width, y - body_height + collar_height*1.5)],
         fill=(180, 40, 40), outline=(160, 30, 30)
     )
     
@@ -156,51 +258,38 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     if action == "idle":
         # Both arms down
         draw.rectangle(
-            [(x - body_width - arm_width, y - body_height*0.8 + bob_y), 
-             (x - body_width, y - body_height*0.2 + bob_y)], 
+            [(x - body_width - arm_width, y - body_height*0.8), 
+             (x - body_width, y - body_height*0.2)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         draw.rectangle(
-            [(x + body_width, y - body_height*0.8 + bob_y), 
-             (x + body_width + arm_width, y - body_height*0.2 + bob_y)], 
+            [(x + body_width, y - body_height*0.8), 
+             (x + body_width + arm_width, y - body_height*0.2)], 
             fill=suit_color, outline=(0, 0, 0)
         )
     elif action == "pointing":
         # Left arm down, right arm pointing
         draw.rectangle(
-            [(x - body_width - arm_width, y - body_height*0.8 + bob_y), 
-             (x - body_width, y - body_height*0.2 + bob_y)], 
+            [(x - body_width - arm_width, y - body_height*0.8), 
+             (x - body_width, y - body_height*0.2)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         
-        # Right arm pointing
-        arm_angle = 30 + (20 * math.sin(progress * 2 * math.pi))  # Animate pointing
-        arm_length = size * 0.6
-        end_x = x + body_width + int(arm_length * math.cos(math.radians(arm_angle)))
-        end_y = y - body_height*0.7 + int(arm_length * math.sin(math.radians(arm_angle))) + bob_y
-        
-        # Draw arm
-        draw.line(
-            [(x + body_width, y - body_height*0.7 + bob_y), (end_x, end_y)], 
-            fill=suit_color, width=arm_width
-        )
-        
-        # Draw hand
-        draw.ellipse([(end_x - 10, end_y - 10), (end_x + 10, end_y + 10)], fill=skin_color, outline=(0, 0, 0))
+        # Right arm is drawn per frame by draw_businessman
     
     elif action == "thumbsup":
         # Left arm down, right arm thumb up
         draw.rectangle(
-            [(x - body_width - arm_width, y - body_height*0.8 + bob_y), 
-             (x - body_width, y - body_height*0.2 + bob_y)], 
+            [(x - body_width - arm_width, y - body_height*0.8), 
+             (x - body_width, y - body_height*0.2)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         
         # Right arm up with thumb
-        arm_y = y - body_height*0.5 + bob_y
+        arm_y = y - body_height*0.5
         draw.rectangle(
-            [(x + body_width, arm_y), 
-             (x + body_width + arm_width*2, arm_y - body_height*0.4)], 
+            [(x + body_width, arm_y - body_height*0.4), 
+             (x + body_width + arm_width*2, arm_y)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         
@@ -216,15 +305,15 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     elif action == "phone":
         # Left arm down, right arm holding phone
         draw.rectangle(
-            [(x - body_width - arm_width, y - body_height*0.8 + bob_y), 
-             (x - body_width, y - body_height*0.2 + bob_y)], 
+            [(x - body_width - arm_width, y - body_height*0.8), 
+             (x - body_width, y - body_height*0.2)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         
         # Right arm bent to hold phone
-        phone_y = y - body_height*0.3 + bob_y
+        phone_y = y - body_height*0.3
         draw.rectangle(
-            [(x + body_width, y - body_height*0.8 + bob_y), 
+            [(x + body_width, y - body_height*0.8), 
              (x + body_width + arm_width, phone_y)], 
             fill=suit_color, outline=(0, 0, 0)
         )
@@ -255,20 +344,20 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     
     elif action == "tablet":
         # Arms holding tablet
-        tablet_y = y - body_height*0.3 + bob_y
+        tablet_y = y - body_height*0.3
         tablet_width = int(size * 0.7)
         tablet_height = int(size * 0.5)
         
         # Left arm
         draw.rectangle(
-            [(x - body_width - arm_width, y - body_height*0.8 + bob_y), 
+            [(x - body_width - arm_width, y - body_height*0.8), 
              (x - body_width, tablet_y)], 
             fill=suit_color, outline=(0, 0, 0)
         )
         
         # Right arm
         draw.rectangle(
-            [(x + body_width, y - body_height*0.8 + bob_y), 
+            [(x + body_width, y - body_height*0.8), 
              (x + body_width + arm_width, tablet_y)], 
             fill=suit_color, outline=(0, 0, 0)
         )
@@ -304,13 +393,13 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     leg_width = int(size * 0.18)
     leg_height = int(size * 0.6)
     draw.rectangle(
-        [(x - body_width + leg_width, y + bob_y), 
-         (x - leg_width, y + leg_height + bob_y)], 
+        [(x - body_width + leg_width, y), 
+         (x - leg_width, y + leg_height)], 
         fill=suit_color, outline=(0, 0, 0)
     )
     draw.rectangle(
-        [(x + leg_width, y + bob_y), 
-         (x + body_width - leg_width, y + leg_height + bob_y)], 
+        [(x + leg_width, y), 
+         (x + body_width - leg_width, y + leg_height)], 
         fill=suit_color, outline=(0, 0, 0)
     )
     
@@ -318,116 +407,199 @@ def draw_businessman(draw, x, y, size=100, expression="happy", action="idle", pr
     foot_width = int(size * 0.25)
     foot_height = int(size * 0.1)
     draw.ellipse(
-        [(x - body_width + leg_width - foot_width/2, y + leg_height + bob_y - foot_height/2), 
-         (x - leg_width + foot_width/2, y + leg_height + bob_y + foot_height/2)], 
+        [(x - body_width + leg_width - foot_width/2, y + leg_height - foot_height/2), 
+         (x - leg_width + foot_width/2, y + leg_height + foot_height/2)], 
         fill=(0, 0, 0)
     )
     draw.ellipse(
-        [(x + leg_width - foot_width/2, y + leg_height + bob_y - foot_height/2), 
-         (x + body_width - leg_width + foot_width/2, y + leg_height + bob_y + foot_height/2)], 
+        [(x + leg_width - foot_width/2, y + leg_height - foot_height/2), 
+         (x + body_width - leg_width + foot_width/2, y + leg_height + foot_height/2)], 
         fill=(0, 0, 0)
     )
+    
+    left, top, right, bottom = layer.getbbox()
+    return layer.crop((left, top, right, bottom)), (left - half, top - half)
 
-def draw_app_login(draw, x, y, width, height, progress):
-    """Draw a login screen for the app with animation"""
+@functools.lru_cache(maxsize=8)
+def _pose_offsets(size):
+    """Pixel offsets from the character's center of the animated parts, for every frame of a scene at one size
+    
+    Returns:
+        tuple: Lists indexed by frame within the scene of the bob, the pointing
+            shoulder's y offset and the pointing hand's x and y offsets, plus the
+            shoulder's x offset and the arm width
+    """
+    body_width = int(size * 0.5)
+    body_height = int(size * 0.8)
+    arm_width = int(size * 0.15)
+    arm_length = size * 0.6
+    
+    bob = np.trunc(BOB_SIN * size * 0.03).astype(int)
+    shoulder_dy = -body_height*0.7 + bob
+    hand_dx = body_width + np.trunc(arm_length * ARM_COS).astype(int)
+    hand_dy = shoulder_dy + np.trunc(arm_length * ARM_SIN).astype(int)
+    return bob.tolist(), shoulder_dy.tolist(), hand_dx.tolist(), hand_dy.tolist(), body_width, arm_width
+
+def draw_businessman(img, x, y, size=100, expression="happy", action="idle", frame=0):
+    """Draw a simple businessman character
+    
+    Args:
+        img: Frame image to draw on
+        x, y: Center position of the character
+        size: Size scale
+        expression: "happy", "thinking", "excited", "neutral"
+        action: "idle", "pointing", "thumbsup", "phone", "tablet"
+        frame: Frame index within the scene, which drives the animation
+    """
+    # Animation effects
+    bob, shoulder_dy, hand_dx, hand_dy, body_width, arm_width = _pose_offsets(size)
+    
+    # Static pose from the sprite cache, shifted by the bob
+    sprite, (dx, dy) = _render_businessman_layer(size, expression, action)
+    img.paste(sprite, (x + dx, y + dy + bob[frame]), sprite)
+    
+    if action == "pointing":
+        draw = ImageDraw.Draw(img)
+        
+        # Right arm pointing, swinging between 10 and 50 degrees
+        end_x = x + hand_dx[frame]
+        end_y = y + hand_dy[frame]
+        
+        # Draw arm
+        draw.line(
+            [(x + body_width, y + shoulder_dy[frame]), (end_x, end_y)], 
+            fill=SUIT_COLOR, width=arm_width
+        )
+        
+        # Draw hand
+        draw.ellipse([(end_x - 10, end_y - 10), (end_x + 10, end_y + 10)], fill=SKIN_COLOR, outline=(0, 0, 0))
+
+def _make_broker_tile(name, color, highlighted):
+    """Rasterize one broker logo with its name underneath as an RGBA tile
+    
+    The tile is LOGO_GAP wider than the logo so the name has room on either side.
+    """
+    tile = Image.new('RGBA', (LOGO_SIZE + LOGO_GAP, LOGO_SIZE + 30), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(tile)
+    logo_x = LOGO_GAP // 2
+    
+    # Draw broker logo (simplified as colored rectangles with letters)
+    border = 3 if highlighted else 1
+    border_color = HIGHLIGHT_COLOR if highlighted else (200, 200, 200)
+    
+    draw.rounded_rectangle(
+        [(logo_x, 0), (logo_x + LOGO_SIZE, LOGO_SIZE)],
+        radius=10, fill=color, outline=border_color, width=border
+    )
+    
+    # First letter of broker as logo
+    draw.text(
+        (logo_x + LOGO_SIZE//2, LOGO_SIZE//2),
+        name[0],
+        font=FONTS[24], fill=(255, 255, 255), anchor="mm"
+    )
+    
+    # Broker name
+    draw.text(
+        (logo_x + LOGO_SIZE//2, LOGO_SIZE + 15),
+        name,
+        font=FONTS[14], fill=TEXT_COLOR, anchor="mm"
+    )
+    return tile
+
+def _build_login_grid(tiles):
+    """Lay six broker tiles out in the login screen's grid
+    
+    Returns:
+        tuple: (sprite, (dx, dy)) where dx, dy is the sprite's offset from the grid's top-left corner
+    """
+    pad = LOGO_GAP // 2
+    grid = Image.new('RGBA', (LOGIN_GRID_WIDTH + 2 * pad, 2 * (LOGO_SIZE + LOGO_GAP) + 2 * pad), (0, 0, 0, 0))
+    
+    for i, tile in enumerate(tiles):
+        row = i // LOGO_COLS
+        col = i % LOGO_COLS
+        grid.alpha_composite(tile, (col * (LOGO_SIZE + LOGO_GAP), pad + row * (LOGO_SIZE + LOGO_GAP)))
+    
+    return grid, (-pad, -pad)
+
+BROKER_NAMES = ("Zerodha", "ICICI Direct", "Angel One", "HDFC Sec", "Upstox", "Motilal")
+BROKER_COLORS = (
+    (47, 115, 187),  # Zerodha blue
+    (227, 82, 5),    # ICICI orange
+    (13, 110, 253),  # Angel blue
+    (57, 123, 33),   # HDFC green
+    (244, 67, 54),   # Upstox red
+    (255, 193, 7),   # Motilal yellow
+)
+
+# Broker logo tiles, rendered once; Zerodha also gets a highlighted variant for when it's selected
+BROKER_TILES = [_make_broker_tile(name, color, highlighted=False) for name, color in zip(BROKER_NAMES, BROKER_COLORS)]
+BROKER_TILES_HL = [_make_broker_tile(BROKER_NAMES[0], BROKER_COLORS[0], highlighted=True)] + BROKER_TILES[1:]
+
+# The whole logo grid before and after Zerodha is selected
+LOGIN_GRID = _build_login_grid(BROKER_TILES)
+LOGIN_GRID_SELECTED = _build_login_grid(BROKER_TILES_HL)
+
+@functools.lru_cache(maxsize=4)
+def _render_login_screen(width, height):
+    """Rasterize the login screen's card, header and welcome text once as an RGBA sprite"""
+    screen = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(screen)
+    
     # Screen outline
     draw.rounded_rectangle(
-        [(x, y), (x + width, y + height)],
+        [(0, 0), (width, height)],
         radius=20, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR, width=2
     )
     
     # Header
     draw.rectangle(
-        [(x, y), (x + width, y + 60)],
+        [(0, 0), (width, 60)],
         fill=HIGHLIGHT_COLOR
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 24)
-        regular_font = ImageFont.truetype("arial.ttf", 18)
-        small_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        regular_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = FONTS[24]
+    regular_font = FONTS[18]
     
     # App title
     draw.text(
-        (x + width//2, y + 30),
+        (width//2, 30),
         "AI Margin Optimizer",
         font=title_font, fill=(255, 255, 255), anchor="mm"
     )
     
     # Welcome text
-    welcome_y = y + 100
     draw.text(
-        (x + width//2, welcome_y),
+        (width//2, 100),
         "Welcome",
         font=title_font, fill=TEXT_COLOR, anchor="mm"
     )
     
     draw.text(
-        (x + width//2, welcome_y + 40),
+        (width//2, 140),
         "Please select your broker to continue",
         font=regular_font, fill=TEXT_COLOR, anchor="mm"
     )
+    return screen
+
+def draw_app_login(img, x, y, width, height, progress):
+    """Draw a login screen for the app with animation"""
+    # Everything but the broker selection and button is the same on every frame
+    screen = _render_login_screen(width, height)
+    img.paste(screen, (x, y), screen)
     
-    # Broker logos grid
-    logo_size = 80
-    logo_gap = 20
-    logo_cols = 3
-    grid_width = (logo_size * logo_cols) + (logo_gap * (logo_cols - 1))
-    start_x = x + (width - grid_width) // 2
-    start_y = welcome_y + 90
-    
-    broker_names = ["Zerodha", "ICICI Direct", "Angel One", "HDFC Sec", "Upstox", "Motilal"]
-    
-    for i, broker in enumerate(broker_names):
-        row = i // logo_cols
-        col = i % logo_cols
-        
-        logo_x = start_x + col * (logo_size + logo_gap)
-        logo_y = start_y + row * (logo_size + logo_gap)
-        
-        # Draw broker logo (simplified as colored rectangles with letters)
-        logo_color = [
-            (47, 115, 187),  # Zerodha blue
-            (227, 82, 5),    # ICICI orange
-            (13, 110, 253),  # Angel blue
-            (57, 123, 33),   # HDFC green
-            (244, 67, 54),   # Upstox red
-            (255, 193, 7),   # Motilal yellow
-        ][i]
-        
-        # Highlight Zerodha (selected broker)
-        border = 3 if i == 0 and progress > 0.5 else 1
-        border_color = HIGHLIGHT_COLOR if i == 0 and progress > 0.5 else (200, 200, 200)
-        
-        draw.rounded_rectangle(
-            [(logo_x, logo_y), (logo_x + logo_size, logo_y + logo_size)],
-            radius=10, fill=logo_color, outline=border_color, width=border
-        )
-        
-        # First letter of broker as logo
-        draw.text(
-            (logo_x + logo_size//2, logo_y + logo_size//2),
-            broker[0],
-            font=title_font, fill=(255, 255, 255), anchor="mm"
-        )
-        
-        # Broker name
-        draw.text(
-            (logo_x + logo_size//2, logo_y + logo_size + 15),
-            broker,
-            font=small_font, fill=TEXT_COLOR, anchor="mm"
-        )
+    # Broker logos grid, below the welcome text
+    start_x = x + (width - LOGIN_GRID_WIDTH) // 2
+    start_y = y + 190
+    sprite, (dx, dy) = LOGIN_GRID_SELECTED if progress > 0.5 else LOGIN_GRID
+    img.paste(sprite, (start_x + dx, start_y + dy), sprite)
     
     # Login button animation
     if progress > 0.7:
+        draw = ImageDraw.Draw(img)
         button_width = 200
-        button_y = start_y + (2 * (logo_size + logo_gap)) + 60
+        button_y = start_y + (2 * (LOGO_SIZE + LOGO_GAP)) + 60
         
         button_color = HIGHLIGHT_COLOR if progress < 0.9 else POSITIVE_COLOR
         button_text = "Connect to Broker" if progress < 0.9 else "Connected!"
@@ -438,30 +610,31 @@ def draw_app_login(draw, x, y, width, height, progress):
             radius=25, fill=button_color
         )
         
-        draw.text(
-            (x + width//2, button_y + 25),
+        paste_text(
+            img, (x + width//2, button_y + 25),
             button_text,
-            font=regular_font, fill=(255, 255, 255), anchor="mm"
+            font=FONTS[18], fill=(255, 255, 255), anchor="mm"
         )
 
-def draw_broker_auth_screen(draw, x, y, width, height, progress):
+# Read-only permissions requested on the broker authorization screen
+AUTH_PERMISSIONS = (
+    "✓ View your portfolio holdings",
+    "✓ View your margin information",
+    "✓ View your account balance"
+)
+
+def draw_broker_auth_screen(img, x, y, width, height, progress):
     """Draw a broker authorization screen with animation"""
+    draw = ImageDraw.Draw(img)
     # Screen outline
     draw.rounded_rectangle(
         [(x, y), (x + width, y + height)],
         radius=20, fill=(255, 255, 255), outline=(200, 200, 200), width=2
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 22)
-        regular_font = ImageFont.truetype("arial.ttf", 16)
-        small_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        regular_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = FONTS[22]
+    regular_font = FONTS[16]
+    small_font = FONTS[14]
     
     # Zerodha header
     draw.rectangle(
@@ -470,8 +643,8 @@ def draw_broker_auth_screen(draw, x, y, width, height, progress):
     )
     
     # Zerodha logo text
-    draw.text(
-        (x + 30, y + 30),
+    paste_text(
+        img, (x + 30, y + 30),
         "Zerodha",
         font=title_font, fill=(255, 255, 255), anchor="lm"
     )
@@ -480,34 +653,28 @@ def draw_broker_auth_screen(draw, x, y, width, height, progress):
     form_y = y + 90
     
     # Title
-    draw.text(
-        (x + width//2, form_y),
+    paste_text(
+        img, (x + width//2, form_y),
         "Authorize AI Margin Optimizer",
         font=title_font, fill=TEXT_COLOR, anchor="mm"
     )
     
     # Description
     description = "This app is requesting permission to:"
-    draw.text(
-        (x + 50, form_y + 50),
+    paste_text(
+        img, (x + 50, form_y + 50),
         description,
         font=regular_font, fill=TEXT_COLOR
     )
     
     # Permissions list
-    permissions = [
-        "✓ View your portfolio holdings",
-        "✓ View your margin information",
-        "✓ View your account balance"
-    ]
-    
-    for i, permission in enumerate(permissions):
+    for i, permission in enumerate(AUTH_PERMISSIONS):
         # Only show permission if it's time in the animation
         if progress > 0.3 + (i * 0.1):
             perm_y = form_y + 90 + (i * 30)
             
-            draw.text(
-                (x + 70, perm_y),
+            paste_text(
+                img, (x + 70, perm_y),
                 permission,
                 font=regular_font, fill=TEXT_COLOR
             )
@@ -521,14 +688,14 @@ def draw_broker_auth_screen(draw, x, y, width, height, progress):
             radius=10, fill=(255, 250, 230), outline=(230, 210, 180)
         )
         
-        draw.text(
-            (x + 70, note_y + 20),
+        paste_text(
+            img, (x + 70, note_y + 20),
             "🔒 This app will NOT be able to place trades or withdraw funds.",
             font=small_font, fill=TEXT_COLOR
         )
         
-        draw.text(
-            (x + 70, note_y + 45),
+        paste_text(
+            img, (x + 70, note_y + 45),
             "All data is encrypted and secure.",
             font=small_font, fill=TEXT_COLOR
         )
@@ -545,8 +712,8 @@ def draw_broker_auth_screen(draw, x, y, width, height, progress):
             radius=25, fill=(220, 220, 220)
         )
         
-        draw.text(
-            (x + width//2 - button_width//2 - 20, button_y + 25),
+        paste_text(
+            img, (x + width//2 - button_width//2 - 20, button_y + 25),
             "Deny",
             font=regular_font, fill=TEXT_COLOR, anchor="mm"
         )
@@ -560,98 +727,95 @@ def draw_broker_auth_screen(draw, x, y, width, height, progress):
             radius=25, fill=button_color
         )
         
-        draw.text(
-            (x + width//2 + button_width//2 + 20, button_y + 25),
+        paste_text(
+            img, (x + width//2 + button_width//2 + 20, button_y + 25),
             "Allow",
             font=regular_font, fill=(255, 255, 255), anchor="mm"
         )
 
-def draw_dashboard_element(draw, x, y, width, height, title, value, subtitle=None, highlight=False, highlight_text=None, progress=1.0):
-    """Draw a dashboard card element with optional highlight"""
+@functools.lru_cache(maxsize=16)
+def _render_dashboard_card(width, height, title, value, subtitle, highlight, highlight_text):
+    """Rasterize a dashboard card, text included, once as an RGBA sprite"""
+    card = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(card)
+    
     # Card outline
     border_color = HIGHLIGHT_COLOR if highlight else (220, 220, 230)
     bg_color = (250, 253, 255) if highlight else (255, 255, 255)
     
     draw.rounded_rectangle(
-        [(x, y), (x + width, y + height)],
+        [(0, 0), (width, height)],
         radius=10, fill=bg_color, outline=border_color, width=2
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 16)
-        value_font = ImageFont.truetype("arial.ttf", 22)
-        subtitle_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        value_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
-    
-    # Fade in animation
-    alpha = min(1.0, progress * 2)
-    text_color = TEXT_COLOR
+    title_font = FONTS[16]
+    value_font = FONTS[22]
+    subtitle_font = FONTS[14]
     
     # Title
     draw.text(
-        (x + 15, y + 20),
+        (15, 20),
         title,
-        font=title_font, fill=text_color
+        font=title_font, fill=TEXT_COLOR
     )
     
     # Value
-    value_y = y + 50
+    value_y = 50
     draw.text(
-        (x + 15, value_y),
+        (15, value_y),
         value,
-        font=value_font, fill=text_color
+        font=value_font, fill=TEXT_COLOR
     )
     
     # Optional subtitle
     if subtitle:
         draw.text(
-            (x + 15, value_y + 35),
+            (15, value_y + 35),
             subtitle,
             font=subtitle_font, fill=NEUTRAL_COLOR
         )
     
     # Optional highlight notification
-    if highlight and highlight_text and progress > 0.7:
-        highlight_y = y + height - 35
+    if highlight_text:
+        highlight_y = height - 35
         
         draw.rounded_rectangle(
-            [(x + 10, highlight_y), (x + width - 10, highlight_y + 25)],
+            [(10, highlight_y), (width - 10, highlight_y + 25)],
             radius=5, fill=(255, 240, 200)
         )
         
         draw.text(
-            (x + width//2, highlight_y + 12),
+            (width//2, highlight_y + 12),
             highlight_text,
             font=subtitle_font, fill=TEXT_COLOR, anchor="mm"
         )
+    return card
+
+def draw_dashboard_element(img, x, y, width, height, title, value, subtitle=None, highlight=False, highlight_text=None, progress=1.0):
+    """Draw a dashboard card element with optional highlight"""
+    # The notification only appears late in the animation; otherwise the card is static
+    if not (highlight and progress > 0.7):
+        highlight_text = None
+    
+    card = _render_dashboard_card(width, height, title, value, subtitle, highlight, highlight_text)
+    img.paste(card, (x, y), card)
 
-def draw_confidence_meter(draw, x, y, width, height, confidence, title="AI Confidence", progress=1.0):
+def draw_confidence_meter(img, x, y, width, height, confidence, title="AI Confidence", progress=1.0):
     """Draw an AI confidence meter with animation"""
+    draw = ImageDraw.Draw(img)
     # Background
     draw.rounded_rectangle(
         [(x, y), (x + width, y + height)],
         radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 16)
-        value_font = ImageFont.truetype("arial.ttf", 18)
-        subtitle_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        value_font = ImageFont.load_default()
-        subtitle_font = ImageFont.load_default()
+    title_font = FONTS[16]
+    value_font = FONTS[18]
+    subtitle_font = FONTS[14]
     
     # Title
-    draw.text(
-        (x + width//2, y + 20),
+    paste_text(
+        img, (x + width//2, y + 20),
         title,
         font=title_font, fill=TEXT_COLOR, anchor="mm"
     )
@@ -689,18 +853,18 @@ def draw_confidence_meter(draw, x, y, width, height, confidence, title="AI Confi
     
     # Confidence percentage
     if progress > 0.9:
-        draw.text(
-            (x + width//2, bar_y + bar_height + 20),
+        paste_text(
+            img, (x + width//2, bar_y + bar_height + 20),
             f"{int(confidence * 100)}% Confident",
             font=value_font, fill=TEXT_COLOR, anchor="mm"
         )
 
-def draw_news_item(draw, x, y, width, title, summary, sentiment="neutral", progress=1.0):
-    """Draw a news item with animated appearance"""
+@functools.lru_cache(maxsize=16)
+def _render_news_item(width, title, summary, sentiment):
+    """Rasterize a news item card, text included, once as an RGBA sprite"""
     height = 100
-    
-    # Fade in animation
-    alpha = min(1.0, progress * 2)
+    card = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(card)
     
     # Background with sentiment color indicator
     if sentiment == "positive":
@@ -712,30 +876,23 @@ def draw_news_item(draw, x, y, width, title, summary, sentiment="neutral", progr
     
     # News item card
     draw.rounded_rectangle(
-        [(x, y), (x + width, y + height)],
+        [(0, 0), (width, height)],
         radius=8, fill=(255, 255, 255), outline=(220, 220, 230), width=1
     )
     
     # Sentiment indicator
     draw.rectangle(
-        [(x, y), (x + 8, y + height)],
+        [(0, 0), (8, height)],
         fill=sentiment_color
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 16)
-        summary_font = ImageFont.truetype("arial.ttf", 14)
-        sentiment_font = ImageFont.truetype("arial.ttf", 12)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        summary_font = ImageFont.load_default()
-        sentiment_font = ImageFont.load_default()
+    title_font = FONTS[16]
+    summary_font = FONTS[14]
+    sentiment_font = FONTS[12]
     
     # News title
     draw.text(
-        (x + 20, y + 20),
+        (20, 20),
         title,
         font=title_font, fill=TEXT_COLOR
     )
@@ -746,7 +903,7 @@ def draw_news_item(draw, x, y, width, title, summary, sentiment="neutral", progr
         summary = summary[:max_chars-3] + "..."
     
     draw.text(
-        (x + 20, y + 50),
+        (20, 50),
         summary,
         font=summary_font, fill=(80, 80, 80)
     )
@@ -754,33 +911,33 @@ def draw_news_item(draw, x, y, width, title, summary, sentiment="neutral", progr
     # Sentiment label
     sentiment_text = f"{sentiment.capitalize()} impact"
     draw.text(
-        (x + width - 20, y + 20),
+        (width - 20, 20),
         sentiment_text,
         font=sentiment_font, fill=sentiment_color, anchor="ra"
     )
+    return card
+
+def draw_news_item(img, x, y, width, title, summary, sentiment="neutral", progress=1.0):
+    """Draw a news item with animated appearance"""
+    card = _render_news_item(width, title, summary, sentiment)
+    img.paste(card, (x, y), card)
 
-def draw_optimization_factors(draw, x, y, width, height, factors, progress=1.0):
+def draw_optimization_factors(img, x, y, width, height, factors, progress=1.0):
     """Draw optimization factors with animated appearance"""
+    draw = ImageDraw.Draw(img)
     # Background
     draw.rounded_rectangle(
         [(x, y), (x + width, y + height)],
         radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
     )
     
-    try:
-        # Try to load fonts
-        title_font = ImageFont.truetype("arial.ttf", 18)
-        factor_font = ImageFont.truetype("arial.ttf", 16)
-        detail_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        title_font = ImageFont.load_default()
-        factor_font = ImageFont.load_default()
-        detail_font = ImageFont.load_default()
+    title_font = FONTS[18]
+    factor_font = FONTS[16]
+    detail_font = FONTS[14]
     
     # Title
-    draw.text(
-        (x + width//2, y + 20),
+    paste_text(
+        img, (x + width//2, y + 20),
         "Optimization Factors",
         font=title_font, fill=TEXT_COLOR, anchor="mm"
     )
@@ -789,7 +946,6 @@ def draw_optimization_factors(draw, x, y, width, height, factors, progress=1.0):
     for i, (factor, value, detail) in enumerate(factors):
         # Only show factor if it's time in the animation
         if progress > (i * 0.2):
-            factor_alpha = min(1.0, (progress - (i * 0.2)) / 0.15)
             factor_y = y + 60 + (i * 70)
             
             # Factor background
@@ -803,20 +959,20 @@ def draw_optimization_factors(draw, x, y, width, height, factors, progress=1.0):
             icon = "+" if value > 0 else "-"
             icon_color = POSITIVE_COLOR if value > 0 else NEGATIVE_COLOR
             
-            draw.text(
-                (x + 40, factor_y + 15),
+            paste_text(
+                img, (x + 40, factor_y + 15),
                 icon,
                 font=title_font, fill=icon_color
             )
             
-            draw.text(
-                (x + 70, factor_y + 15),
+            paste_text(
+                img, (x + 70, factor_y + 15),
                 factor,
                 font=factor_font, fill=TEXT_COLOR
             )
             
-            draw.text(
-                (x + 70, factor_y + 40),
+            paste_text(
+                img, (x + 70, factor_y + 40),
                 detail,
                 font=detail_font, fill=(100, 100, 100)
             )
@@ -825,14 +981,15 @@ def draw_optimization_factors(draw, x, y, width, height, factors, progress=1.0):
             value_text = f"{abs(value)}% {'Reduction' if value > 0 else 'Increase'}"
             value_color = POSITIVE_COLOR if value > 0 else NEGATIVE_COLOR
             
-            draw.text(
-                (x + width - 40, factor_y + 30),
+            paste_text(
+                img, (x + width - 40, factor_y + 30),
                 value_text,
                 font=factor_font, fill=value_color, anchor="rm"
             )
 
-def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
+def draw_step_instructions(img, x, y, width, height, steps, progress=1.0):
     """Draw step-by-step instructions with animation"""
+    draw = ImageDraw.Draw(img)
     # Background
     draw.rounded_rectangle(
         [(x, y), (x + width, y + height)],
@@ -845,20 +1002,13 @@ def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
         fill=HIGHLIGHT_COLOR
     )
     
-    try:
-        # Try to load fonts
-        header_font = ImageFont.truetype("arial.ttf", 20)
-        step_font = ImageFont.truetype("arial.ttf", 16)
-        detail_font = ImageFont.truetype("arial.ttf", 14)
-    except IOError:
-        # Fall back to default font
-        header_font = ImageFont.load_default()
-        step_font = ImageFont.load_default()
-        detail_font = ImageFont.load_default()
+    header_font = FONTS[20]
+    step_font = FONTS[16]
+    detail_font = FONTS[14]
     
     # Header text
-    draw.text(
-        (x + width//2, y + 25),
+    paste_text(
+        img, (x + width//2, y + 25),
         "Action Steps - Zerodha Kite",
         font=header_font, fill=(255, 255, 255), anchor="mm"
     )
@@ -867,7 +1017,6 @@ def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
     for i, (step_num, step_text, details) in enumerate(steps):
         # Only show step if it's time in the animation
         if progress > (i * 0.15):
-            step_alpha = min(1.0, (progress - (i * 0.15)) / 0.1)
             step_y = y + 70 + (i * (80 if details else 50))
             
             # Highlight current step
@@ -879,8 +1028,8 @@ def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
                 draw.rectangle(highlight_rect, fill=(255, 255, 200))
             
             # Step number and text
-            draw.text(
-                (x + 40, step_y),
+            paste_text(
+                img, (x + 40, step_y),
                 f"{step_num}. {step_text}",
                 font=step_font, fill=TEXT_COLOR
             )
@@ -888,12 +1037,7 @@ def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
             # Optional step details
             if details:
                 detail_y = step_y + 30
-                for j, detail in enumerate(details):
-                    draw.text(
-                        (x + 60, detail_y + j*20),
-                        detail,
-                        font=detail_font, fill=(100, 100, 100)
-                    )
+                draw_text_lines(img, (x + 60, detail_y), details, detail_font, (100, 100, 100), 20)
     
     # Success checkmark or button
     if progress > 0.9:
@@ -904,1699 +1048,1783 @@ def draw_step_instructions(draw, x, y, width, height, steps, progress=1.0):
             radius=25, fill=POSITIVE_COLOR
         )
         
-        draw.text(
-            (x + width//2, check_y + 25),
+        paste_text(
+            img, (x + width//2, check_y + 25),
             "✓ Completed",
             font=step_font, fill=(255, 255, 255), anchor="mm"
         )
 
-def generate_demo_frame(frame_num, total_frames):
-    """Generate a single frame for the detailed Mr. Sharma demo video"""
-    # Create a blank image
-    img = Image.new('RGB', (WIDTH, HEIGHT), BG_COLOR)
-    draw = ImageDraw.Draw(img)
+@functools.lru_cache(maxsize=8)
+def _render_info_card(width, height, outline, title, lines, font_size, line_height):
+    """Rasterize an info card's box, heading and bullet lines once as an RGBA sprite"""
+    card = Image.new('RGBA', (width + 1, height + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(card)
     
-    try:
-        # Load fonts (use default if custom font fails)
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 36)
-            heading_font = ImageFont.truetype("arial.ttf", 28)
-            regular_font = ImageFont.truetype("arial.ttf", 20)
-            small_font = ImageFont.truetype("arial.ttf", 16)
-        except IOError:
-            title_font = ImageFont.load_default()
-            heading_font = ImageFont.load_default()
-            regular_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
-        
-        # Determine which scene to show based on frame number
-        scene = 1
-        if frame_num < 60:  # 0-6 seconds
-            scene = 1  # Introduction & Login
-        elif frame_num < 120:  # 6-12 seconds
-            scene = 2  # Broker Authorization
-        elif frame_num < 180:  # 12-18 seconds
-            scene = 3  # Dashboard Overview
-        elif frame_num < 240:  # 18-24 seconds
-            scene = 4  # Understanding the Recommendation
-        elif frame_num < 300:  # 24-30 seconds
-            scene = 5  # Taking Action
-        elif frame_num < 360:  # 30-36 seconds
-            scene = 6  # New Opportunity
-        elif frame_num < 420:  # 36-42 seconds
-            scene = 7  # End of Week Results
-        elif frame_num < 480:  # 42-48 seconds
-            scene = 8  # Weekly Performance Review
-        elif frame_num < 540:  # 48-54 seconds
-            scene = 9  # Monthly ROI Calculation
-        else:  # 54-60 seconds
-            scene = 10  # Conclusion & Benefits
-        
-        # Calculate scene-specific progress (0-1)
-        scene_progress = (frame_num - (scene - 1) * 60) / 60
-        
-        # Draw header with logo
-        draw.rectangle([(0, 0), (WIDTH, 70)], fill=(20, 30, 70))
-        draw_text_with_shadow(draw, "AI Margin Optimizer", (30, 15), title_font, (255, 255, 255))
-        
-        # Scene title and progress
-        scene_titles = {
-            1: "Introduction - Meet Mr. Sharma",
-            2: "Broker Authorization - Secure Connection",
-            3: "Dashboard Overview - Morning Check",
-            4: "Understanding the Recommendation",
-            5: "Taking Action - Freeing Up Capital",
-            6: "New Opportunity - Putting Capital to Work",
-            7: "End of Week Results",
-            8: "Weekly Performance Review",
-            9: "Monthly ROI Calculation",
-            10: "Benefits - Capital Unleashed"
-        }
-        draw.rectangle([(0, 70), (WIDTH, 110)], fill=(240, 240, 255))
-        draw.text((WIDTH//2, 90), scene_titles[scene], font=heading_font, fill=(20, 30, 70), anchor="mm")
-        
-        # Draw narration at bottom
-        narrations = {
-            1: "Mr. Sharma logs into the AI Margin Optimizer app for his daily morning check.",
-            2: "The app securely connects to his Zerodha trading account with read-only access.",
-            3: "The dashboard immediately shows potential margin optimization of ₹12 lakhs.",
-            4: "Mr. Sharma reviews why this optimization is possible based on multiple factors.",
-            5: "Following the simple steps, he adjusts his margin with his broker.",
-            6: "With newly freed capital, Mr. Sharma identifies a promising opportunity.",
-            7: "By Friday, his new position using freed-up capital generates ₹65,000 profit.",
-            8: "The weekly review shows consistent capital efficiency improvements.",
-            9: "Monthly analysis confirms a 17.5x return on his subscription investment.",
-            10: "Mr. Sharma consistently benefits from optimized margin requirements."
-        }
+    draw.rounded_rectangle(
+        [(0, 0), (width, height)], 
+        radius=10, fill=(255, 255, 255), outline=outline
+    )
+    
+    draw.text(
+        (width//2, 30), 
+        title, 
+        font=FONTS[28], fill=TEXT_COLOR, anchor="mm"
+    )
+    
+    draw_text_lines(card, (20, 70), lines, FONTS[font_size], TEXT_COLOR, line_height)
+    return card
+
+def draw_info_card(img, x, y, width, height, outline, title, lines, font_size, line_height):
+    """
+    Draw a white info card with a centered heading and a list of lines
+    
+    Args:
+        img (Image): Frame to draw on
+        x (int): Left edge of the card
+        y (int): Top edge of the card
+        width (int): Card width
+        height (int): Card height
+        outline (tuple): Border color
+        title (str): Heading text
+        lines (tuple): Lines listed under the heading
+        font_size (int): Size of the listed lines, a key of FONTS
+        line_height (int): Distance in pixels between listed lines
+    """
+    card = _render_info_card(width, height, outline, title, lines, font_size, line_height)
+    img.paste(card, (x, y), card)
+
+@functools.lru_cache(maxsize=4)
+def _render_dot(radius, color):
+    """Rasterize a filled chart dot once as an RGBA sprite"""
+    dot = Image.new('RGBA', (2 * radius + 1, 2 * radius + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(dot).ellipse([(0, 0), (2 * radius, 2 * radius)], fill=color)
+    return dot
+
+def draw_dot(img, center, radius, color):
+    """
+    Draw a filled dot, as draw.ellipse around center would
+    
+    Args:
+        img (Image): Frame to draw on
+        center (tuple): (x, y) center of the dot, may be fractional
+        radius (int): Dot radius in pixels
+        color (tuple): Fill color
+    """
+    # Pillow truncates ellipse corners to whole pixels
+    dot = _render_dot(radius, color)
+    img.paste(dot, (int(center[0] - radius), int(center[1] - radius)), dot)
+
+# Info cards shown beside Mr. Sharma in the first two scenes
+SHARMA_DETAILS = (
+    "• F&O Trader for 7 years",
+    "• Portfolio Value: ₹1.5 crore",
+    "• Typical Positions: 8-12",
+    "• Trading Approach: Swing",
+)
+SECURITY_POINTS = (
+    "• Read-only access",
+    "• Bank-level encryption",
+    "• No trading permissions",
+    "• Revokable anytime",
+)
+
+def build_background():
+    """Build the part of the frame that never changes: background fill, header bar and scene title band"""
+    canvas = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    canvas[...] = BG_COLOR
+    background = Image.fromarray(canvas, 'RGB')
+    
+    # Draw header with logo
+    draw = ImageDraw.Draw(background)
+    draw.rectangle([(0, 0), (WIDTH, 70)], fill=(20, 30, 70))
+    draw_text_with_shadow(draw, "AI Margin Optimizer", (30, 15), FONTS[36], (255, 255, 255))
+    
+    # Band behind the scene title
+    draw.rectangle([(0, 70), (WIDTH, 110)], fill=(240, 240, 255))
+    return background
+
+def build_conclusion_background():
+    """Build the full-frame gradient the conclusion scene is drawn on"""
+    # Create gradient from top to bottom, one color per row
+    ys = (np.arange(HEIGHT) / HEIGHT)[:, None]
+    rows = (np.array([20, 30, 70]) + ys * np.array([30, 50, 20])).astype(np.uint8)
+    return Image.fromarray(np.repeat(rows[:, None, :], WIDTH, axis=1), 'RGB')
+
+# Every frame starts as a copy of this instead of being filled and given a header from scratch
+BACKGROUND = build_background()
+CONCLUSION_BACKGROUND = build_conclusion_background()
+
+# Directions of the scene 4 radar chart's five axes, 72 degrees apart
+RADAR_ANGLES = np.radians(np.arange(0, 360, 72))
+RADAR_COS = np.cos(RADAR_ANGLES)
+RADAR_SIN = np.sin(RADAR_ANGLES)
+
+# (cos, sin) of the clock face direction for each minute, measured from 3 o'clock counterclockwise
+CLOCK_DIRECTIONS = tuple(
+    (math.cos(angle), math.sin(angle))
+    for angle in (math.pi/2 - (minute/60) * 2*math.pi for minute in range(60))
+)
+
+# Scene 4 radar chart factors (scale 0-1), one per axis
+RADAR_FACTOR_VALUES = np.array([0.8, 0.9, 0.75, 0.65, 0.85])
+RADAR_FACTOR_NAMES = ("Market", "News", "Volatility", "Correlation", "Macro")
+
+def radar_points(values, cx, cy, radius):
+    """Pixel positions of values (0-1) along each radar axis, computed for all axes at once"""
+    distances = np.asarray(values) * radius
+    xs = cx + np.trunc(distances * RADAR_COS).astype(int)
+    ys = cy + np.trunc(distances * RADAR_SIN).astype(int)
+    return list(zip(xs.tolist(), ys.tolist()))
+
+# Scene titles and narrations, keyed by scene number
+SCENE_TITLES = {
+    1: "Introduction - Meet Mr. Sharma",
+    2: "Broker Authorization - Secure Connection",
+    3: "Dashboard Overview - Morning Check",
+    4: "Understanding the Recommendation",
+    5: "Taking Action - Freeing Up Capital",
+    6: "New Opportunity - Putting Capital to Work",
+    7: "End of Week Results",
+    8: "Weekly Performance Review",
+    9: "Monthly ROI Calculation",
+    10: "Benefits - Capital Unleashed"
+}
+
+NARRATIONS = {
+    1: "Mr. Sharma logs into the AI Margin Optimizer app for his daily morning check.",
+    2: "The app securely connects to his Zerodha trading account with read-only access.",
+    3: "The dashboard immediately shows potential margin optimization of ₹12 lakhs.",
+    4: "Mr. Sharma reviews why this optimization is possible based on multiple factors.",
+    5: "Following the simple steps, he adjusts his margin with his broker.",
+    6: "With newly freed capital, Mr. Sharma identifies a promising opportunity.",
+    7: "By Friday, his new position using freed-up capital generates ₹65,000 profit.",
+    8: "The weekly review shows consistent capital efficiency improvements.",
+    9: "Monthly analysis confirms a 17.5x return on his subscription investment.",
+    10: "Mr. Sharma consistently benefits from optimized margin requirements."
+}
+
+# Scene 3 market news, scene 4 factors behind the recommendation, scene 5 margin
+# adjustment steps and scene 6 trade rationale
+NEWS_ITEMS = (
+    {
+        "title": "RELIANCE: Q1 Results Beat Expectations",
+        "summary": "Reliance Industries reported 15% higher profits than analyst consensus.",
+        "sentiment": "positive"
+    },
+    {
+        "title": "RBI Maintains Interest Rate in Policy Meeting",
+        "summary": "The central bank kept repo rate unchanged at 6.5%, in line with expectations.",
+        "sentiment": "neutral"
+    },
+    {
+        "title": "Banking Sector Volatility Decreases to 2-Month Low",
+        "summary": "HDFC Bank and peers show stabilizing price movements after recent turbulence.",
+        "sentiment": "positive"
+    }
+)
+OPTIMIZATION_FACTORS = (
+    ("News Sentiment", 5.2, "Positive news for RELIANCE and HDFC"),
+    ("Market Correlation", 3.8, "Decreased correlation between positions"),
+    ("Sector Volatility", 4.5, "Banking sector volatility stabilized")
+)
+ACTION_STEPS = (
+    (1, "Navigate to Margins section in Zerodha Kite", None),
+    (2, "Update margin values for these positions:", (
+        "• RELIANCE JUN FUT: Reduce from ₹4,25,000 to ₹3,40,000",
+        "• HDFCBANK JUN FUT: Reduce from ₹3,80,000 to ₹2,85,000",
+        "• NIFTY 19500 CALL: Reduce from ₹2,50,000 to ₹1,80,000"
+    )),
+    (3, "Confirm adjustments by clicking 'Update Margins'", None),
+    (4, "Verify new margin requirement is updated", None)
+)
+TRADE_REASONS = (
+    "• FDA approval for key drug (positive catalyst)",
+    "• Technical breakout above resistance",
+    "• Sector rotation into pharmaceuticals",
+    "• Low implied volatility relative to historical"
+)
+ORDER_DETAILS = (
+    "Symbol: CIPLA JUN FUT",
+    "Quantity: 2000",
+    "Price: ₹1,248.25",
+    f"Total Value: ₹{int(1248.25 * 2000):,}",
+    f"Margin Required: ₹{int(11.5 * 100000):,}"
+)
+
+# Calendar, tab and metric content for the weekly and monthly reviews in scenes 7-9
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday")
+WEEKDAY_DATES = tuple(f"April {i + 8}" for i in range(len(WEEKDAYS)))
+WEEK_TABS = ("Apr 1-5", "Apr 8-12", "Apr 15-19", "Apr 22-26")
+MONTH_TABS = ("February", "March", "April", "May")
+WEEKLY_METRICS = (
+    {
+        "title": "Margin Optimization",
+        "value": "₹12,00,000",
+        "subtitle": "Capital Freed",
+        "color": HIGHLIGHT_COLOR
+    },
+    {
+        "title": "Additional Profit",
+        "value": "₹65,000",
+        "subtitle": "From New Position",
+        "color": POSITIVE_COLOR
+    },
+    {
+        "title": "Return on Margin",
+        "value": "5.65%",
+        "subtitle": "4 Trading Days",
+        "color": POSITIVE_COLOR
+    }
+)
+MARGIN_EFFICIENCY = (10, 85, 82, 80, 78)  # Percentage of margin efficiency, Monday to Friday
+MARGIN_EFFICIENCY_LABELS = tuple(f"{value}%" for value in MARGIN_EFFICIENCY)
+ROI_METRICS = (
+    ("Additional Profit Generated", "+₹2,10,000"),
+    ("Monthly Subscription Cost", "₹12,000"),
+    ("Return on Investment", "17.5x")
+)
+
+# Capital freed per day in April, in lakhs, with the current week having higher values
+CAPITAL_FREED = (
+    2.5, 5.8, 3.2, 7.1, 4.3, 3.8, 6.2,  # Week 1
+    5.5, 4.9, 8.3, 6.7, 7.2, 5.8, 9.1,  # Week 2
+    7.3, 6.8, 11.5, 8.4, 12.0, 9.3, 10.5,  # Week 3 (current)
+    8.2, 7.5, 6.4, 5.9, 10.2, 9.7, 8.8,  # Week 4
+    7.1, 8.3  # Partial Week 5
+)
+# Averages of the 4 complete weeks, with their chart labels
+WEEKLY_CAPITAL_FREED = tuple(sum(CAPITAL_FREED[w*7:(w+1)*7]) / 7 for w in range(4))
+WEEKLY_CAPITAL_FREED_LABELS = tuple(f"Avg: ₹{avg:.1f}L" for avg in WEEKLY_CAPITAL_FREED)
+
+# Chart axis labels for scenes 8-9
+PERCENT_AXIS_LABELS = tuple(f"{i * 20}%" for i in range(6))
+LAKH_AXIS_LABELS = tuple(f"₹{i * 3}L" for i in range(6))  # 0 to 15 lakhs
+DAY_AXIS_LABELS = tuple(f"Day {i * 7}" if i > 0 else "Start" for i in range(5))
+
+# Panels of scenes 6-9, as (x, y, width, height)
+PLATFORM_BOX = (80, 130, WIDTH//2 - 100, HEIGHT - 250)
+CALENDAR_BOX = (100, 130, WIDTH - 200, HEIGHT - 300)
+REVIEW_BOX = (80, 130, WIDTH - 160, HEIGHT - 250)
+
+def draw_trading_platform_panel(img, draw):
+    """Draw the empty trading platform panel of scene 6"""
+    platform_x, platform_y, platform_width, platform_height = PLATFORM_BOX
+    
+    # Trading platform panel
+    draw.rounded_rectangle(
+        [(platform_x, platform_y), (platform_x + platform_width, platform_y + platform_height)],
+        radius=10, fill=(30, 40, 50), outline=(50, 60, 70)
+    )
+    
+    # Platform header
+    draw.rectangle(
+        [(platform_x, platform_y), (platform_x + platform_width, platform_y + 40)],
+        fill=(50, 60, 70)
+    )
+    
+    paste_text(
+        img, (platform_x + platform_width//2, platform_y + 20),
+        "Trading Platform",
+        font=FONTS[20], fill=(220, 220, 220), anchor="mm"
+    )
+
+def draw_week_calendar(img, draw):
+    """Draw the scene 7 week calendar with its day headers and dates, before any events"""
+    calendar_x, calendar_y, calendar_width, calendar_height = CALENDAR_BOX
+    
+    # Calendar background
+    draw.rounded_rectangle(
+        [(calendar_x, calendar_y), (calendar_x + calendar_width, calendar_y + calendar_height)],
+        radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=2
+    )
+    
+    # Header
+    draw.rectangle(
+        [(calendar_x, calendar_y), (calendar_x + calendar_width, calendar_y + 50)],
+        fill=HIGHLIGHT_COLOR
+    )
+    
+    paste_text(
+        img, (calendar_x + calendar_width//2, calendar_y + 25),
+        "Week of April 8-12, 2025",
+        font=FONTS[28], fill=(255, 255, 255), anchor="mm"
+    )
+    
+    # Days of week
+    day_width = calendar_width / len(WEEKDAYS)
+    
+    for i, day in enumerate(WEEKDAYS):
+        day_x = calendar_x + (i * day_width)
+        
+        # Highlight Friday
+        if i == 4:
+            # Highlight background for Friday
+            draw.rectangle(
+                [(day_x, calendar_y + 50), (day_x + day_width, calendar_y + calendar_height)],
+                fill=(250, 255, 250)
+            )
+        
+        # Day header
+        draw.rectangle(
+            [(day_x, calendar_y + 50), (day_x + day_width, calendar_y + 90)],
+            fill=(240, 240, 250)
+        )
+        
+        paste_text(
+            img, (day_x + day_width//2, calendar_y + 70),
+            day,
+            font=FONTS[20], fill=TEXT_COLOR, anchor="mm"
+        )
+        
+        # Date
+        paste_text(
+            img, (day_x + day_width//2, calendar_y + 110),
+            WEEKDAY_DATES[i],
+            font=FONTS[16], fill=TEXT_COLOR, anchor="mm"
+        )
+
+def draw_review_dashboard(img, draw, title, selector_label, tabs, selected, tab_width):
+    """
+    Draw the scene 8/9 review dashboard with its header and period selector
+    
+    Args:
+        img (Image): Frame to draw on
+        draw (ImageDraw.Draw): Drawing context for img
+        title (str): Header text
+        selector_label (str): Label in front of the selector tabs
+        tabs (tuple): Tab captions, left to right
+        selected (int): Index of the highlighted tab
+        tab_width (int): Horizontal distance between tabs
+    """
+    dashboard_x, dashboard_y, dashboard_width, dashboard_height = REVIEW_BOX
+    
+    # Dashboard background
+    draw.rounded_rectangle(
+        [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + dashboard_height)],
+        radius=10, fill=(250, 250, 255), outline=(220, 220, 230), width=1
+    )
+    
+    # Dashboard header
+    draw.rectangle(
+        [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + 50)],
+        fill=HIGHLIGHT_COLOR
+    )
+    
+    paste_text(
+        img, (dashboard_x + dashboard_width//2, dashboard_y + 25),
+        title,
+        font=FONTS[28], fill=(255, 255, 255), anchor="mm"
+    )
+    
+    # Period selector
+    tab_y = dashboard_y + 70
+    
+    paste_text(
+        img, (dashboard_x + 30, tab_y),
+        selector_label,
+        font=FONTS[20], fill=TEXT_COLOR
+    )
+    
+    tab_x = dashboard_x + 100
+    
+    for i, tab in enumerate(tabs):
+        tab_fill = HIGHLIGHT_COLOR if i == selected else (240, 240, 240)
+        tab_text = (255, 255, 255) if i == selected else TEXT_COLOR
         
         draw.rounded_rectangle(
-            [(100, HEIGHT - 100), (WIDTH - 100, HEIGHT - 30)], 
-            radius=10, fill=(0, 0, 0, 150)
+            [(tab_x + i*tab_width, tab_y - 10), (tab_x + (i+1)*tab_width - 5, tab_y + 25)],
+            radius=5, fill=tab_fill
         )
         
-        draw.text(
-            (WIDTH//2, HEIGHT - 65), 
-            narrations[scene], 
-            font=regular_font, fill=(255, 255, 255), anchor="mm"
+        paste_text(
+            img, (tab_x + i*tab_width + tab_width//2, tab_y + 7),
+            tab,
+            font=FONTS[16], fill=tab_text, anchor="mm"
         )
+
+@functools.lru_cache(maxsize=2)
+def _render_chart_grid(width, height):
+    """
+    Rasterize a chart area with its background and six horizontal gridlines
+    
+    Args:
+        width (int): Chart width
+        height (int): Chart height
         
-        # Draw scene content based on the current scene
-        if scene == 1:
-            # Introduction & Login scene
-            # Draw Mr. Sharma character
-            character_progress = min(1.0, scene_progress * 2)  # 0-0.5 seconds
-            if character_progress < 1:
-                # Character entering animation
-                x_pos = int(WIDTH//4 - 200 + (character_progress * 200))
-                draw_businessman(draw, x_pos, HEIGHT//2, size=150, expression="happy", action="idle", progress=scene_progress)
-            else:
-                # Character using phone animation
-                draw_businessman(draw, WIDTH//4, HEIGHT//2, size=150, expression="happy", action="phone", progress=scene_progress)
-            
-            # Show login screen on the right side
-            login_progress = max(0, min(1.0, (scene_progress - 0.3) * 1.4))  # Start at 0.3 seconds
-            if login_progress > 0:
-                login_x = WIDTH//2 + 50
-                login_y = HEIGHT//2 - 200
-                login_width = 350
-                login_height = 400
-                
-                draw_app_login(draw, login_x, login_y, login_width, login_height, login_progress)
-            
-            # Mr. Sharma info
-            if scene_progress > 0.6:
-                info_x = 120
-                info_y = HEIGHT//2 - 220
-                
-                draw.rounded_rectangle(
-                    [(info_x, info_y), (info_x + 300, info_y + 180)], 
-                    radius=10, fill=(255, 255, 255, 200), outline=(220, 220, 230)
-                )
-                
-                draw.text(
-                    (info_x + 150, info_y + 30), 
-                    "Mr. Sharma", 
-                    font=heading_font, fill=TEXT_COLOR, anchor="mm"
-                )
-                
-                details = [
-                    "• F&O Trader for 7 years",
-                    "• Portfolio Value: ₹1.5 crore",
-                    "• Typical Positions: 8-12",
-                    "• Trading Approach: Swing",
-                ]
-                
-                for i, detail in enumerate(details):
-                    draw.text(
-                        (info_x + 20, info_y + 70 + i*25), 
-                        detail, 
-                        font=regular_font, fill=TEXT_COLOR
-                    )
-            
-        elif scene == 2:
-            # Broker Authorization scene
-            # Draw Mr. Sharma character using phone
-            draw_businessman(draw, WIDTH//4, HEIGHT//2, size=150, expression="thinking", action="phone", progress=scene_progress)
-            
-            # Authorization screen on the right
-            auth_x = WIDTH//2 + 50
-            auth_y = HEIGHT//2 - 200
-            auth_width = 350
-            auth_height = 400
-            
-            draw_broker_auth_screen(draw, auth_x, auth_y, auth_width, auth_height, scene_progress)
+    Returns:
+        Image: Opaque chart area, to be pasted at the chart's top-left corner
+    """
+    grid = Image.new('RGB', (width + 1, height + 1))
+    draw = ImageDraw.Draw(grid)
+    
+    draw.rectangle(
+        [(0, 0), (width, height)],
+        fill=(250, 250, 255), outline=(220, 220, 230)
+    )
+    
+    # Gridlines at the axis labels, 0% to 100% of the height
+    for i in range(6):
+        line_y = height - (i * height // 5)
+        draw.line([(0, line_y), (width, line_y)], fill=(230, 230, 240))
+    return grid
+
+@functools.lru_cache(maxsize=32)
+def _render_capital_freed_chart(x, y, width, height, bars):
+    """
+    Rasterize the scene 9 chart area with its gridlines and first few daily bars
+    
+    Args:
+        x (int): Left edge of the chart on the frame
+        y (int): Top edge of the chart on the frame
+        width (int): Chart width
+        height (int): Chart height
+        bars (int): Number of days of CAPITAL_FREED shown so far
+        
+    Returns:
+        Image: Opaque chart area, to be pasted at the chart's top-left corner
+    """
+    chart = _render_chart_grid(width, height).copy()
+    draw = ImageDraw.Draw(chart)
+    
+    bar_width = (width - 30) / 30  # 30 days
+    for i in range(bars):
+        # Fractional edges are computed on the frame and then shifted, so they round as they would there
+        bar_height = (CAPITAL_FREED[i] / 15) * height
+        bar_x = x + 15 + (i * bar_width) - x
+        bar_y = y + height - bar_height - y
+        
+        # Current day highlight (day 9, Tuesday of current week)
+        bar_color = HIGHLIGHT_COLOR if i == 18 else (100, 150, 250)
+        
+        draw.rectangle(
+            [(bar_x, bar_y), (bar_x + bar_width - 1, height)],
+            fill=bar_color
+        )
+    return chart
+
+@functools.lru_cache(maxsize=None)
+def _render_scene_background(scene):
+    """
+    Render the part of a scene's frames that stays the same for the whole scene
+    
+    Args:
+        scene (int): Scene number, a key of SCENE_TITLES
+        
+    Returns:
+        Image: The background with the scene's title, narration and static panels drawn on it
+    """
+    if scene == 10:
+        # The conclusion gradient covers the whole frame, title and narration included
+        canvas = CONCLUSION_BACKGROUND.copy()
+        draw = ImageDraw.Draw(canvas)
+        
+        draw.text((WIDTH//2, 150), "AI Margin Optimizer", font=FONTS[36], fill=(255, 255, 255), anchor="mm")
+        draw.text((WIDTH//2, 200), "Your Capital, Unleashed", font=FONTS[20], fill=(220, 220, 255), anchor="mm")
+        return canvas
+    
+    canvas = BACKGROUND.copy()
+    draw = ImageDraw.Draw(canvas)
+    
+    # Scene title
+    draw.text((WIDTH//2, 90), SCENE_TITLES[scene], font=FONTS[28], fill=(20, 30, 70), anchor="mm")
+    
+    # Narration box
+    draw.rounded_rectangle(
+        [(100, HEIGHT - 100), (WIDTH - 100, HEIGHT - 30)], 
+        radius=10, fill=(0, 0, 0)
+    )
+    
+    draw.text(
+        (WIDTH//2, HEIGHT - 65), 
+        NARRATIONS[scene], 
+        font=FONTS[20], fill=(255, 255, 255), anchor="mm"
+    )
+    
+    # Panels and labels that stay put for the whole scene
+    if scene == 6:
+        draw_trading_platform_panel(canvas, draw)
+    elif scene == 7:
+        draw_week_calendar(canvas, draw)
+    elif scene == 8:
+        draw_review_dashboard(canvas, draw, "Weekly Performance Review", "Week:", WEEK_TABS, 1, 100)
+    elif scene == 9:
+        draw_review_dashboard(canvas, draw, "Monthly ROI Analysis", "Month:", MONTH_TABS, 2, 120)
+    return canvas
+
+def generate_demo_frame(frame_num, total_frames):
+    """Generate a single frame for the detailed Mr. Sharma demo video"""
+    # Determine which scene to show based on frame number, 6 seconds each
+    scene = min(frame_num // SCENE_FRAMES + 1, len(SCENE_TITLES))
+    
+    # Start from the scene's prebuilt background, title and narration
+    img = _render_scene_background(scene).copy()
+    draw = ImageDraw.Draw(img)
+
+    title_font = FONTS[36]
+    heading_font = FONTS[28]
+    regular_font = FONTS[20]
+    small_font = FONTS[16]
+
+    # Calculate scene-specific progress (0-1)
+    scene_frame = frame_num - (scene - 1) * SCENE_FRAMES
+    scene_progress = scene_frame / SCENE_FRAMES
+    
+    # Draw scene content based on the current scene
+    if scene == 1:
+        # Introduction & Login scene
+        # Draw Mr. Sharma character
+        character_progress = min(1.0, scene_progress * 2)  # 0-0.5 seconds
+        if character_progress < 1:
+            # Character entering animation
+            x_pos = int(WIDTH//4 - 200 + (character_progress * 200))
+            draw_businessman(img, x_pos, HEIGHT//2, size=150, expression="happy", action="idle", frame=scene_frame)
+        else:
+            # Character using phone animation
+            draw_businessman(img, WIDTH//4, HEIGHT//2, size=150, expression="happy", action="phone", frame=scene_frame)
+        
+        # Show login screen on the right side
+        login_progress = max(0, min(1.0, (scene_progress - 0.3) * 1.4))  # Start at 0.3 seconds
+        if login_progress > 0:
+            login_x = WIDTH//2 + 50
+            login_y = HEIGHT//2 - 200
+            login_width = 350
+            login_height = 400
+            
+            draw_app_login(img, login_x, login_y, login_width, login_height, login_progress)
+        
+        # Mr. Sharma info
+        if scene_progress > 0.6:
+            draw_info_card(
+                img, 120, HEIGHT//2 - 220, 300, 180, (220, 220, 230),
+                "Mr. Sharma", SHARMA_DETAILS, 20, 25
+            )
+        
+    elif scene == 2:
+        # Broker Authorization scene
+        # Draw Mr. Sharma character using phone
+        draw_businessman(img, WIDTH//4, HEIGHT//2, size=150, expression="thinking", action="phone", frame=scene_frame)
+        
+        # Authorization screen on the right
+        auth_x = WIDTH//2 + 50
+        auth_y = HEIGHT//2 - 200
+        auth_width = 350
+        auth_height = 400
+        
+        draw_broker_auth_screen(img, auth_x, auth_y, auth_width, auth_height, scene_progress)
+        
+        # Security info near character
+        if scene_progress > 0.5:
+            draw_info_card(
+                img, 100, HEIGHT//2 - 220, 320, 150, HIGHLIGHT_COLOR,
+                "Secure Connection", SECURITY_POINTS, 16, 20
+            )
+        
+    elif scene == 3:
+        # Dashboard Overview scene
+        # Draw main dashboard layout
+        dashboard_x = 80
+        dashboard_y = 130
+        dashboard_width = WIDTH - 160
+        dashboard_height = HEIGHT - 250
+        
+        # Dashboard background
+        draw.rounded_rectangle(
+            [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + dashboard_height)],
+            radius=10, fill=(250, 250, 255), outline=(220, 220, 230), width=1
+        )
+        
+        # Dashboard header
+        paste_text(
+            img, (dashboard_x + 20, dashboard_y + 20),
+            "Tuesday, April 9, 2025 | 9:15 AM",
+            font=regular_font, fill=TEXT_COLOR
+        )
+        
+        # Account summary section
+        # Animation progress for each dashboard element
+        card_progress = min(1.0, scene_progress * 2)
+        
+        # Portfolio card
+        card_width = 280
+        card_height = 120
+        card_x = dashboard_x + 30
+        card_y = dashboard_y + 60
+        
+        draw_dashboard_element(
+            img, card_x, card_y, card_width, card_height,
+            "Portfolio Value", "₹1,50,00,000",
+            subtitle="Last updated: Today, 9:00 AM",
+            progress=card_progress
+        )
+        
+        # Current Margin card (highlighted)
+        card_x = card_x + card_width + 30
+        
+        draw_dashboard_element(
+            img, card_x, card_y, card_width, card_height,
+            "Current Margin", "₹42,00,000",
+            subtitle="Last updated: Today, 9:00 AM",
+            highlight=True,
+            highlight_text="Optimization available!",
+            progress=card_progress
+        )
+        
+        # Optimized Margin card
+        card_x = card_x + card_width + 30
+        
+        draw_dashboard_element(
+            img, card_x, card_y, card_width, card_height,
+            "Optimized Margin", "₹30,00,000",
+            subtitle="Potential Savings: ₹12,00,000",
+            highlight=True,
+            highlight_text="85% Confidence",
+            progress=card_progress
+        )
+        
+        # AI Confidence meter
+        confidence_x = dashboard_x + 30
+        confidence_y = card_y + card_height + 30
+        confidence_width = card_width
+        confidence_height = 100
+        
+        # Only show if far enough in the animation
+        if card_progress > 0.5:
+            draw_confidence_meter(
+                img, confidence_x, confidence_y, confidence_width, confidence_height,
+                confidence=0.85, progress=(card_progress - 0.5) * 2
+            )
+        
+        # News section
+        news_x = confidence_x + confidence_width + 30
+        news_y = confidence_y
+        news_width = dashboard_width - confidence_width - 60
+        news_height = dashboard_height - (card_height + 30) - 150
+        
+        # News section header
+        if card_progress > 0.6:
+            paste_text(
+                img, (news_x, news_y),
+                "Recent Market News",
+                font=heading_font, fill=TEXT_COLOR
+            )
             
-            # Security info near character
-            if scene_progress > 0.5:
-                info_x = 100
-                info_y = HEIGHT//2 - 220
-                
-                draw.rounded_rectangle(
-                    [(info_x, info_y), (info_x + 320, info_y + 150)], 
-                    radius=10, fill=(255, 255, 255, 200), outline=HIGHLIGHT_COLOR
-                )
-                
-                draw.text(
-                    (info_x + 160, info_y + 30), 
-                    "Secure Connection", 
-                    font=heading_font, fill=TEXT_COLOR, anchor="mm"
-                )
-                
-                security_points = [
-                    "• Read-only access",
-                    "• Bank-level encryption",
-                    "• No trading permissions",
-                    "• Revokable anytime"
-                ]
-                
-                for i, point in enumerate(security_points):
-                    draw.text(
-                        (info_x + 20, info_y + 70 + i*20), 
-                        point, 
-                        font=small_font, fill=TEXT_COLOR
+            # News items
+            for i, news in enumerate(NEWS_ITEMS):
+                # Only show news if it's time in the animation
+                if card_progress > 0.6 + (i * 0.1):
+                    news_item_y = news_y + 40 + (i * 110)
+                    
+                    draw_news_item(
+                        img, news_x, news_item_y, news_width,
+                        news["title"], news["summary"], news["sentiment"],
+                        progress=(card_progress - 0.6 - (i * 0.1)) * 10
                     )
+        
+        # Action buttons
+        if card_progress > 0.8:
+            button_y = dashboard_y + dashboard_height - 80
+            button_width = 200
+            button_height = 50
+            button_gap = 30
             
-        elif scene == 3:
-            # Dashboard Overview scene
-            # Draw main dashboard layout
-            dashboard_x = 80
-            dashboard_y = 130
-            dashboard_width = WIDTH - 160
-            dashboard_height = HEIGHT - 250
+            # "View Details" button - highlighted
+            button_x = dashboard_x + dashboard_width//2 - button_width - button_gap//2
             
-            # Dashboard background
             draw.rounded_rectangle(
-                [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + dashboard_height)],
-                radius=10, fill=(250, 250, 255), outline=(220, 220, 230), width=1
+                [(button_x, button_y), (button_x + button_width, button_y + button_height)],
+                radius=25, fill=HIGHLIGHT_COLOR
             )
             
-            # Dashboard header
-            draw.text(
-                (dashboard_x + 20, dashboard_y + 20),
-                "Tuesday, April 9, 2025 | 9:15 AM",
-                font=regular_font, fill=TEXT_COLOR
+            paste_text(
+                img, (button_x + button_width//2, button_y + button_height//2),
+                "View Details",
+                font=regular_font, fill=(255, 255, 255), anchor="mm"
             )
             
-            # Account summary section
-            # Animation progress for each dashboard element
-            card_progress = min(1.0, scene_progress * 2)
-            
-            # Portfolio card
-            card_width = 280
-            card_height = 120
-            card_x = dashboard_x + 30
-            card_y = dashboard_y + 60
-            
-            draw_dashboard_element(
-                draw, card_x, card_y, card_width, card_height,
-                "Portfolio Value", "₹1,50,00,000",
-                subtitle="Last updated: Today, 9:00 AM",
-                progress=card_progress
+            # "Review Later" button
+            button_x = dashboard_x + dashboard_width//2 + button_gap//2
+            
+            draw.rounded_rectangle(
+                [(button_x, button_y), (button_x + button_width, button_y + button_height)],
+                radius=25, fill=(240, 240, 240)
             )
             
-            # Current Margin card (highlighted)
-            card_x = card_x + card_width + 30
+            paste_text(
+                img, (button_x + button_width//2, button_y + button_height//2),
+                "Review Later",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
+            )
+        
+        # Mr. Sharma checking his phone animation
+        if scene_progress > 0.7:
+            # Draw small character at bottom right
+            draw_businessman(
+                img, WIDTH - 100, HEIGHT - 150, 
+                size=100, expression="happy", action="phone", 
+                frame=scene_frame
+            )
+        
+    elif scene == 4:
+        # Understanding the Recommendation scene
+        # Draw recommendation detail screen
+        detail_x = 80
+        detail_y = 130
+        detail_width = WIDTH - 160
+        detail_height = HEIGHT - 250
+        
+        # Screen background
+        draw.rounded_rectangle(
+            [(detail_x, detail_y), (detail_x + detail_width, detail_y + detail_height)],
+            radius=10, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR, width=2
+        )
+        
+        # Screen header
+        draw.rectangle(
+            [(detail_x, detail_y), (detail_x + detail_width, detail_y + 50)],
+            fill=HIGHLIGHT_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + detail_width//2, detail_y + 25),
+            "Margin Optimization Details",
+            font=heading_font, fill=(255, 255, 255), anchor="mm"
+        )
+        
+        # Current vs Optimized summary
+        summary_y = detail_y + 70
+        
+        paste_text(
+            img, (detail_x + 50, summary_y),
+            "Current Margin:",
+            font=regular_font, fill=TEXT_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + 350, summary_y),
+            "₹42,00,000",
+            font=heading_font, fill=TEXT_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + 50, summary_y + 40),
+            "Optimized Margin:",
+            font=regular_font, fill=TEXT_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + 350, summary_y + 40),
+            "₹30,00,000",
+            font=heading_font, fill=POSITIVE_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + 50, summary_y + 80),
+            "Potential Savings:",
+            font=regular_font, fill=TEXT_COLOR
+        )
+        
+        paste_text(
+            img, (detail_x + 350, summary_y + 80),
+            "₹12,00,000",
+            font=heading_font, fill=POSITIVE_COLOR
+        )
+        
+        # Divider
+        draw.line(
+            [(detail_x + 20, summary_y + 130), (detail_x + detail_width - 20, summary_y + 130)],
+            fill=(220, 220, 230), width=1
+        )
+        
+        # Optimization factors
+        factors_y = summary_y + 150
+        factors_x = detail_x + 30
+        factors_width = detail_width//2 - 60
+        factors_height = 300
+        
+        # Only show if far enough in the animation
+        if scene_progress > 0.3:
+            draw_optimization_factors(
+                img, factors_x, factors_y, factors_width, factors_height,
+                OPTIMIZATION_FACTORS, progress=(scene_progress - 0.3) * 1.5
+            )
+        
+        # Factor visualization on right side
+        if scene_progress > 0.5:
+            visual_x = factors_x + factors_width + 30
+            visual_y = factors_y
+            visual_width = factors_width
+            visual_height = factors_height
+            
+            # Background for visualization
+            draw.rounded_rectangle(
+                [(visual_x, visual_y), (visual_x + visual_width, visual_y + visual_height)],
+                radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
+            )
             
-            draw_dashboard_element(
-                draw, card_x, card_y, card_width, card_height,
-                "Current Margin", "₹42,00,000",
-                subtitle="Last updated: Today, 9:00 AM",
-                highlight=True,
-                highlight_text="Optimization available!",
-                progress=card_progress
+            # Title
+            paste_text(
+                img, (visual_x + visual_width//2, visual_y + 20),
+                "Optimization Factors",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
             )
             
-            # Optimized Margin card
-            card_x = card_x + card_width + 30
+            # Radar chart visualization
+            chart_x = visual_x + visual_width//2
+            chart_y = visual_y + visual_height//2
+            chart_radius = min(visual_width, visual_height)//2 - 40
             
-            draw_dashboard_element(
-                draw, card_x, card_y, card_width, card_height,
-                "Optimized Margin", "₹30,00,000",
-                subtitle="Potential Savings: ₹12,00,000",
-                highlight=True,
-                highlight_text="85% Confidence",
-                progress=card_progress
-            )
+            # Draw chart axes
+            for axis_end in radar_points(np.ones(len(RADAR_ANGLES)), chart_x, chart_y, chart_radius):
+                draw.line([(chart_x, chart_y), axis_end], fill=(200, 200, 200), width=1)
             
-            # AI Confidence meter
-            confidence_x = dashboard_x + 30
-            confidence_y = card_y + card_height + 30
-            confidence_width = card_width
-            confidence_height = 100
-            
-            # Only show if far enough in the animation
-            if card_progress > 0.5:
-                draw_confidence_meter(
-                    draw, confidence_x, confidence_y, confidence_width, confidence_height,
-                    confidence=0.85, progress=(card_progress - 0.5) * 2
+            # Draw circular guidelines
+            for r in range(chart_radius//3, chart_radius+1, chart_radius//3):
+                draw.ellipse(
+                    [(chart_x - r, chart_y - r), (chart_x + r, chart_y + r)], 
+                    outline=(200, 200, 200)
                 )
             
-            # News section
-            news_x = confidence_x + confidence_width + 30
-            news_y = confidence_y
-            news_width = dashboard_width - confidence_width - 60
-            news_height = dashboard_height - (card_height + 30) - 150
-            
-            # News section header
-            if card_progress > 0.6:
-                draw.text(
-                    (news_x, news_y),
-                    "Recent Market News",
-                    font=heading_font, fill=TEXT_COLOR
-                )
-                
-                # News items
-                news_items = [
-                    {
-                        "title": "RELIANCE: Q1 Results Beat Expectations",
-                        "summary": "Reliance Industries reported 15% higher profits than analyst consensus.",
-                        "sentiment": "positive"
-                    },
-                    {
-                        "title": "RBI Maintains Interest Rate in Policy Meeting",
-                        "summary": "The central bank kept repo rate unchanged at 6.5%, in line with expectations.",
-                        "sentiment": "neutral"
-                    },
-                    {
-                        "title": "Banking Sector Volatility Decreases to 2-Month Low",
-                        "summary": "HDFC Bank and peers show stabilizing price movements after recent turbulence.",
-                        "sentiment": "positive"
-                    }
-                ]
-                
-                for i, news in enumerate(news_items):
-                    # Only show news if it's time in the animation
-                    if card_progress > 0.6 + (i * 0.1):
-                        news_item_y = news_y + 40 + (i * 110)
-                        
-                        draw_news_item(
-                            draw, news_x, news_item_y, news_width,
-                            news["title"], news["summary"], news["sentiment"],
-                            progress=(card_progress - 0.6 - (i * 0.1)) * 10
-                        )
+            # Animate the drawing of the radar chart
+            progress_factor = min(1.0, (scene_progress - 0.5) * 2)
+            animated_values = RADAR_FACTOR_VALUES * progress_factor
+            
+            # Draw data points and connect them
+            points = radar_points(animated_values, chart_x, chart_y, chart_radius)
+            labels = radar_points(np.ones(len(RADAR_ANGLES)), chart_x, chart_y, chart_radius + 20)
+            for i, (point_x, point_y) in enumerate(points):
+                # Draw point
+                draw_dot(img, (point_x, point_y), 5, HIGHLIGHT_COLOR)
+                
+                # Draw factor name
+                paste_text(img, labels[i], RADAR_FACTOR_NAMES[i], font=small_font, fill=TEXT_COLOR, anchor="mm")
+            
+            # Connect points to form polygon
+            if len(points) > 2:
+                points.append(points[0])  # Close the shape
+                # Separate calls, since Pillow skips an outline that matches the fill
+                draw.polygon(points, fill=HIGHLIGHT_COLOR)
+                draw.polygon(points, outline=HIGHLIGHT_COLOR)
+        
+        # Mr. Sharma reviewing with thinking expression
+        if scene_progress > 0.7:
+            draw_businessman(
+                img, 150, HEIGHT - 150, 
+                size=100, expression="thinking", action="tablet", 
+                frame=scene_frame
+            )
+        
+    elif scene == 5:
+        # Taking Action scene
+        # Draw action steps screen
+        steps_x = 100
+        steps_y = 130
+        steps_width = WIDTH - 200
+        steps_height = HEIGHT - 250
+        
+        # Steps with animation based on progress
+        draw_step_instructions(img, steps_x, steps_y, steps_width, steps_height, ACTION_STEPS, scene_progress)
+        
+        # Clock showing time progression
+        if scene_progress > 0.6:
+            clock_x = WIDTH - 150
+            clock_y = HEIGHT - 200
+            
+            # Clock circle
+            draw.ellipse([(clock_x - 60, clock_y - 60), (clock_x + 60, clock_y + 60)], outline=TEXT_COLOR, width=2)
+            
+            # Time label
+            paste_text(img, (clock_x, clock_y - 80), "Time", font=regular_font, fill=TEXT_COLOR, anchor="mm")
+            
+            # Clock hands animation
+            minute_progress = min(1.0, (scene_progress - 0.6) / 0.4)  # Animate from 9:15 to 9:30
+            
+            # Hour hand (pointing near 9, where the minute hand would be at 45)
+            hour_cos, hour_sin = CLOCK_DIRECTIONS[45]
+            hour_length = 30
+            hx = clock_x + int(hour_length * hour_cos)
+            hy = clock_y - int(hour_length * hour_sin)
+            draw.line([(clock_x, clock_y), (hx, hy)], fill=TEXT_COLOR, width=3)
+            
+            # Minute hand (animating from 15 to 30 minutes)
+            minute = 15 + int(minute_progress * 15)
+            minute_cos, minute_sin = CLOCK_DIRECTIONS[minute]
+            minute_length = 45
+            mx = clock_x + int(minute_length * minute_cos)
+            my = clock_y - int(minute_length * minute_sin)
+            draw.line([(clock_x, clock_y), (mx, my)], fill=HIGHLIGHT_COLOR, width=2)
+            
+            # Show time text
+            paste_text(img, (clock_x, clock_y + 80), f"9:{minute} AM", font=regular_font, fill=HIGHLIGHT_COLOR, anchor="mm")
+        
+        # Mr. Sharma taking action
+        if scene_progress > 0.3:
+            draw_businessman(
+                img, 200, HEIGHT - 160, 
+                size=120, expression="excited" if scene_progress > 0.8 else "thinking", 
+                action="phone", 
+                frame=scene_frame
+            )
             
-            # Action buttons
-            if card_progress > 0.8:
-                button_y = dashboard_y + dashboard_height - 80
-                button_width = 200
-                button_height = 50
-                button_gap = 30
-                
-                # "View Details" button - highlighted
-                button_x = dashboard_x + dashboard_width//2 - button_width - button_gap//2
+            # Show freed capital callout if near end of scene
+            if scene_progress > 0.8:
+                callout_x = 350
+                callout_y = HEIGHT - 250
                 
                 draw.rounded_rectangle(
-                    [(button_x, button_y), (button_x + button_width, button_y + button_height)],
-                    radius=25, fill=HIGHLIGHT_COLOR
+                    [(callout_x, callout_y), (callout_x + 300, callout_y + 100)],
+                    radius=10, fill=POSITIVE_COLOR, outline=(20, 110, 60), width=2
                 )
                 
-                draw.text(
-                    (button_x + button_width//2, button_y + button_height//2),
-                    "View Details",
-                    font=regular_font, fill=(255, 255, 255), anchor="mm"
-                )
-                
-                # "Review Later" button
-                button_x = dashboard_x + dashboard_width//2 + button_gap//2
-                
-                draw.rounded_rectangle(
-                    [(button_x, button_y), (button_x + button_width, button_y + button_height)],
-                    radius=25, fill=(240, 240, 240)
+                paste_text(
+                    img, (callout_x + 150, callout_y + 30),
+                    "Capital Freed!",
+                    font=heading_font, fill=(255, 255, 255), anchor="mm"
                 )
                 
-                draw.text(
-                    (button_x + button_width//2, button_y + button_height//2),
-                    "Review Later",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                )
-            
-            # Mr. Sharma checking his phone animation
-            if scene_progress > 0.7:
-                # Draw small character at bottom right
-                draw_businessman(
-                    draw, WIDTH - 100, HEIGHT - 150, 
-                    size=100, expression="happy", action="phone", 
-                    progress=scene_progress
+                paste_text(
+                    img, (callout_x + 150, callout_y + 70),
+                    "₹12,00,000",
+                    font=title_font, fill=(255, 255, 255), anchor="mm"
                 )
-            
-        elif scene == 4:
-            # Understanding the Recommendation scene
-            # Draw recommendation detail screen
-            detail_x = 80
-            detail_y = 130
-            detail_width = WIDTH - 160
-            detail_height = HEIGHT - 250
-            
-            # Screen background
-            draw.rounded_rectangle(
-                [(detail_x, detail_y), (detail_x + detail_width, detail_y + detail_height)],
-                radius=10, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR, width=2
-            )
-            
-            # Screen header
-            draw.rectangle(
-                [(detail_x, detail_y), (detail_x + detail_width, detail_y + 50)],
-                fill=HIGHLIGHT_COLOR
-            )
-            
-            draw.text(
-                (detail_x + detail_width//2, detail_y + 25),
-                "Margin Optimization Details",
-                font=heading_font, fill=(255, 255, 255), anchor="mm"
-            )
-            
-            # Current vs Optimized summary
-            summary_y = detail_y + 70
-            
-            draw.text(
-                (detail_x + 50, summary_y),
-                "Current Margin:",
-                font=regular_font, fill=TEXT_COLOR
+        
+    elif scene == 6:
+        # New Opportunity scene
+        # Split screen - trading platform on left, opportunity details on right
+        # The platform panel itself is part of the scene background
+        platform_x, platform_y, platform_width, platform_height = PLATFORM_BOX
+        
+        # Stock details
+        if scene_progress > 0.2:
+            details_y = platform_y + 60
+            
+            paste_text(
+                img, (platform_x + 20, details_y),
+                "CIPLA - Cipla Ltd.",
+                font=regular_font, fill=(220, 220, 220)
             )
             
-            draw.text(
-                (detail_x + 350, summary_y),
-                "₹42,00,000",
-                font=heading_font, fill=TEXT_COLOR
+            # Current price with positive movement
+            price_y = details_y + 40
+            paste_text(
+                img, (platform_x + 20, price_y),
+                "Current Price:",
+                font=small_font, fill=(180, 180, 180)
             )
             
-            draw.text(
-                (detail_x + 50, summary_y + 40),
-                "Optimized Margin:",
-                font=regular_font, fill=TEXT_COLOR
+            paste_text(
+                img, (platform_x + 150, price_y),
+                "₹1,245.60",
+                font=regular_font, fill=(220, 220, 220)
             )
             
-            draw.text(
-                (detail_x + 350, summary_y + 40),
-                "₹30,00,000",
-                font=heading_font, fill=POSITIVE_COLOR
+            paste_text(
+                img, (platform_x + 250, price_y),
+                "▲ 3.2%",
+                font=regular_font, fill=POSITIVE_COLOR
             )
             
-            draw.text(
-                (detail_x + 50, summary_y + 80),
-                "Potential Savings:",
-                font=regular_font, fill=TEXT_COLOR
+            # News alert
+            news_y = price_y + 40
+            draw.rounded_rectangle(
+                [(platform_x + 20, news_y), (platform_x + platform_width - 20, news_y + 80)],
+                radius=5, fill=(40, 50, 60)
             )
             
-            draw.text(
-                (detail_x + 350, summary_y + 80),
-                "₹12,00,000",
-                font=heading_font, fill=POSITIVE_COLOR
+            paste_text(
+                img, (platform_x + 35, news_y + 15),
+                "NEWS: Cipla receives USFDA approval for new drug",
+                font=small_font, fill=(220, 220, 40)
             )
             
-            # Divider
-            draw.line(
-                [(detail_x + 20, summary_y + 130), (detail_x + detail_width - 20, summary_y + 130)],
-                fill=(220, 220, 230), width=1
+            paste_text(
+                img, (platform_x + 35, news_y + 45),
+                "The pharmaceutical company announced positive\nPhase III trial results for its flagship drug.",
+                font=small_font, fill=(200, 200, 200)
             )
             
-            # Optimization factors
-            factors_y = summary_y + 150
-            factors_x = detail_x + 30
-            factors_width = detail_width//2 - 60
-            factors_height = 300
-            
-            # Only show if far enough in the animation
-            if scene_progress > 0.3:
-                optimization_factors = [
-                    ("News Sentiment", 5.2, "Positive news for RELIANCE and HDFC"),
-                    ("Market Correlation", 3.8, "Decreased correlation between positions"),
-                    ("Sector Volatility", 4.5, "Banking sector volatility stabilized")
-                ]
-                
-                draw_optimization_factors(
-                    draw, factors_x, factors_y, factors_width, factors_height,
-                    optimization_factors, progress=(scene_progress - 0.3) * 1.5
-                )
-            
-            # Factor visualization on right side
-            if scene_progress > 0.5:
-                visual_x = factors_x + factors_width + 30
-                visual_y = factors_y
-                visual_width = factors_width
-                visual_height = factors_height
-                
-                # Background for visualization
-                draw.rounded_rectangle(
-                    [(visual_x, visual_y), (visual_x + visual_width, visual_y + visual_height)],
-                    radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
-                )
-                
-                # Title
-                draw.text(
-                    (visual_x + visual_width//2, visual_y + 20),
-                    "Optimization Factors",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                )
-                
-                # Radar chart visualization
-                chart_x = visual_x + visual_width//2
-                chart_y = visual_y + visual_height//2
-                chart_radius = min(visual_width, visual_height)//2 - 40
-                
-                # Draw chart axes
-                for angle in range(0, 360, 72):  # 5 axes at 72 degrees each
-                    rad = np.radians(angle)
-                    end_x = chart_x + int(chart_radius * np.cos(rad))
-                    end_y = chart_y + int(chart_radius * np.sin(rad))
-                    draw.line([(chart_x, chart_y), (end_x, end_y)], fill=(200, 200, 200), width=1)
-                
-                # Draw circular guidelines
-                for r in range(chart_radius//3, chart_radius+1, chart_radius//3):
-                    draw.ellipse(
-                        [(chart_x - r, chart_y - r), (chart_x + r, chart_y + r)], 
-                        outline=(200, 200, 200)
-                    )
-                
-                # Factor values (scale 0-1)
-                factor_values = [0.8, 0.9, 0.75, 0.65, 0.85]  # Market, News, Volatility, Correlation, Macro
-                factor_names = ["Market", "News", "Volatility", "Correlation", "Macro"]
-                
-                # Animate the drawing of the radar chart
-                progress_factor = min(1.0, (scene_progress - 0.5) * 2)
-                animated_values = [v * progress_factor for v in factor_values]
-                
-                # Draw data points and connect them
-                points = []
-                for i, value in enumerate(animated_values):
-                    angle = np.radians(i * 72)
-                    point_distance = value * chart_radius
-                    point_x = chart_x + int(point_distance * np.cos(angle))
-                    point_y = chart_y + int(point_distance * np.sin(angle))
-                    points.append((point_x, point_y))
-                    
-                    # Draw point
-                    draw.ellipse([(point_x-5, point_y-5), (point_x+5, point_y+5)], fill=HIGHLIGHT_COLOR)
-                    
-                    # Draw factor name
-                    label_distance = chart_radius + 20
-                    label_x = chart_x + int(label_distance * np.cos(angle))
-                    label_y = chart_y + int(label_distance * np.sin(angle))
-                    draw.text((label_x, label_y), factor_names[i], font=small_font, fill=TEXT_COLOR, anchor="mm")
-                
-                # Connect points to form polygon
-                if len(points) > 2:
-                    points.append(points[0])  # Close the shape
-                    draw.polygon(points, fill=(13, 110, 253, 100), outline=HIGHLIGHT_COLOR)
-            
-            # Mr. Sharma reviewing with thinking expression
-            if scene_progress > 0.7:
-                draw_businessman(
-                    draw, 150, HEIGHT - 150, 
-                    size=100, expression="thinking", action="tablet", 
-                    progress=scene_progress
+            # Buy order section
+            if scene_progress > 0.4:
+                order_y = news_y + 100
+                paste_text(
+                    img, (platform_x + 20, order_y),
+                    "New Position:",
+                    font=regular_font, fill=(220, 220, 220)
                 )
-            
-        elif scene == 5:
-            # Taking Action scene
-            # Draw action steps screen
-            steps_x = 100
-            steps_y = 130
-            steps_width = WIDTH - 200
-            steps_height = HEIGHT - 250
-            
-            # Steps with animation based on progress
-            steps = [
-                (1, "Navigate to Margins section in Zerodha Kite", None),
-                (2, "Update margin values for these positions:", [
-                    "• RELIANCE JUN FUT: Reduce from ₹4,25,000 to ₹3,40,000",
-                    "• HDFCBANK JUN FUT: Reduce from ₹3,80,000 to ₹2,85,000",
-                    "• NIFTY 19500 CALL: Reduce from ₹2,50,000 to ₹1,80,000"
-                ]),
-                (3, "Confirm adjustments by clicking 'Update Margins'", None),
-                (4, "Verify new margin requirement is updated", None)
-            ]
-            
-            draw_step_instructions(draw, steps_x, steps_y, steps_width, steps_height, steps, scene_progress)
-            
-            # Clock showing time progression
-            if scene_progress > 0.6:
-                clock_x = WIDTH - 150
-                clock_y = HEIGHT - 200
-                
-                # Clock circle
-                draw.ellipse([(clock_x - 60, clock_y - 60), (clock_x + 60, clock_y + 60)], outline=TEXT_COLOR, width=2)
-                
-                # Time label
-                draw.text((clock_x, clock_y - 80), "Time", font=regular_font, fill=TEXT_COLOR, anchor="mm")
                 
-                # Clock hands animation
-                minute_progress = min(1.0, (scene_progress - 0.6) / 0.4)  # Animate from 9:15 to 9:30
+                # Order details
+                draw_text_lines(img, (platform_x + 40, order_y + 35), ORDER_DETAILS, small_font, (200, 200, 200), 25)
                 
-                # Hour hand (pointing near 9)
-                angle = np.pi/2 - (9/12) * 2*np.pi
-                hour_length = 30
-                hx = clock_x + int(hour_length * np.cos(angle))
-                hy = clock_y - int(hour_length * np.sin(angle))
-                draw.line([(clock_x, clock_y), (hx, hy)], fill=TEXT_COLOR, width=3)
-                
-                # Minute hand (animating from 15 to 30 minutes)
-                minute = 15 + int(minute_progress * 15)
-                angle = np.pi/2 - (minute/60) * 2*np.pi
-                minute_length = 45
-                mx = clock_x + int(minute_length * np.cos(angle))
-                my = clock_y - int(minute_length * np.sin(angle))
-                draw.line([(clock_x, clock_y), (mx, my)], fill=HIGHLIGHT_COLOR, width=2)
-                
-                # Show time text
-                draw.text((clock_x, clock_y + 80), f"9:{minute} AM", font=regular_font, fill=HIGHLIGHT_COLOR, anchor="mm")
-            
-            # Mr. Sharma taking action
-            if scene_progress > 0.3:
-                draw_businessman(
-                    draw, 200, HEIGHT - 160, 
-                    size=120, expression="excited" if scene_progress > 0.8 else "thinking", 
-                    action="phone", 
-                    progress=scene_progress
-                )
-                
-                # Show freed capital callout if near end of scene
-                if scene_progress > 0.8:
-                    callout_x = 350
-                    callout_y = HEIGHT - 250
+                # Buy button animation
+                if scene_progress > 0.6:
+                    button_status = "Processing..." if scene_progress < 0.8 else "Order Executed!"
+                    button_color = (200, 120, 20) if scene_progress < 0.8 else POSITIVE_COLOR
                     
                     draw.rounded_rectangle(
-                        [(callout_x, callout_y), (callout_x + 300, callout_y + 100)],
-                        radius=10, fill=POSITIVE_COLOR, outline=(20, 110, 60), width=2
-                    )
-                    
-                    draw.text(
-                        (callout_x + 150, callout_y + 30),
-                        "Capital Freed!",
-                        font=heading_font, fill=(255, 255, 255), anchor="mm"
+                        [(platform_x + 100, order_y + 180), (platform_x + platform_width - 100, order_y + 220)],
+                        radius=5, fill=button_color
                     )
                     
-                    draw.text(
-                        (callout_x + 150, callout_y + 70),
-                        "₹12,00,000",
-                        font=title_font, fill=(255, 255, 255), anchor="mm"
+                    paste_text(
+                        img, (platform_x + platform_width//2, order_y + 200),
+                        button_status,
+                        font=regular_font, fill=(255, 255, 255), anchor="mm"
                     )
-            
-        elif scene == 6:
-            # New Opportunity scene
-            # Split screen - trading platform on left, opportunity details on right
-            platform_x = 80
-            platform_y = 130
-            platform_width = WIDTH//2 - 100
-            platform_height = HEIGHT - 250
-            
-            # Trading platform panel
+        
+        # Opportunity details on right
+        opportunity_x = platform_x + platform_width + 40
+        opportunity_y = platform_y
+        opportunity_width = platform_width
+        opportunity_height = platform_height
+        
+        if scene_progress > 0.5:
+            # Background
             draw.rounded_rectangle(
-                [(platform_x, platform_y), (platform_x + platform_width, platform_y + platform_height)],
-                radius=10, fill=(30, 40, 50), outline=(50, 60, 70)
+                [(opportunity_x, opportunity_y), (opportunity_x + opportunity_width, opportunity_y + opportunity_height)],
+                radius=10, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR, width=2
             )
             
-            # Platform header
+            # Header
             draw.rectangle(
-                [(platform_x, platform_y), (platform_x + platform_width, platform_y + 40)],
-                fill=(50, 60, 70)
+                [(opportunity_x, opportunity_y), (opportunity_x + opportunity_width, opportunity_y + 50)],
+                fill=HIGHLIGHT_COLOR
             )
             
-            draw.text(
-                (platform_x + platform_width//2, platform_y + 20),
-                "Trading Platform",
-                font=regular_font, fill=(220, 220, 220), anchor="mm"
+            paste_text(
+                img, (opportunity_x + opportunity_width//2, opportunity_y + 25),
+                "Opportunity Analysis",
+                font=heading_font, fill=(255, 255, 255), anchor="mm"
             )
             
-            # Stock details
-            if scene_progress > 0.2:
-                details_y = platform_y + 60
-                
-                draw.text(
-                    (platform_x + 20, details_y),
-                    "CIPLA - Cipla Ltd.",
-                    font=regular_font, fill=(220, 220, 220)
-                )
-                
-                # Current price with positive movement
-                price_y = details_y + 40
-                draw.text(
-                    (platform_x + 20, price_y),
-                    "Current Price:",
-                    font=small_font, fill=(180, 180, 180)
-                )
-                
-                draw.text(
-                    (platform_x + 150, price_y),
-                    "₹1,245.60",
-                    font=regular_font, fill=(220, 220, 220)
-                )
-                
-                draw.text(
-                    (platform_x + 250, price_y),
-                    "▲ 3.2%",
-                    font=regular_font, fill=POSITIVE_COLOR
-                )
-                
-                # News alert
-                news_y = price_y + 40
-                draw.rounded_rectangle(
-                    [(platform_x + 20, news_y), (platform_x + platform_width - 20, news_y + 80)],
-                    radius=5, fill=(40, 50, 60)
-                )
-                
-                draw.text(
-                    (platform_x + 35, news_y + 15),
-                    "NEWS: Cipla receives USFDA approval for new drug",
-                    font=small_font, fill=(220, 220, 40)
-                )
-                
-                draw.text(
-                    (platform_x + 35, news_y + 45),
-                    "The pharmaceutical company announced positive\nPhase III trial results for its flagship drug.",
-                    font=small_font, fill=(200, 200, 200)
-                )
-                
-                # Buy order section
-                if scene_progress > 0.4:
-                    order_y = news_y + 100
-                    draw.text(
-                        (platform_x + 20, order_y),
-                        "New Position:",
-                        font=regular_font, fill=(220, 220, 220)
-                    )
-                    
-                    # Order details
-                    details = [
-                        "Symbol: CIPLA JUN FUT",
-                        "Quantity: 2000",
-                        "Price: ₹1,248.25",
-                        f"Total Value: ₹{int(1248.25 * 2000):,}",
-                        f"Margin Required: ₹{int(11.5 * 100000):,}"
-                    ]
-                    
-                    for i, detail in enumerate(details):
-                        draw.text(
-                            (platform_x + 40, order_y + 35 + i*25),
-                            detail,
-                            font=small_font, fill=(200, 200, 200)
-                        )
-                    
-                    # Buy button animation
-                    if scene_progress > 0.6:
-                        button_status = "Processing..." if scene_progress < 0.8 else "Order Executed!"
-                        button_color = (200, 120, 20) if scene_progress < 0.8 else POSITIVE_COLOR
-                        
-                        draw.rounded_rectangle(
-                            [(platform_x + 100, order_y + 180), (platform_x + platform_width - 100, order_y + 220)],
-                            radius=5, fill=button_color
-                        )
-                        
-                        draw.text(
-                            (platform_x + platform_width//2, order_y + 200),
-                            button_status,
-                            font=regular_font, fill=(255, 255, 255), anchor="mm"
-                        )
+            # Financial details
+            details_y = opportunity_y + 70
             
-            # Opportunity details on right
-            opportunity_x = platform_x + platform_width + 40
-            opportunity_y = platform_y
-            opportunity_width = platform_width
-            opportunity_height = platform_height
+            # Source of capital
+            paste_text(
+                img, (opportunity_x + 20, details_y),
+                "Source of Capital:",
+                font=regular_font, fill=TEXT_COLOR
+            )
             
-            if scene_progress > 0.5:
-                # Background
-                draw.rounded_rectangle(
-                    [(opportunity_x, opportunity_y), (opportunity_x + opportunity_width, opportunity_y + opportunity_height)],
-                    radius=10, fill=(255, 255, 255), outline=HIGHLIGHT_COLOR, width=2
-                )
+            paste_text(
+                img, (opportunity_x + opportunity_width - 20, details_y),
+                "Margin Optimization",
+                font=regular_font, fill=HIGHLIGHT_COLOR, anchor="ra"
+            )
+            
+            # Capital available
+            paste_text(
+                img, (opportunity_x + 20, details_y + 40),
+                "Capital Available:",
+                font=regular_font, fill=TEXT_COLOR
+            )
+            
+            paste_text(
+                img, (opportunity_x + opportunity_width - 20, details_y + 40),
+                "₹12,00,000",
+                font=regular_font, fill=POSITIVE_COLOR, anchor="ra"
+            )
+            
+            # Opportunity details
+            if scene_progress > 0.7:
+                analysis_y = details_y + 90
                 
-                # Header
-                draw.rectangle(
-                    [(opportunity_x, opportunity_y), (opportunity_x + opportunity_width, opportunity_y + 50)],
-                    fill=HIGHLIGHT_COLOR
+                paste_text(
+                    img, (opportunity_x + opportunity_width//2, analysis_y),
+                    "Opportunity Details",
+                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
                 )
                 
-                draw.text(
-                    (opportunity_x + opportunity_width//2, opportunity_y + 25),
-                    "Opportunity Analysis",
-                    font=heading_font, fill=(255, 255, 255), anchor="mm"
-                )
+                # Reasons to enter trade
+                reasons_y = analysis_y + 40
                 
-                # Financial details
-                details_y = opportunity_y + 70
+                draw_text_lines(img, (opportunity_x + 30, reasons_y), TRADE_REASONS, small_font, TEXT_COLOR, 25)
                 
-                # Source of capital
-                draw.text(
-                    (opportunity_x + 20, details_y),
-                    "Source of Capital:",
+                # Expected return
+                return_y = reasons_y + len(TRADE_REASONS)*25 + 30
+                
+                paste_text(
+                    img, (opportunity_x + 20, return_y),
+                    "Expected Return:",
                     font=regular_font, fill=TEXT_COLOR
                 )
                 
-                draw.text(
-                    (opportunity_x + opportunity_width - 20, details_y),
-                    "Margin Optimization",
-                    font=regular_font, fill=HIGHLIGHT_COLOR, anchor="ra"
+                paste_text(
+                    img, (opportunity_x + opportunity_width - 20, return_y),
+                    "+4-6% (5 days)",
+                    font=regular_font, fill=POSITIVE_COLOR, anchor="ra"
                 )
                 
-                # Capital available
-                draw.text(
-                    (opportunity_x + 20, details_y + 40),
-                    "Capital Available:",
+                # Risk
+                paste_text(
+                    img, (opportunity_x + 20, return_y + 40),
+                    "Risk Level:",
                     font=regular_font, fill=TEXT_COLOR
                 )
                 
-                draw.text(
-                    (opportunity_x + opportunity_width - 20, details_y + 40),
-                    "₹12,00,000",
-                    font=regular_font, fill=POSITIVE_COLOR, anchor="ra"
+                paste_text(
+                    img, (opportunity_x + opportunity_width - 20, return_y + 40),
+                    "Medium",
+                    font=regular_font, fill=HIGHLIGHT_COLOR, anchor="ra"
                 )
+        
+        # Mr. Sharma excited about opportunity
+        if scene_progress > 0.7:
+            draw_businessman(
+                img, WIDTH//2, HEIGHT - 160,
+                size=120, expression="excited", action="pointing",
+                frame=scene_frame
+            )
+        
+    elif scene == 7:
+        # End of Week Results scene
+        # Week calendar with profit results
+        # The calendar, day headers and dates are part of the scene background
+        calendar_x, calendar_y, calendar_width, calendar_height = CALENDAR_BOX
+        day_width = calendar_width / len(WEEKDAYS)
+        
+        for i in range(len(WEEKDAYS)):
+            day_x = calendar_x + (i * day_width)
+            
+            # Day events/milestones
+            if scene_progress > 0.3:
+                events_y = calendar_y + 140
                 
-                # Opportunity details
-                if scene_progress > 0.7:
-                    analysis_y = details_y + 90
-                    
-                    draw.text(
-                        (opportunity_x + opportunity_width//2, analysis_y),
-                        "Opportunity Details",
-                        font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                    )
-                    
-                    # Reasons to enter trade
-                    reasons_y = analysis_y + 40
-                    
-                    reasons = [
-                        "• FDA approval for key drug (positive catalyst)",
-                        "• Technical breakout above resistance",
-                        "• Sector rotation into pharmaceuticals",
-                        "• Low implied volatility relative to historical"
-                    ]
-                    
-                    for i, reason in enumerate(reasons):
-                        draw.text(
-                            (opportunity_x + 30, reasons_y + i*25),
-                            reason,
-                            font=small_font, fill=TEXT_COLOR
-                        )
-                    
-                    # Expected return
-                    return_y = reasons_y + len(reasons)*25 + 30
-                    
-                    draw.text(
-                        (opportunity_x + 20, return_y),
-                        "Expected Return:",
-                        font=regular_font, fill=TEXT_COLOR
+                if i == 1:  # Tuesday
+                    # Margin optimization day
+                    draw.rounded_rectangle(
+                        [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
+                        radius=5, fill=(230, 240, 255), outline=HIGHLIGHT_COLOR
                     )
                     
-                    draw.text(
-                        (opportunity_x + opportunity_width - 20, return_y),
-                        "+4-6% (5 days)",
-                        font=regular_font, fill=POSITIVE_COLOR, anchor="ra"
+                    paste_text(
+                        img, (day_x + day_width//2, events_y + 15),
+                        "Margin Optimization",
+                        font=small_font, fill=TEXT_COLOR, anchor="mm"
                     )
                     
-                    # Risk
-                    draw.text(
-                        (opportunity_x + 20, return_y + 40),
-                        "Risk Level:",
-                        font=regular_font, fill=TEXT_COLOR
+                    paste_text(
+                        img, (day_x + day_width//2, events_y + 40),
+                        "₹12,00,000 freed",
+                        font=regular_font, fill=HIGHLIGHT_COLOR, anchor="mm"
                     )
                     
-                    draw.text(
-                        (opportunity_x + opportunity_width - 20, return_y + 40),
-                        "Medium",
-                        font=regular_font, fill=HIGHLIGHT_COLOR, anchor="ra"
-                    )
-            
-            # Mr. Sharma excited about opportunity
-            if scene_progress > 0.7:
-                draw_businessman(
-                    draw, WIDTH//2, HEIGHT - 160,
-                    size=120, expression="excited", action="pointing",
-                    progress=scene_progress
-                )
-            
-        elif scene == 7:
-            # End of Week Results scene
-            # Week calendar with profit results
-            calendar_x = 100
-            calendar_y = 130
-            calendar_width = WIDTH - 200
-            calendar_height = HEIGHT - 300
-            
-            # Calendar background
-            draw.rounded_rectangle(
-                [(calendar_x, calendar_y), (calendar_x + calendar_width, calendar_y + calendar_height)],
-                radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=2
-            )
-            
-            # Header
-            draw.rectangle(
-                [(calendar_x, calendar_y), (calendar_x + calendar_width, calendar_y + 50)],
-                fill=HIGHLIGHT_COLOR
-            )
-            
-            draw.text(
-                (calendar_x + calendar_width//2, calendar_y + 25),
-                "Week of April 8-12, 2025",
-                font=heading_font, fill=(255, 255, 255), anchor="mm"
-            )
-            
-            # Days of week
-            days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-            day_width = calendar_width / len(days)
-            
-            for i, day in enumerate(days):
-                day_x = calendar_x + (i * day_width)
-                
-                # Highlight Friday
-                if i == 4:
-                    # Highlight background for Friday
-                    draw.rectangle(
-                        [(day_x, calendar_y + 50), (day_x + day_width, calendar_y + calendar_height)],
-                        fill=(250, 255, 250)
-                    )
-                
-                # Day header
-                draw.rectangle(
-                    [(day_x, calendar_y + 50), (day_x + day_width, calendar_y + 90)],
-                    fill=(240, 240, 250)
-                )
+                    # New position entry
+                    if scene_progress > 0.4:
+                        position_y = events_y + 80
+                        
+                        draw.rounded_rectangle(
+                            [(day_x + 10, position_y), (day_x + day_width - 10, position_y + 60)],
+                            radius=5, fill=(230, 240, 255), outline=HIGHLIGHT_COLOR
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, position_y + 15),
+                            "New Position",
+                            font=small_font, fill=TEXT_COLOR, anchor="mm"
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, position_y + 40),
+                            "CIPLA JUN FUT",
+                            font=regular_font, fill=TEXT_COLOR, anchor="mm"
+                        )
                 
-                draw.text(
-                    (day_x + day_width//2, calendar_y + 70),
-                    day,
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                )
+                elif i == 2:  # Wednesday
+                    if scene_progress > 0.5:
+                        # Price movement day 1
+                        draw.rounded_rectangle(
+                            [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
+                            radius=5, fill=(240, 255, 240), outline=(200, 230, 200)
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 15),
+                            "CIPLA Position",
+                            font=small_font, fill=TEXT_COLOR, anchor="mm"
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 40),
+                            "+₹18,000",
+                            font=regular_font, fill=POSITIVE_COLOR, anchor="mm"
+                        )
                 
-                # Date
-                draw.text(
-                    (day_x + day_width//2, calendar_y + 110),
-                    f"April {i+8}",
-                    font=small_font, fill=TEXT_COLOR, anchor="mm"
-                )
+                elif i == 3:  # Thursday
+                    if scene_progress > 0.6:
+                        # Price movement day 2
+                        draw.rounded_rectangle(
+                            [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
+                            radius=5, fill=(240, 255, 240), outline=(200, 230, 200)
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 15),
+                            "CIPLA Position",
+                            font=small_font, fill=TEXT_COLOR, anchor="mm"
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 40),
+                            "+₹27,000",
+                            font=regular_font, fill=POSITIVE_COLOR, anchor="mm"
+                        )
                 
-                # Day events/milestones
-                if scene_progress > 0.3:
-                    events_y = calendar_y + 140
-                    
-                    if i == 1:  # Tuesday
-                        # Margin optimization day
+                elif i == 4:  # Friday
+                    if scene_progress > 0.7:
+                        # Final result day
+                        draw.rounded_rectangle(
+                            [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
+                            radius=5, fill=(230, 255, 230), outline=(150, 200, 150), width=2
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 15),
+                            "CIPLA Position",
+                            font=small_font, fill=TEXT_COLOR, anchor="mm"
+                        )
+                        
+                        paste_text(
+                            img, (day_x + day_width//2, events_y + 40),
+                            "+₹65,000",
+                            font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
+                        )
+                        
+                        # Return calculation
+                        calc_y = events_y + 90
+                        
                         draw.rounded_rectangle(
-                            [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
-                            radius=5, fill=(230, 240, 255), outline=HIGHLIGHT_COLOR
+                            [(day_x + 10, calc_y), (day_x + day_width - 10, calc_y + 90)],
+                            radius=5, fill=(255, 255, 240), outline=(220, 210, 180)
                         )
                         
-                        draw.text(
-                            (day_x + day_width//2, events_y + 15),
-                            "Margin Optimization",
+                        paste_text(
+                            img, (day_x + day_width//2, calc_y + 20),
+                            "Return on Margin",
                             font=small_font, fill=TEXT_COLOR, anchor="mm"
                         )
                         
-                        draw.text(
-                            (day_x + day_width//2, events_y + 40),
-                            "₹12,00,000 freed",
-                            font=regular_font, fill=HIGHLIGHT_COLOR, anchor="mm"
+                        paste_text(
+                            img, (day_x + day_width//2, calc_y + 50),
+                            "5.65%",
+                            font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
                         )
                         
-                        # New position entry
-                        if scene_progress > 0.4:
-                            position_y = events_y + 80
-                            
-                            draw.rounded_rectangle(
-                                [(day_x + 10, position_y), (day_x + day_width - 10, position_y + 60)],
-                                radius=5, fill=(230, 240, 255), outline=HIGHLIGHT_COLOR
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, position_y + 15),
-                                "New Position",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, position_y + 40),
-                                "CIPLA JUN FUT",
-                                font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                    
-                    elif i == 2:  # Wednesday
-                        if scene_progress > 0.5:
-                            # Price movement day 1
-                            draw.rounded_rectangle(
-                                [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
-                                radius=5, fill=(240, 255, 240), outline=(200, 230, 200)
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 15),
-                                "CIPLA Position",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 40),
-                                "+₹18,000",
-                                font=regular_font, fill=POSITIVE_COLOR, anchor="mm"
-                            )
-                    
-                    elif i == 3:  # Thursday
-                        if scene_progress > 0.6:
-                            # Price movement day 2
-                            draw.rounded_rectangle(
-                                [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
-                                radius=5, fill=(240, 255, 240), outline=(200, 230, 200)
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 15),
-                                "CIPLA Position",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 40),
-                                "+₹27,000",
-                                font=regular_font, fill=POSITIVE_COLOR, anchor="mm"
-                            )
-                    
-                    elif i == 4:  # Friday
-                        if scene_progress > 0.7:
-                            # Final result day
-                            draw.rounded_rectangle(
-                                [(day_x + 10, events_y), (day_x + day_width - 10, events_y + 60)],
-                                radius=5, fill=(230, 255, 230), outline=(150, 200, 150), width=2
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 15),
-                                "CIPLA Position",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, events_y + 40),
-                                "+₹65,000",
-                                font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
-                            )
-                            
-                            # Return calculation
-                            calc_y = events_y + 90
-                            
-                            draw.rounded_rectangle(
-                                [(day_x + 10, calc_y), (day_x + day_width - 10, calc_y + 90)],
-                                radius=5, fill=(255, 255, 240), outline=(220, 210, 180)
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, calc_y + 20),
-                                "Return on Margin",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, calc_y + 50),
-                                "5.65%",
-                                font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
-                            )
-                            
-                            draw.text(
-                                (day_x + day_width//2, calc_y + 75),
-                                "(4 days)",
-                                font=small_font, fill=TEXT_COLOR, anchor="mm"
-                            )
-            
-            # Total week summary
-            if scene_progress > 0.8:
-                summary_y = calendar_y + calendar_height + 20
-                
-                draw.rounded_rectangle(
-                    [(calendar_x, summary_y), (calendar_x + calendar_width, summary_y + 80)],
-                    radius=10, fill=POSITIVE_COLOR, outline=(25, 120, 70), width=2
-                )
-                
-                draw.text(
-                    (calendar_x + 30, summary_y + 25),
-                    "Weekly Profit from Optimized Margin:",
-                    font=heading_font, fill=(255, 255, 255)
-                )
-                
-                draw.text(
-                    (calendar_x + calendar_width - 30, summary_y + 25),
-                    "+₹65,000",
-                    font=heading_font, fill=(255, 255, 255), anchor="ra"
-                )
-                
-                draw.text(
-                    (calendar_x + calendar_width - 30, summary_y + 60),
-                    "Capital that would otherwise be sitting idle",
-                    font=regular_font, fill=(255, 255, 255), anchor="ra"
-                )
-            
-            # Mr. Sharma happy with results
-            if scene_progress > 0.5:
-                draw_businessman(
-                    draw, WIDTH - 150, HEIGHT - 150,
-                    size=120, expression="excited", action="thumbsup",
-                    progress=scene_progress
-                )
-            
-        elif scene == 8:
-            # Weekly Performance Review scene
-            # Dashboard with charts
-            dashboard_x = 80
-            dashboard_y = 130
-            dashboard_width = WIDTH - 160
-            dashboard_height = HEIGHT - 250
+                        paste_text(
+                            img, (day_x + day_width//2, calc_y + 75),
+                            "(4 days)",
+                            font=small_font, fill=TEXT_COLOR, anchor="mm"
+                        )
+        
+        # Total week summary
+        if scene_progress > 0.8:
+            summary_y = calendar_y + calendar_height + 20
             
-            # Dashboard background
             draw.rounded_rectangle(
-                [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + dashboard_height)],
-                radius=10, fill=(250, 250, 255), outline=(220, 220, 230), width=1
+                [(calendar_x, summary_y), (calendar_x + calendar_width, summary_y + 80)],
+                radius=10, fill=POSITIVE_COLOR, outline=(25, 120, 70), width=2
             )
             
-            # Dashboard header
-            draw.rectangle(
-                [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + 50)],
-                fill=HIGHLIGHT_COLOR
+            paste_text(
+                img, (calendar_x + 30, summary_y + 25),
+                "Weekly Profit from Optimized Margin:",
+                font=heading_font, fill=(255, 255, 255)
             )
             
-            draw.text(
-                (dashboard_x + dashboard_width//2, dashboard_y + 25),
-                "Weekly Performance Review",
-                font=heading_font, fill=(255, 255, 255), anchor="mm"
+            paste_text(
+                img, (calendar_x + calendar_width - 30, summary_y + 25),
+                "+₹65,000",
+                font=heading_font, fill=(255, 255, 255), anchor="ra"
             )
             
-            # Week selector
-            week_y = dashboard_y + 70
-            
-            draw.text(
-                (dashboard_x + 30, week_y),
-                "Week:",
-                font=regular_font, fill=TEXT_COLOR
+            paste_text(
+                img, (calendar_x + calendar_width - 30, summary_y + 60),
+                "Capital that would otherwise be sitting idle",
+                font=regular_font, fill=(255, 255, 255), anchor="ra"
             )
+        
+        # Mr. Sharma happy with results
+        if scene_progress > 0.5:
+            draw_businessman(
+                img, WIDTH - 150, HEIGHT - 150,
+                size=120, expression="excited", action="thumbsup",
+                frame=scene_frame
+            )
+        
+    elif scene == 8:
+        # Weekly Performance Review scene
+        # Dashboard with charts
+        # The dashboard and week selector are part of the scene background
+        dashboard_x, dashboard_y, dashboard_width, dashboard_height = REVIEW_BOX
+        week_y = dashboard_y + 70
+        
+        # Performance metrics
+        if scene_progress > 0.3:
+            metrics_y = week_y + 50
+            metric_width = (dashboard_width - 60) // 3
+            metric_height = 100
             
-            weeks = ["Apr 1-5", "Apr 8-12", "Apr 15-19", "Apr 22-26"]
-            week_width = 100
-            week_x = dashboard_x + 100
-            
-            for i, week in enumerate(weeks):
-                week_fill = HIGHLIGHT_COLOR if i == 1 else (240, 240, 240)
-                week_text = (255, 255, 255) if i == 1 else TEXT_COLOR
+            for i, metric in enumerate(WEEKLY_METRICS):
+                metric_x = dashboard_x + 30 + (i * metric_width)
                 
                 draw.rounded_rectangle(
-                    [(week_x + i*week_width, week_y - 10), (week_x + (i+1)*week_width - 5, week_y + 25)],
-                    radius=5, fill=week_fill
+                    [(metric_x, metrics_y), (metric_x + metric_width - 30, metrics_y + metric_height)],
+                    radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
                 )
                 
-                draw.text(
-                    (week_x + i*week_width + week_width//2, week_y + 7),
-                    week,
-                    font=small_font, fill=week_text, anchor="mm"
+                paste_text(
+                    img, (metric_x + 20, metrics_y + 20),
+                    metric["title"],
+                    font=regular_font, fill=TEXT_COLOR
                 )
-            
-            # Performance metrics
-            if scene_progress > 0.3:
-                metrics_y = week_y + 50
-                metric_width = (dashboard_width - 60) // 3
-                metric_height = 100
                 
-                metrics = [
-                    {
-                        "title": "Margin Optimization",
-                        "value": "₹12,00,000",
-                        "subtitle": "Capital Freed",
-                        "color": HIGHLIGHT_COLOR
-                    },
-                    {
-                        "title": "Additional Profit",
-                        "value": "₹65,000",
-                        "subtitle": "From New Position",
-                        "color": POSITIVE_COLOR
-                    },
-                    {
-                        "title": "Return on Margin",
-                        "value": "5.65%",
-                        "subtitle": "4 Trading Days",
-                        "color": POSITIVE_COLOR
-                    }
-                ]
+                paste_text(
+                    img, (metric_x + 20, metrics_y + 60),
+                    metric["value"],
+                    font=heading_font, fill=metric["color"]
+                )
                 
-                for i, metric in enumerate(metrics):
-                    metric_x = dashboard_x + 30 + (i * metric_width)
-                    
-                    draw.rounded_rectangle(
-                        [(metric_x, metrics_y), (metric_x + metric_width - 30, metrics_y + metric_height)],
-                        radius=10, fill=(255, 255, 255), outline=(220, 220, 230), width=1
-                    )
-                    
-                    draw.text(
-                        (metric_x + 20, metrics_y + 20),
-                        metric["title"],
-                        font=regular_font, fill=TEXT_COLOR
-                    )
-                    
-                    draw.text(
-                        (metric_x + 20, metrics_y + 60),
-                        metric["value"],
-                        font=heading_font, fill=metric["color"]
-                    )
-                    
-                    draw.text(
-                        (metric_x + 20, metrics_y + 85),
-                        metric["subtitle"],
-                        font=small_font, fill=NEUTRAL_COLOR
-                    )
+                paste_text(
+                    img, (metric_x + 20, metrics_y + 85),
+                    metric["subtitle"],
+                    font=small_font, fill=NEUTRAL_COLOR
+                )
+        
+        # Weekly chart
+        if scene_progress > 0.5:
+            chart_y = metrics_y + 120
+            chart_height = 200
+            chart_x = dashboard_x + 50
+            chart_width = dashboard_width - 100
+            chart_top = chart_y + 30
+            chart_bottom = chart_top + chart_height
+            
+            # Chart title
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, chart_y),
+                "Daily Margin Efficiency",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
+            )
+            
+            # Chart background and gridlines
+            img.paste(_render_chart_grid(chart_width, chart_height), (chart_x, chart_top))
             
-            # Weekly chart
-            if scene_progress > 0.5:
-                chart_y = metrics_y + 120
-                chart_height = 200
-                chart_x = dashboard_x + 50
-                chart_width = dashboard_width - 100
+            # Chart axes
+            # Y-axis
+            for i in range(6):
+                y_pos = chart_bottom - (i * chart_height // 5)
                 
-                # Chart title
-                draw.text(
-                    (dashboard_x + dashboard_width//2, chart_y),
-                    "Daily Margin Efficiency",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
+                # Y-axis label
+                paste_text(
+                    img, (chart_x - 10, y_pos),
+                    PERCENT_AXIS_LABELS[i],
+                    font=small_font, fill=TEXT_COLOR, anchor="ra"
                 )
-                
-                # Chart background
-                draw.rectangle(
-                    [(chart_x, chart_y + 30), (chart_x + chart_width, chart_y + 30 + chart_height)],
-                    fill=(250, 250, 255), outline=(220, 220, 230)
+            
+            # X-axis (days), with each day's center shared by its label and data point
+            day_width = chart_width / len(WEEKDAYS)
+            day_centers = [chart_x + (i * day_width) + (day_width / 2) for i in range(len(WEEKDAYS))]
+            
+            for x_pos, day in zip(day_centers, WEEKDAYS):
+                paste_text(
+                    img, (x_pos, chart_bottom + 15),
+                    day,
+                    font=small_font, fill=TEXT_COLOR, anchor="mm"
                 )
+            
+            # Data points
+            # Animate data points appearing
+            progress_points = int(min(5, max(0, scene_progress - 0.5) * 10))
+            
+            points = []
+            for i in range(min(progress_points, len(MARGIN_EFFICIENCY))):
+                x_pos = day_centers[i]
+                y_pos = chart_bottom - (MARGIN_EFFICIENCY[i] * chart_height / 100)
                 
-                # Chart axes
-                # Y-axis
-                for i in range(6):
-                    y_pos = chart_y + 30 + chart_height - (i * chart_height // 5)
-                    
-                    # Horizontal gridline
-                    draw.line(
-                        [(chart_x, y_pos), (chart_x + chart_width, y_pos)],
-                        fill=(230, 230, 240)
-                    )
-                    
-                    # Y-axis label
-                    label = f"{i * 20}%"
-                    draw.text(
-                        (chart_x - 10, y_pos),
-                        label,
-                        font=small_font, fill=TEXT_COLOR, anchor="ra"
-                    )
-                
-                # X-axis (days)
-                days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
-                day_width = chart_width / len(days)
-                
-                for i, day in enumerate(days):
-                    x_pos = chart_x + (i * day_width) + (day_width / 2)
-                    
-                    draw.text(
-                        (x_pos, chart_y + 30 + chart_height + 15),
-                        day,
-                        font=small_font, fill=TEXT_COLOR, anchor="mm"
-                    )
-                
-                # Data points
-                # Animate data points appearing
-                progress_points = int(min(5, max(0, scene_progress - 0.5) * 10))
-                
-                efficiency_values = [10, 85, 82, 80, 78]  # Percentage of margin efficiency
-                
-                points = []
-                for i in range(min(progress_points, len(efficiency_values))):
-                    x_pos = chart_x + (i * day_width) + (day_width / 2)
-                    y_pos = chart_y + 30 + chart_height - (efficiency_values[i] * chart_height / 100)
-                    
-                    points.append((x_pos, y_pos))
-                    
-                    # Draw point
-                    point_color = POSITIVE_COLOR if efficiency_values[i] > 50 else NEUTRAL_COLOR
-                    draw.ellipse(
-                        [(x_pos - 5, y_pos - 5), (x_pos + 5, y_pos + 5)],
-                        fill=point_color
-                    )
-                    
-                    # Value label
-                    draw.text(
-                        (x_pos, y_pos - 15),
-                        f"{efficiency_values[i]}%",
-                        font=small_font, fill=point_color, anchor="mm"
-                    )
+                points.append((x_pos, y_pos))
                 
-                # Connect points with lines
-                if len(points) > 1:
-                    for i in range(len(points) - 1):
-                        draw.line(
-                            [points[i], points[i+1]],
-                            fill=HIGHLIGHT_COLOR, width=2
-                        )
+                # Draw point
+                point_color = POSITIVE_COLOR if MARGIN_EFFICIENCY[i] > 50 else NEUTRAL_COLOR
+                draw_dot(img, (x_pos, y_pos), 5, point_color)
                 
-                # Highlight Tuesday's jump
-                if progress_points >= 2:
-                    tuesday_x = chart_x + day_width + (day_width / 2)
-                    tuesday_y = chart_y + 30 + chart_height - (efficiency_values[1] * chart_height / 100)
-                    
-                    # Draw vertical line to highlight the jump
-                    draw.line(
-                        [(tuesday_x, chart_y + 30 + chart_height), (tuesday_x, tuesday_y)],
-                        fill=(255, 220, 150, 150), width=10
-                    )
-                    
-                    # Callout
-                    callout_y = tuesday_y - 60
-                    
-                    draw.rounded_rectangle(
-                        [(tuesday_x - 100, callout_y), (tuesday_x + 100, callout_y + 40)],
-                        radius=5, fill=HIGHLIGHT_COLOR
-                    )
-                    
-                    draw.text(
-                        (tuesday_x, callout_y + 20),
-                        "AI Optimization Applied",
-                        font=small_font, fill=(255, 255, 255), anchor="mm"
-                    )
+                # Value label
+                paste_text(
+                    img, (x_pos, y_pos - 15),
+                    MARGIN_EFFICIENCY_LABELS[i],
+                    font=small_font, fill=point_color, anchor="mm"
+                )
             
-            # Analysis conclusion
-            if scene_progress > 0.8:
-                conclusion_y = chart_y + chart_height + 60
+            # Connect points with lines, as one polyline
+            if len(points) > 1:
+                draw.line(points, fill=HIGHLIGHT_COLOR, width=2)
+            
+            # Highlight Tuesday's jump
+            if progress_points >= 2:
+                tuesday_x, tuesday_y = points[1]
                 
-                draw.rounded_rectangle(
-                    [(dashboard_x + 50, conclusion_y), (dashboard_x + dashboard_width - 50, conclusion_y + 80)],
-                    radius=10, fill=(240, 255, 240), outline=POSITIVE_COLOR
+                # Draw vertical line to highlight the jump
+                draw.line(
+                    [(tuesday_x, chart_bottom), (tuesday_x, tuesday_y)],
+                    fill=(255, 220, 150), width=10
                 )
                 
-                draw.text(
-                    (dashboard_x + dashboard_width//2, conclusion_y + 20),
-                    "Weekly Performance Summary",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                )
+                # Callout
+                callout_y = tuesday_y - 60
                 
-                draw.text(
-                    (dashboard_x + dashboard_width//2, conclusion_y + 50),
-                    "The AI optimization on Tuesday freed up significant capital, resulting in 75% higher margin efficiency",
-                    font=small_font, fill=TEXT_COLOR, anchor="mm"
+                draw.rounded_rectangle(
+                    [(tuesday_x - 100, callout_y), (tuesday_x + 100, callout_y + 40)],
+                    radius=5, fill=HIGHLIGHT_COLOR
                 )
-            
-            # Mr. Sharma reviewing performance
-            if scene_progress > 0.7:
-                draw_businessman(
-                    draw, 150, HEIGHT - 150,
-                    size=100, expression="thinking", action="tablet",
-                    progress=scene_progress
+                
+                paste_text(
+                    img, (tuesday_x, callout_y + 20),
+                    "AI Optimization Applied",
+                    font=small_font, fill=(255, 255, 255), anchor="mm"
                 )
+        
+        # Analysis conclusion
+        if scene_progress > 0.8:
+            conclusion_y = chart_y + chart_height + 60
             
-        elif scene == 9:
-            # Monthly ROI Calculation scene
-            # Dashboard with charts
-            dashboard_x = 80
-            dashboard_y = 130
-            dashboard_width = WIDTH - 160
-            dashboard_height = HEIGHT - 250
-            
-            # Dashboard background
             draw.rounded_rectangle(
-                [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + dashboard_height)],
-                radius=10, fill=(250, 250, 255), outline=(220, 220, 230), width=1
+                [(dashboard_x + 50, conclusion_y), (dashboard_x + dashboard_width - 50, conclusion_y + 80)],
+                radius=10, fill=(240, 255, 240), outline=POSITIVE_COLOR
             )
             
-            # Dashboard header
-            draw.rectangle(
-                [(dashboard_x, dashboard_y), (dashboard_x + dashboard_width, dashboard_y + 50)],
-                fill=HIGHLIGHT_COLOR
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, conclusion_y + 20),
+                "Weekly Performance Summary",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
             )
             
-            draw.text(
-                (dashboard_x + dashboard_width//2, dashboard_y + 25),
-                "Monthly ROI Analysis",
-                font=heading_font, fill=(255, 255, 255), anchor="mm"
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, conclusion_y + 50),
+                "The AI optimization on Tuesday freed up significant capital, resulting in 75% higher margin efficiency",
+                font=small_font, fill=TEXT_COLOR, anchor="mm"
             )
-            
-            # Month selector
-            month_y = dashboard_y + 70
-            
-            draw.text(
-                (dashboard_x + 30, month_y),
-                "Month:",
-                font=regular_font, fill=TEXT_COLOR
+        
+        # Mr. Sharma reviewing performance
+        if scene_progress > 0.7:
+            draw_businessman(
+                img, 150, HEIGHT - 150,
+                size=100, expression="thinking", action="tablet",
+                frame=scene_frame
+            )
+        
+    elif scene == 9:
+        # Monthly ROI Calculation scene
+        # Dashboard with charts
+        # The dashboard and month selector are part of the scene background
+        dashboard_x, dashboard_y, dashboard_width, dashboard_height = REVIEW_BOX
+        month_y = dashboard_y + 70
+        
+        # Monthly optimization chart
+        if scene_progress > 0.3:
+            chart_y = month_y + 50
+            chart_height = 200
+            
+            # Chart title
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, chart_y),
+                "Capital Freed by AI Margin Optimizer (April 2025)",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
             )
             
-            months = ["February", "March", "April", "May"]
-            month_width = 120
-            month_x = dashboard_x + 100
+            # Chart background, gridlines and the bars revealed so far
+            chart_x = dashboard_x + 50
+            chart_width = dashboard_width - 100
+            chart_top = chart_y + 30
+            chart_bottom = chart_top + chart_height
+            progress_bars = min(30, int(max(0, scene_progress - 0.3) * 60))
+            
+            img.paste(
+                _render_capital_freed_chart(
+                    chart_x, chart_top, chart_width, chart_height,
+                    min(progress_bars, len(CAPITAL_FREED))
+                ),
+                (chart_x, chart_top)
+            )
             
-            for i, month in enumerate(months):
-                month_fill = HIGHLIGHT_COLOR if i == 2 else (240, 240, 240)
-                month_text = (255, 255, 255) if i == 2 else TEXT_COLOR
+            # Y-axis labels (lakhs)
+            for i in range(6):
+                label_y = chart_bottom - (i * chart_height // 5)
                 
-                draw.rounded_rectangle(
-                    [(month_x + i*month_width, month_y - 10), (month_x + (i+1)*month_width - 5, month_y + 25)],
-                    radius=5, fill=month_fill
-                )
-                
-                draw.text(
-                    (month_x + i*month_width + month_width//2, month_y + 7),
-                    month,
-                    font=small_font, fill=month_text, anchor="mm"
+                paste_text(
+                    img, (chart_x - 10, label_y),
+                    LAKH_AXIS_LABELS[i],
+                    font=small_font, fill=TEXT_COLOR, anchor="ra"
                 )
             
-            # Monthly optimization chart
-            if scene_progress > 0.3:
-                chart_y = month_y + 50
-                chart_height = 200
+            # X-axis (days)
+            for i, label in enumerate(DAY_AXIS_LABELS):
+                label_x = chart_x + (i * chart_width // 4)
                 
-                # Chart title
-                draw.text(
-                    (dashboard_x + dashboard_width//2, chart_y),
-                    "Capital Freed by AI Margin Optimizer (April 2025)",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
-                )
-                
-                # Chart background
-                chart_x = dashboard_x + 50
-                chart_width = dashboard_width - 100
-                
-                draw.rectangle(
-                    [(chart_x, chart_y + 30), (chart_x + chart_width, chart_y + 30 + chart_height)],
-                    fill=(250, 250, 255), outline=(220, 220, 230)
+                paste_text(
+                    img, (label_x, chart_bottom + 15),
+                    label,
+                    font=small_font, fill=TEXT_COLOR, anchor="mm"
                 )
-                
-                # Y-axis labels (lakhs)
-                for i in range(6):
-                    label_y = chart_y + 30 + chart_height - (i * chart_height // 5)
-                    value = i * 3  # 0 to 15 lakhs
+            
+            bar_width = (chart_width - 30) / 30  # 30 days
+            bars_x = chart_x + 15
+            
+            # Weekly averages
+            if scene_progress > 0.6:
+                # Draw week average lines
+                for i, avg in enumerate(WEEKLY_CAPITAL_FREED):
+                    week_start_x = bars_x + (i * 7 * bar_width)
+                    week_end_x = bars_x + ((i+1) * 7 * bar_width) - 1
+                    avg_y = chart_bottom - ((avg / 15) * chart_height)
                     
                     draw.line(
-                        [(chart_x, label_y), (chart_x + chart_width, label_y)],
-                        fill=(230, 230, 240)
-                    )
-                    
-                    draw.text(
-                        (chart_x - 10, label_y),
-                        f"₹{value}L",
-                        font=small_font, fill=TEXT_COLOR, anchor="ra"
-                    )
-                
-                # X-axis (days)
-                for i in range(5):
-                    day = i * 7
-                    label_x = chart_x + (i * chart_width // 4)
-                    
-                    draw.text(
-                        (label_x, chart_y + 30 + chart_height + 15),
-                        f"Day {day}" if day > 0 else "Start",
-                        font=small_font, fill=TEXT_COLOR, anchor="mm"
-                    )
-                
-                # Animate bars appearing
-                progress_bars = min(30, int(max(0, scene_progress - 0.3) * 60))
-                
-                # Bar chart data - capital freed over time
-                # Create some realistic-looking data with the current week having higher values
-                data = [
-                    2.5, 5.8, 3.2, 7.1, 4.3, 3.8, 6.2,  # Week 1
-                    5.5, 4.9, 8.3, 6.7, 7.2, 5.8, 9.1,  # Week 2
-                    7.3, 6.8, 11.5, 8.4, 12.0, 9.3, 10.5,  # Week 3 (current)
-                    8.2, 7.5, 6.4, 5.9, 10.2, 9.7, 8.8,  # Week 4
-                    7.1, 8.3  # Partial Week 5
-                ]
-                
-                # Draw visible bars
-                bar_width = (chart_width - 30) / 30  # 30 days
-                for i in range(min(progress_bars, len(data))):
-                    value = data[i]
-                    
-                    bar_height = (value / 15) * chart_height
-                    bar_x = chart_x + 15 + (i * bar_width)
-                    bar_y = chart_y + 30 + chart_height - bar_height
-                    
-                    # Current day highlight (day 9, Tuesday of current week)
-                    bar_color = HIGHLIGHT_COLOR if i == 18 else (100, 150, 250)
-                    
-                    draw.rectangle(
-                        [(bar_x, bar_y), (bar_x + bar_width - 1, chart_y + 30 + chart_height)],
-                        fill=bar_color
+                        [(week_start_x, avg_y), (week_end_x, avg_y)],
+                        fill=(220, 50, 50), width=2
                     )
-                
-                # Weekly averages
-                if scene_progress > 0.6:
-                    # Group data by week and calculate average
-                    weekly_avgs = []
-                    for w in range(4):  # 4 complete weeks
-                        week_data = data[w*7:(w+1)*7]
-                        avg = sum(week_data) / len(week_data)
-                        weekly_avgs.append(avg)
-                    
-                    # Draw week average lines
-                    for i, avg in enumerate(weekly_avgs):
-                        week_start_x = chart_x + 15 + (i * 7 * bar_width)
-                        week_end_x = chart_x + 15 + ((i+1) * 7 * bar_width) - 1
-                        avg_y = chart_y + 30 + chart_height - ((avg / 15) * chart_height)
-                        
-                        draw.line(
-                            [(week_start_x, avg_y), (week_end_x, avg_y)],
-                            fill=(220, 50, 50), width=2
-                        )
-                        
-                        # Average label
-                        draw.text(
-                            (week_start_x + (3.5 * bar_width), avg_y - 15),
-                            f"Avg: ₹{avg:.1f}L",
-                            font=small_font, fill=(220, 50, 50), anchor="mm"
-                        )
-                
-                # Current week highlight
-                if scene_progress > 0.7:
-                    current_week_x = chart_x + 15 + (2 * 7 * bar_width)
-                    current_week_width = 7 * bar_width
                     
-                    # Semi-transparent highlight for current week
-                    draw.rectangle(
-                        [(current_week_x, chart_y + 30), 
-                         (current_week_x + current_week_width, chart_y + 30 + chart_height)],
-                        fill=(255, 240, 200, 100), outline=(255, 200, 100)
-                    )
-                    
-                    # "Current Week" label
-                    draw.text(
-                        (current_week_x + current_week_width/2, chart_y + 50),
-                        "Current Week",
-                        font=small_font, fill=HIGHLIGHT_COLOR, anchor="mm"
+                    # Average label
+                    paste_text(
+                        img, (week_start_x + (3.5 * bar_width), avg_y - 15),
+                        WEEKLY_CAPITAL_FREED_LABELS[i],
+                        font=small_font, fill=(220, 50, 50), anchor="mm"
                     )
             
-            # Total optimization result
+            # Current week highlight
             if scene_progress > 0.7:
-                total_y = chart_y + chart_height + 50
+                current_week_x = bars_x + (2 * 7 * bar_width)
+                current_week_width = 7 * bar_width
                 
-                draw.rounded_rectangle(
-                    [(dashboard_x + 50, total_y), (dashboard_x + dashboard_width - 50, total_y + 60)],
-                    radius=10, fill=(240, 250, 255), outline=(200, 220, 240)
+                # Semi-transparent highlight for current week
+                draw.rectangle(
+                    [(current_week_x, chart_top), 
+                     (current_week_x + current_week_width, chart_bottom)],
+                    fill=(255, 240, 200), outline=(255, 200, 100)
                 )
                 
-                draw.text(
-                    (dashboard_x + dashboard_width//2, total_y + 30),
-                    "Total Capital Freed This Month: ₹42,00,000",
-                    font=heading_font, fill=HIGHLIGHT_COLOR, anchor="mm"
+                # "Current Week" label
+                paste_text(
+                    img, (current_week_x + current_week_width/2, chart_y + 50),
+                    "Current Week",
+                    font=small_font, fill=HIGHLIGHT_COLOR, anchor="mm"
                 )
+        
+        # Total optimization result
+        if scene_progress > 0.7:
+            total_y = chart_y + chart_height + 50
             
-            # ROI calculation
-            if scene_progress > 0.8:
-                roi_y = total_y + 80
+            draw.rounded_rectangle(
+                [(dashboard_x + 50, total_y), (dashboard_x + dashboard_width - 50, total_y + 60)],
+                radius=10, fill=(240, 250, 255), outline=(200, 220, 240)
+            )
+            
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, total_y + 30),
+                "Total Capital Freed This Month: ₹42,00,000",
+                font=heading_font, fill=HIGHLIGHT_COLOR, anchor="mm"
+            )
+        
+        # ROI calculation
+        if scene_progress > 0.8:
+            roi_y = total_y + 80
+            
+            draw.line(
+                [(dashboard_x + 30, roi_y), (dashboard_x + dashboard_width - 30, roi_y)],
+                fill=(220, 220, 230), width=1
+            )
+            
+            paste_text(
+                img, (dashboard_x + dashboard_width//2, roi_y + 30),
+                "Return on Investment - AI Margin Optimizer",
+                font=regular_font, fill=TEXT_COLOR, anchor="mm"
+            )
+            
+            # ROI metrics
+            metrics_y = roi_y + 70
+            col_width = dashboard_width // 3
+            
+            for i, (metric, value) in enumerate(ROI_METRICS):
+                metric_x = dashboard_x + (i * col_width) + (col_width // 2)
                 
-                draw.line(
-                    [(dashboard_x + 30, roi_y), (dashboard_x + dashboard_width - 30, roi_y)],
-                    fill=(220, 220, 230), width=1
+                paste_text(
+                    img, (metric_x, metrics_y),
+                    metric,
+                    font=small_font, fill=TEXT_COLOR, anchor="mm"
                 )
                 
-                draw.text(
-                    (dashboard_x + dashboard_width//2, roi_y + 30),
-                    "Return on Investment - AI Margin Optimizer",
-                    font=regular_font, fill=TEXT_COLOR, anchor="mm"
+                value_color = POSITIVE_COLOR if i != 1 else TEXT_COLOR
+                paste_text(
+                    img, (metric_x, metrics_y + 30),
+                    value,
+                    font=heading_font, fill=value_color, anchor="mm"
                 )
-                
-                # ROI metrics
-                metrics_y = roi_y + 70
-                col_width = dashboard_width // 3
-                
-                metrics = [
-                    ["Additional Profit Generated", "+₹2,10,000"],
-                    ["Monthly Subscription Cost", "₹12,000"],
-                    ["Return on Investment", "17.5x"]
-                ]
-                
-                for i, (metric, value) in enumerate(metrics):
-                    metric_x = dashboard_x + (i * col_width) + (col_width // 2)
+        
+        # Mr. Sharma excited about ROI
+        if scene_progress > 0.6:
+            draw_businessman(
+                img, WIDTH - 150, HEIGHT - 170,
+                size=120, expression="excited", action="thumbsup",
+                frame=scene_frame
+            )
+        
+    elif scene == 10:
+        # Conclusion & Benefits scene
+        # The gradient and title are part of the scene background
+        
+        # Mr. Sharma showing benefits
+        if scene_progress > 0.3:
+            draw_businessman(
+                img, WIDTH//4, HEIGHT//2 + 100,
+                size=150, expression="happy", action="pointing",
+                frame=scene_frame
+            )
+        
+        # Key benefits
+        if scene_progress > 0.3:
+            benefits_y = 270
+            benefit_height = 80
+            
+            benefits = [
+                "More capital to trade with - without adding new funds",
+                "Simple, actionable recommendations with no technical expertise required",
+                "Measurable improvement in trading performance"
+            ]
+            
+            for i, benefit in enumerate(benefits):
+                # Only show if far enough in the animation
+                if scene_progress > 0.3 + (i * 0.2):
+                    benefit_y = benefits_y + (i * benefit_height)
                     
-                    draw.text(
-                        (metric_x, metrics_y),
-                        metric,
-                        font=small_font, fill=TEXT_COLOR, anchor="mm"
+                    # Highlight box
+                    draw.rounded_rectangle(
+                        [(WIDTH//2 - 100, benefit_y), (WIDTH - 100, benefit_y + 60)],
+                        radius=10, fill=(255, 255, 255)
                     )
                     
-                    value_color = POSITIVE_COLOR if i != 1 else TEXT_COLOR
-                    draw.text(
-                        (metric_x, metrics_y + 30),
-                        value,
-                        font=heading_font, fill=value_color, anchor="mm"
+                    # Checkmark
+                    check_x = WIDTH//2 - 70
+                    paste_text(
+                        img, (check_x, benefit_y + 30),
+                        "✓",
+                        font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
                     )
+                    
+                    # Benefit text
+                    paste_text(
+                        img, (check_x + 30, benefit_y + 30),
+                        benefit,
+                        font=regular_font, fill=TEXT_COLOR
+                    )
+        
+        # Customer success stories
+        if scene_progress > 0.8:
+            story_y = 530
             
-            # Mr. Sharma excited about ROI
-            if scene_progress > 0.6:
-                draw_businessman(
-                    draw, WIDTH - 150, HEIGHT - 170,
-                    size=120, expression="excited", action="thumbsup",
-                    progress=scene_progress
-                )
-            
-        elif scene == 10:
-            # Conclusion & Benefits scene
-            # Background gradient for conclusion
-            for y in range(HEIGHT):
-                # Create gradient from top to bottom
-                r = int(20 + (y / HEIGHT) * 30)
-                g = int(30 + (y / HEIGHT) * 50)
-                b = int(70 + (y / HEIGHT) * 20)
-                
-                draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-            
-            # Title
-            draw.text(
-                (WIDTH//2, 150),
-                "AI Margin Optimizer",
-                font=title_font, fill=(255, 255, 255), anchor="mm"
+            draw.rounded_rectangle(
+                [(WIDTH//2 - 350, story_y), (WIDTH - 100, story_y + 100)],
+                radius=10, fill=(255, 255, 255)
             )
             
-            draw.text(
-                (WIDTH//2, 200),
-                "Your Capital, Unleashed",
-                font=regular_font, fill=(220, 220, 255), anchor="mm"
+            paste_text(
+                img, (WIDTH//2 - 330, story_y + 20),
+                "Customer Success: Mr. Sharma",
+                font=heading_font, fill=TEXT_COLOR
             )
             
-            # Mr. Sharma showing benefits
-            if scene_progress > 0.3:
-                draw_businessman(
-                    draw, WIDTH//4, HEIGHT//2 + 100,
-                    size=150, expression="happy", action="pointing",
-                    progress=scene_progress
-                )
-            
-            # Key benefits
-            if scene_progress > 0.3:
-                benefits_y = 270
-                benefit_height = 80
-                
-                benefits = [
-                    "More capital to trade with - without adding new funds",
-                    "Simple, actionable recommendations with no technical expertise required",
-                    "Measurable improvement in trading performance"
-                ]
-                
-                for i, benefit in enumerate(benefits):
-                    # Only show if far enough in the animation
-                    if scene_progress > 0.3 + (i * 0.2):
-                        benefit_y = benefits_y + (i * benefit_height)
-                        
-                        # Highlight box
-                        alpha = min(1.0, (scene_progress - (0.3 + i * 0.2)) / 0.15)
-                        
-                        draw.rounded_rectangle(
-                            [(WIDTH//2 - 100, benefit_y), (WIDTH - 100, benefit_y + 60)],
-                            radius=10, fill=(255, 255, 255, int(alpha * 200))
-                        )
-                        
-                        # Checkmark
-                        check_x = WIDTH//2 - 70
-                        draw.text(
-                            (check_x, benefit_y + 30),
-                            "✓",
-                            font=heading_font, fill=POSITIVE_COLOR, anchor="mm"
-                        )
-                        
-                        # Benefit text
-                        draw.text(
-                            (check_x + 30, benefit_y + 30),
-                            benefit,
-                            font=regular_font, fill=TEXT_COLOR
-                        )
-            
-            # Customer success stories
-            if scene_progress > 0.8:
-                story_y = 530
-                
-                draw.rounded_rectangle(
-                    [(WIDTH//2 - 350, story_y), (WIDTH - 100, story_y + 100)],
-                    radius=10, fill=(255, 255, 255, 180)
-                )
-                
-                draw.text(
-                    (WIDTH//2 - 330, story_y + 20),
-                    "Customer Success: Mr. Sharma",
-                    font=heading_font, fill=TEXT_COLOR
-                )
-                
-                draw.text(
-                    (WIDTH//2 - 330, story_y + 60),
-                    "Freed ₹12 lakhs of capital in one day\nGenerated ₹65,000 additional profit in one week\nAchieved 17.5x return on subscription investment",
-                    font=regular_font, fill=TEXT_COLOR
-                )
+            paste_text(
+                img, (WIDTH//2 - 330, story_y + 60),
+                "Freed ₹12 lakhs of capital in one day\nGenerated ₹65,000 additional profit in one week\nAchieved 17.5x return on subscription investment",
+                font=regular_font, fill=TEXT_COLOR
+            )
+        
+        # Call to action
+        if scene_progress > 0.9:
+            cta_y = 650
             
-            # Call to action
-            if scene_progress > 0.9:
-                cta_y = 650
-                
-                draw.rounded_rectangle(
-                    [(WIDTH//2, cta_y), (WIDTH - 100, cta_y + 60)],
-                    radius=30, fill=HIGHLIGHT_COLOR
-                )
-                
-                draw.text(
-                    (WIDTH//2 + (WIDTH - 100 - WIDTH//2)//2, cta_y + 30),
-                    "Start Your Free Trial Today",
-                    font=heading_font, fill=(255, 255, 255), anchor="mm"
-                )
+            draw.rounded_rectangle(
+                [(WIDTH//2, cta_y), (WIDTH - 100, cta_y + 60)],
+                radius=30, fill=HIGHLIGHT_COLOR
+            )
             
-        # Progress bar at bottom
-        draw.rectangle([(0, HEIGHT - 5), (int(WIDTH * frame_num / total_frames), HEIGHT)], fill=HIGHLIGHT_COLOR)
-        
-    except Exception as e:
-        # If there's an error, at least show it on the image
-        draw.text((WIDTH//2, HEIGHT//2), f"Error generating frame: {str(e)}", 
-                 font=regular_font, fill=NEGATIVE_COLOR, anchor="mm")
+            paste_text(
+                img, (WIDTH//2 + (WIDTH - 100 - WIDTH//2)//2, cta_y + 30),
+                "Start Your Free Trial Today",
+                font=heading_font, fill=(255, 255, 255), anchor="mm"
+            )
         
+    # Progress bar at bottom, as a solid fill of the box draw.rectangle would cover
+    img.paste(HIGHLIGHT_COLOR, (0, HEIGHT - 5, int(WIDTH * frame_num / total_frames) + 1, HEIGHT))
+    
     return img
 
+def render_frame_bytes(frame_num):
+    """Render a single frame as raw RGB bytes for the ffmpeg pipe"""
+    return generate_demo_frame(frame_num, NUM_FRAMES).tobytes()
+
+def render_frame(frame_num):
+    """Render a single frame and save it as PNG"""
+    # Fast zlib level: these are intermediate frames for ffmpeg, so size matters less than time
+    generate_demo_frame(frame_num, NUM_FRAMES).save(f"{OUTPUT_DIR}/frame_{frame_num:04d}.png", compress_level=1)
+    return frame_num
+
+def encode_video(ffmpeg, frames):
+    """
+    Pipe raw frames straight into ffmpeg to encode VIDEO_PATH
+    
+    Args:
+        ffmpeg (str): Path to the ffmpeg executable
+        frames (iterable): Raw RGB bytes of each frame, in order
+        
+    Returns:
+        bool: Whether ffmpeg wrote the video
+    """
+    proc = subprocess.Popen([
+        ffmpeg, '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{WIDTH}x{HEIGHT}', '-r', str(FPS), '-i', '-',
+        '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-crf', '23', VIDEO_PATH
+    ], stdin=subprocess.PIPE)
+    
+    try:
+        for done, frame_bytes in enumerate(frames, 1):
+            proc.stdin.write(frame_bytes)
+            print(f"Encoded frame {done}/{NUM_FRAMES}")
+    except BrokenPipeError:
+        # ffmpeg exited early; its exit status below says so
+        pass
+    finally:
+        # Always let ffmpeg see end of input and reap it, even if a frame failed to render
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
+    
+    if proc.returncode != 0:
+        print(f"Error creating video: ffmpeg exited with status {proc.returncode}")
+        return False
+    return True
+
 def create_sharma_demo():
-    print("Creating detailed Mr. Sharma demo video frames...")
+    print("Creating detailed Mr. Sharma demo video...")
     
-    # Create output directory
-    create_directory(OUTPUT_DIR)
+    ffmpeg = shutil.which('ffmpeg')
     
-    # Generate frames
-    for i in range(NUM_FRAMES):
-        print(f"Generating frame {i+1}/{NUM_FRAMES}")
-        
-        # Generate the frame
-        frame = generate_demo_frame(i, NUM_FRAMES)
-        
-        # Save the frame
-        frame.save(f"{OUTPUT_DIR}/frame_{i:04d}.png")
+    # Frames only depend on their index, so render them across all cores
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        if ffmpeg:
+            # Pipe raw frames straight into the encoder instead of writing PNGs; imap keeps them in order
+            video_saved = encode_video(ffmpeg, pool.imap(render_frame_bytes, range(NUM_FRAMES), chunksize=FRAME_CHUNK))
+        else:
+            create_directory(OUTPUT_DIR)
+            for done, _ in enumerate(pool.imap_unordered(render_frame, range(NUM_FRAMES), chunksize=FRAME_CHUNK), 1):
+                print(f"Generated frame {done}/{NUM_FRAMES}")
     
-    print(f"Demo frames generated in '{OUTPUT_DIR}' directory")
     print(f"Total frames: {NUM_FRAMES}")
-    print("To create a video, you can use:")
-    print(f"ffmpeg -r 10 -i {OUTPUT_DIR}/frame_%04d.png -c:v libx264 -pix_fmt yuv420p -crf 23 detailed_sharma_demo_video.mp4")
+    if ffmpeg:
+        if not video_saved:
+            sys.exit(1)
+        print(f"Demo video saved to '{VIDEO_PATH}'")
+    else:
+        print(f"ffmpeg not found, demo frames generated in '{OUTPUT_DIR}' directory")
+        print("To create a video, you can use:")
+        print(f"ffmpeg -r {FPS} -i {OUTPUT_DIR}/frame_%04d.png -c:v libx264 -pix_fmt yuv420p -crf 23 {VIDEO_PATH}")
 
 if __name__ == "__main__":
     create_sharma_demo()
\ No newline at end of file
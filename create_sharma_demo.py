@@ -1,8 +1,10 @@
 import time
 import os
 import sys
+import multiprocessing
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
+import math
 
 # Configure demo parameters
 NUM_FRAMES = 100
@@ -15,6 +17,17 @@ POSITIVE_COLOR = (25, 135, 84)
 NEGATIVE_COLOR = (220, 53, 69)
 NEUTRAL_COLOR = (108, 117, 125)
 
+def _load_fonts(sizes):
+    """Load Arial at each size, falling back to the default font for all of them"""
+    try:
+        return {size: ImageFont.truetype("arial.ttf", size) for size in sizes}
+    except IOError:
+        default_font = ImageFont.load_default()
+        return {size: default_font for size in sizes}
+
+# Fonts are loaded once at import rather than on every frame
+FONTS = _load_fonts((16, 20, 28, 36))
+
 def create_directory(dir_path):
     if not os.path.exists(dir_path):
         os.makedirs(dir_path)
@@ -33,17 +46,10 @@ def generate_demo_frame(frame_num, total_frames):
     draw = ImageDraw.Draw(img)
     
     try:
-        # Load fonts (use default if custom font fails)
-        try:
-            title_font = ImageFont.truetype("arial.ttf", 36)
-            heading_font = ImageFont.truetype("arial.ttf", 28)
-            regular_font = ImageFont.truetype("arial.ttf", 20)
-            small_font = ImageFont.truetype("arial.ttf", 16)
-        except IOError:
-            title_font = ImageFont.load_default()
-            heading_font = ImageFont.load_default()
-            regular_font = ImageFont.load_default()
-            small_font = ImageFont.load_default()
+        title_font = FONTS[36]
+        heading_font = FONTS[28]
+        regular_font = FONTS[20]
+        small_font = FONTS[16]
         
         # Determine which scene to show based on frame number
         scene = 1
@@ -569,18 +575,18 @@ def generate_demo_frame(frame_num, total_frames):
                 minute_progress = min(1.0, (progress - 0.7) / 0.3)  # Animate from 9:15 to 9:30
                 
                 # Hour hand (pointing near 9)
-                angle = np.pi/2 - (9/12) * 2*np.pi
+                angle = math.pi/2 - (9/12) * 2*math.pi
                 hour_length = 30
-                hx = clock_x + int(hour_length * np.cos(angle))
-                hy = clock_y - int(hour_length * np.sin(angle))
+                hx = clock_x + int(hour_length * math.cos(angle))
+                hy = clock_y - int(hour_length * math.sin(angle))
                 draw.line([(clock_x, clock_y), (hx, hy)], fill=TEXT_COLOR, width=3)
                 
                 # Minute hand (animating from 15 to 30 minutes)
                 minute = 15 + int(minute_progress * 15)
-                angle = np.pi/2 - (minute/60) * 2*np.pi
+                angle = math.pi/2 - (minute/60) * 2*math.pi
                 minute_length = 45
-                mx = clock_x + int(minute_length * np.cos(angle))
-                my = clock_y - int(minute_length * np.sin(angle))
+                mx = clock_x + int(minute_length * math.cos(angle))
+                my = clock_y - int(minute_length * math.sin(angle))
                 draw.line([(clock_x, clock_y), (mx, my)], fill=HIGHLIGHT_COLOR, width=2)
                 
                 # Show time text
@@ -1147,21 +1153,21 @@ def generate_demo_frame(frame_num, total_frames):
         
     return img
 
+def render_frame(frame_num):
+    """Render a single frame and save it as PNG"""
+    generate_demo_frame(frame_num, NUM_FRAMES).save(f"{OUTPUT_DIR}/frame_{frame_num:04d}.png")
+    return frame_num
+
 def create_sharma_demo():
     print("Creating Mr. Sharma demo video frames...")
     
     # Create output directory
     create_directory(OUTPUT_DIR)
     
-    # Generate frames
-    for i in range(NUM_FRAMES):
-        print(f"Generating frame {i+1}/{NUM_FRAMES}")
-        
-        # Generate the frame
-        frame = generate_demo_frame(i, NUM_FRAMES)
-        
-        # Save the frame
-        frame.save(f"{OUTPUT_DIR}/frame_{i:04d}.png")
+    # Frames only depend on their index, so render them across all cores
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for done, _ in enumerate(pool.imap_unordered(render_frame, range(NUM_FRAMES)), 1):
+            print(f"Generated frame {done}/{NUM_FRAMES}")
     
     print(f"Demo frames generated in '{OUTPUT_DIR}' directory")
     print(f"Total frames: {NUM_FRAMES}")
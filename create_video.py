@@ -52,7 +52,7 @@ def main():
     frames_dir = "demo_frames"
     if not os.path.exists(frames_dir) or not os.listdir(frames_dir):
         print("No frames found in 'demo_frames' directory.")
-        print("Run create_demo_video.py first.")
+        print("Run 'python create_demo_video.py --frames' first.")
         sys.exit(1)
     
     # Create video
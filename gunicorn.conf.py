@@ -0,0 +1,18 @@
+# Gunicorn settings for wsgi.py:
+#   gunicorn -c gunicorn.conf.py wsgi:app
+bind = '0.0.0.0:5000'
+worker_class = 'gevent'
+# One worker: the connected broker session, single-flight map, provider guards
+# and SimpleCache all live in process memory, so more workers would each see
+# their own copy. Concurrency comes from gevent's worker_connections instead.
+workers = 1
+worker_connections = 1000
+
+# Import the app once in the master so workers are forked with it already loaded
+preload_app = True
+
+def when_ready(server):
+    """Load the heavy services before forking so workers share them copy-on-write"""
+    from app import get_service
+    for name in ('sentiment', 'prediction'):
+        get_service(name)
@@ -4,7 +4,7 @@ import numpy as np
 import xgboost as xgb
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
-import pickle
+import joblib
 import matplotlib.pyplot as plt
 import json
 
@@ -231,12 +231,12 @@ class MarginOptimizerModelTrainer:
         if self.model and self.feature_columns:
             try:
                 os.makedirs('models', exist_ok=True)
-                with open(os.path.join('models', self.model_path), 'wb') as f:
-                    model_data = {
-                        'model': self.model,
-                        'feature_columns': self.feature_columns
-                    }
-                    pickle.dump(model_data, f)
+                model_data = {
+                    'model': self.model,
+                    'feature_columns': self.feature_columns
+                }
+                # Uncompressed so PredictionService can memory-map it on load
+                joblib.dump(model_data, os.path.join('models', self.model_path), compress=0)
                 print(f"Model saved to models/{self.model_path}")
             except Exception as e:
                 print(f"Error saving model: {str(e)}")
@@ -38,12 +38,26 @@ class NewsService:
         Returns:
             list: News articles related to portfolio holdings
         """
-        news = []
-        
         # Check if NewsAPI is configured
         if not self.newsapi:
             return {"error": "NewsAPI key not configured"}
         
+        return list(self.iter_news_for_portfolio(portfolio))
+    
+    def iter_news_for_portfolio(self, portfolio):
+        """
+        Yield news related to a portfolio's holdings as each article is fetched
+        
+        Args:
+            portfolio (dict): Portfolio with holdings
+            
+        Yields:
+            dict: News article related to a portfolio holding
+        """
+        # Check if NewsAPI is configured
+        if not self.newsapi:
+            raise ValueError("NewsAPI key not configured")
+        
         # Extract tickers/company names from portfolio
         symbols = []
         for holding in portfolio.get('holdings', []):
@@ -74,7 +88,7 @@ class NewsService:
                     
                     # Add symbol to track which holding this relates to
                     article['related_symbol'] = symbol
-                    news.append(article)
+                    yield article
                     
             except Exception as e:
                 print(f"Error fetching news for {symbol}: {str(e)}")
@@ -85,7 +99,7 @@ class NewsService:
                 try:
                     tweets = self.twitter_api.search_tweets(q=symbol, count=10)
                     for tweet in tweets:
-                        news.append({
+                        yield {
                             'source': 'Twitter',
                             'author': tweet.user.screen_name,
                             'title': '',
@@ -94,8 +108,6 @@ class NewsService:
                             'publishedAt': tweet.created_at.isoformat(),
                             'related_symbol': symbol,
                             'full_text': tweet.text
-                        })
+                        }
                 except Exception as e:
                     print(f"Error fetching tweets for {symbol}: {str(e)}")
-        
-        return news
\ No newline at end of file
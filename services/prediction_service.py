@@ -4,7 +4,7 @@ import numpy as np
 import xgboost as xgb
 from datetime import datetime, timedelta
 import json
-import pickle
+import joblib
 import os.path
 
 class PredictionService:
@@ -20,10 +20,10 @@ class PredictionService:
         """Load the model if it exists"""
         if os.path.exists(self.model_path):
             try:
-                with open(self.model_path, 'rb') as f:
-                    model_data = pickle.load(f)
-                    self.model = model_data.get('model')
-                    self.feature_columns = model_data.get('feature_columns')
+                # Memory-map array data read-only so preforked workers share it via the page cache
+                model_data = joblib.load(self.model_path, mmap_mode='r')
+                self.model = model_data.get('model')
+                self.feature_columns = model_data.get('feature_columns')
                 print(f"Model loaded from {self.model_path}")
             except Exception as e:
                 print(f"Error loading model: {str(e)}")
@@ -37,12 +37,12 @@ class PredictionService:
         if self.model and self.feature_columns:
             try:
                 os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
-                with open(self.model_path, 'wb') as f:
-                    model_data = {
-                        'model': self.model,
-                        'feature_columns': self.feature_columns
-                    }
-                    pickle.dump(model_data, f)
+                model_data = {
+                    'model': self.model,
+                    'feature_columns': self.feature_columns
+                }
+                # Uncompressed so the file can be memory-mapped on load
+                joblib.dump(model_data, self.model_path, compress=0)
                 print(f"Model saved to {self.model_path}")
             except Exception as e:
                 print(f"Error saving model: {str(e)}")
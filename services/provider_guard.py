@@ -0,0 +1,131 @@
+import time
+import threading
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import MovingWindowRateLimiter
+
+class ProviderUnavailable(Exception):
+    """Raised when a provider call is rejected by its rate limit or open circuit"""
+
+def is_error_payload(result):
+    """Whether a service result is an error payload rather than data"""
+    return isinstance(result, dict) and (result.get('success') is False or 'error' in result)
+
+class ProviderGuard:
+    """
+    Rate limiter and circuit breaker around calls to one upstream provider
+    (broker API, news API, ...), so a throttled or failing upstream fails fast
+    instead of costing every request a full timeout.
+    """
+
+    # Moving-window rate limiter shared by all guards in this process. Created on
+    # first use, since its storage starts a timer thread that mustn't exist before
+    # a preforking server (gunicorn --preload) forks its workers.
+    _limiter = None
+    _limiter_lock = threading.Lock()
+
+    @classmethod
+    def _get_limiter(cls):
+        """Get the per-process rate limiter, creating it if needed"""
+        with cls._limiter_lock:
+            if cls._limiter is None:
+                cls._limiter = MovingWindowRateLimiter(MemoryStorage())
+            return cls._limiter
+
+    def __init__(self, name, rate_limit, fail_max=5, reset_timeout=30):
+        """
+        Initialize the guard
+
+        Args:
+            name (str): Provider name, also used as the rate limit key
+            rate_limit (str): Allowed call rate, e.g. "300/second" or "5/minute"
+            fail_max (int): Consecutive failures before the circuit opens
+            reset_timeout (int): Seconds an open circuit waits before letting a trial call through
+        """
+        self.name = name
+        self.rate_limit = parse(rate_limit)
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.fail_counter = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Circuit state: 'closed', 'open' or 'half-open'"""
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Call fn through the rate limiter and circuit breaker
+
+        Exceptions and error payloads both count as failures. Unlike pybreaker,
+        the lock is only held for bookkeeping, so concurrent calls still overlap.
+
+        Returns:
+            The result of fn
+
+        Raises:
+            ProviderUnavailable: If the rate limit is exhausted or the circuit is open
+        """
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self._record(failed=True)
+            raise
+
+        self._record(failed=is_error_payload(result))
+        return result
+
+    def stream(self, fn, *args, **kwargs):
+        """Like call(), for a generator function; errors while iterating count as failures"""
+        self._before_call()
+        try:
+            yield from fn(*args, **kwargs)
+        except Exception:
+            self._record(failed=True)
+            raise
+
+        self._record(failed=False)
+
+    def status(self):
+        """
+        Get breaker and rate limit status
+
+        Returns:
+            dict: Circuit state, consecutive failures and configured rate limit
+        """
+        return {
+            'state': self.state,
+            'failures': self.fail_counter,
+            'rate_limit': str(self.rate_limit)
+        }
+
+    def _before_call(self):
+        """Reject the call if the provider is throttled or its circuit is open"""
+        if not self._get_limiter().hit(self.rate_limit, self.name):
+            raise ProviderUnavailable(f"{self.name} rate limit exceeded")
+
+        with self._lock:
+            state = self.state
+            if state == 'open':
+                raise ProviderUnavailable(f"{self.name} circuit is open")
+            if state == 'half-open':
+                # Let this call through as the trial; others fail fast until it finishes
+                self.opened_at = time.monotonic()
+
+    def _record(self, failed):
+        """Update the failure count and open or close the circuit"""
+        with self._lock:
+            if failed:
+                self.fail_counter += 1
+                if self.fail_counter >= self.fail_max:
+                    self.opened_at = time.monotonic()
+            else:
+                self.fail_counter = 0
+                self.opened_at = None
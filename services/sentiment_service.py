@@ -1,18 +1,52 @@
 import os
 import pandas as pd
 import numpy as np
-import re
+import json
 from datetime import datetime
 import requests
+import itertools
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Check if we have the ANTHROPIC_API_KEY
 anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
 
+DEFAULT_ENDPOINT = 'https://api.anthropic.com'
+
 class SentimentService:
     def __init__(self):
         self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
         self.use_ai_sentiment = True if self.anthropic_api_key else False
         
+        # Headline scoring doesn't need a large model; the small one is faster and cheaper
+        self.model = os.getenv('SENTIMENT_MODEL', 'claude-3-haiku-20240307')
+        self.max_article_chars = 512  # Roughly 128 tokens per article
+        
+        # Messages API endpoints to spread batches across (e.g. several local gateways).
+        # Every endpoint is sent the Anthropic API key, so only list trusted Messages API proxies.
+        self.endpoints = [
+            endpoint.strip().rstrip('/')
+            for endpoint in os.getenv('SENTIMENT_ENDPOINTS', DEFAULT_ENDPOINT).split(',')
+            if endpoint.strip()
+        ]
+        if not self.endpoints:
+            print(f"SENTIMENT_ENDPOINTS lists no endpoints, using {DEFAULT_ENDPOINT}")
+            self.endpoints = [DEFAULT_ENDPOINT]
+        self.endpoint_failures = {endpoint: 0 for endpoint in self.endpoints}
+        self.endpoint_retry_at = {endpoint: 0 for endpoint in self.endpoints}
+        self._endpoint_counter = itertools.count()
+        # analyze_batch updates the failure bookkeeping from several threads
+        self._endpoint_lock = threading.Lock()
+        
+        # Reuse one keep-alive connection to the API instead of a new TLS handshake per call
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "x-api-key": self.anthropic_api_key or "",
+            "anthropic-version": "2023-06-01"
+        })
+        
         # Simple sentiment lexicon for rule-based sentiment analysis as fallback
         self.positive_words = [
             'bullish', 'uptrend', 'growth', 'profit', 'gain', 'positive', 'surge',
@@ -50,15 +84,14 @@ class SentimentService:
                     articles_by_symbol[symbol] = []
                 articles_by_symbol[symbol].append(article)
         
-        # Analyze sentiment for each symbol
-        sentiment_results = {}
-        for symbol, articles in articles_by_symbol.items():
-            if self.use_ai_sentiment:
-                sentiment_scores = self._analyze_sentiment_with_ai(articles, symbol)
-            else:
-                sentiment_scores = self._analyze_sentiment_rule_based(articles, symbol)
-            
-            sentiment_results[symbol] = sentiment_scores
+        # Analyze sentiment for all symbols, batching AI requests
+        if self.use_ai_sentiment:
+            sentiment_results = self.analyze_batch(articles_by_symbol)
+        else:
+            sentiment_results = {
+                symbol: self._analyze_sentiment_rule_based(articles, symbol)
+                for symbol, articles in articles_by_symbol.items()
+            }
         
         # Calculate overall sentiment score
         if sentiment_results:
@@ -78,35 +111,121 @@ class SentimentService:
         
         return sentiment_results
     
+    def analyze_batch(self, articles_by_symbol, batch_size=32):
+        """
+        Analyze sentiment for many symbols with one Claude API call per batch
+        
+        Args:
+            articles_by_symbol (dict): News articles grouped by related symbol
+            batch_size (int): Maximum number of symbols scored per API call
+            
+        Returns:
+            dict: Sentiment scores by symbol
+        """
+        symbols = list(articles_by_symbol)
+        batches = [
+            {symbol: articles_by_symbol[symbol] for symbol in symbols[start:start + batch_size]}
+            for start in range(0, len(symbols), batch_size)
+        ]
+        
+        if len(batches) <= 1:
+            return self._analyze_batch_with_ai(batches[0]) if batches else {}
+        
+        # Send batches concurrently; each one picks the next endpoint round-robin
+        sentiment_results = {}
+        with ThreadPoolExecutor(max_workers=min(6, len(batches))) as executor:
+            for batch_results in executor.map(self._analyze_batch_with_ai, batches):
+                sentiment_results.update(batch_results)
+        
+        return sentiment_results
+    
+    def _ordered_endpoints(self):
+        """Endpoints in round-robin order, skipping ones cooling down after failures"""
+        start = next(self._endpoint_counter)
+        ordered = [self.endpoints[(start + i) % len(self.endpoints)] for i in range(len(self.endpoints))]
+        
+        now = time.time()
+        with self._endpoint_lock:
+            healthy = [endpoint for endpoint in ordered if self.endpoint_retry_at[endpoint] <= now]
+        return healthy or ordered
+    
+    @staticmethod
+    def _is_endpoint_failure(error):
+        """Whether an error is the endpoint's fault: connection problems, timeouts, 429 or 5xx"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        response = getattr(error, 'response', None)
+        return response is not None and (response.status_code == 429 or response.status_code >= 500)
+    
+    def _post_messages(self, payload):
+        """Call the Messages API, failing over to the next endpoint on endpoint failures"""
+        last_error = None
+        
+        for endpoint in self._ordered_endpoints():
+            try:
+                response = self.session.post(f"{endpoint}/v1/messages", json=payload, timeout=30)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                if not self._is_endpoint_failure(e):
+                    # A bad request or API key would fail the same way on every endpoint
+                    raise
+                
+                last_error = e
+                with self._endpoint_lock:
+                    self.endpoint_failures[endpoint] += 1
+                    # Back off exponentially on repeated failures, up to 5 minutes
+                    self.endpoint_retry_at[endpoint] = time.time() + min(300, 5 * 2 ** self.endpoint_failures[endpoint])
+                continue
+            
+            with self._endpoint_lock:
+                self.endpoint_failures[endpoint] = 0
+            return response.json()
+        
+        raise last_error or RuntimeError("No Messages API endpoint is configured")
+    
     def _analyze_sentiment_with_ai(self, articles, symbol):
-        """Use Claude API for sentiment analysis"""
+        """Use Claude API for sentiment analysis of a single symbol"""
+        return self._analyze_batch_with_ai({symbol: articles})[symbol]
+    
+    def _format_articles(self, articles, symbol):
+        """Format up to 5 articles about a symbol as prompt text"""
+        combined_text = f"Financial news about {symbol}:\n\n"
+        
+        # Get the full text of articles if available, otherwise use description
+        for article in articles[:5]:  # Limit to 5 articles to avoid token limits
+            title = article.get('title', '')
+            source = article.get('source', {}).get('name', 'Unknown source')
+            text = (article.get('full_text', article.get('description', '')) or '')[:self.max_article_chars]
+            published = article.get('publishedAt', '')
+            
+            if published:
+                try:
+                    published_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                    published = published_date.strftime('%Y-%m-%d')
+                except:
+                    pass
+            
+            combined_text += f"Title: {title}\n"
+            combined_text += f"Source: {source}\n"
+            combined_text += f"Date: {published}\n"
+            combined_text += f"Content: {text}\n\n"
+        
+        return combined_text
+    
+    def _analyze_batch_with_ai(self, articles_by_symbol):
+        """Use a single Claude API call to score sentiment for several symbols"""
         
         try:
             # Prepare text for analysis
-            combined_text = f"Financial news about {symbol}:\n\n"
-            
-            # Get the full text of articles if available, otherwise use description
-            for article in articles[:5]:  # Limit to 5 articles to avoid token limits
-                title = article.get('title', '')
-                source = article.get('source', {}).get('name', 'Unknown source')
-                text = article.get('full_text', article.get('description', ''))
-                published = article.get('publishedAt', '')
-                
-                if published:
-                    try:
-                        published_date = datetime.fromisoformat(published.replace('Z', '+00:00'))
-                        published = published_date.strftime('%Y-%m-%d')
-                    except:
-                        pass
-                
-                combined_text += f"Title: {title}\n"
-                combined_text += f"Source: {source}\n"
-                combined_text += f"Date: {published}\n"
-                combined_text += f"Content: {text}\n\n"
+            combined_text = "".join(
+                self._format_articles(articles, symbol)
+                for symbol, articles in articles_by_symbol.items()
+            )
             
             # Prepare the prompt for Claude
             prompt = f"""
-            I'll give you financial news about {symbol}. Analyze the sentiment from a trader's perspective.
+            I'll give you financial news about these symbols: {', '.join(articles_by_symbol)}.
+            Analyze the sentiment for each symbol from a trader's perspective.
             Focus on how this news might impact:
             1. Stock price in short-term (1-5 days)
             2. Market sentiment toward this company
@@ -115,7 +234,7 @@ class SentimentService:
             Rate the overall sentiment on a scale of -1.0 (extremely negative) to 1.0 (extremely positive), 
             with 0 being neutral. Also provide a confidence level from 0.0 to 1.0.
             
-            Return ONLY a JSON object with these fields:
+            Return ONLY a JSON object keyed by symbol, where each value has these fields:
             - score: The sentiment score (-1.0 to 1.0)
             - confidence: Your confidence level (0.0 to 1.0)
             
@@ -124,53 +243,50 @@ class SentimentService:
             """
             
             # Call Anthropic API
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": self.anthropic_api_key,
-                    "anthropic-version": "2023-06-01"
-                },
-                json={
-                    "model": "claude-3-sonnet-20240229",
-                    "max_tokens": 200,
-                    "messages": [{"role": "user", "content": prompt}]
-                }
-            )
-            
-            result = response.json()
+            result = self._post_messages({
+                "model": self.model,
+                "max_tokens": 100 + 50 * len(articles_by_symbol),
+                "messages": [{"role": "user", "content": prompt}]
+            })
+            batch_data = {}
             
             if 'content' in result and len(result['content']) > 0:
                 content = result['content'][0]['text']
                 
-                # Extract JSON from the response
-                json_pattern = r'\{.*?\}'
-                json_match = re.search(json_pattern, content, re.DOTALL)
+                # Extract the JSON object from the response, ignoring any text after it
+                json_start = content.find('{')
+                
+                if json_start != -1:
+                    batch_data, _ = json.JSONDecoder().raw_decode(content, json_start)
+            
+            sentiment_results = {}
+            for symbol, articles in articles_by_symbol.items():
+                sentiment_data = batch_data.get(symbol)
                 
-                if json_match:
-                    import json
-                    sentiment_data = json.loads(json_match.group(0))
-                    
+                try:
                     # Validate and sanitize results
-                    score = sentiment_data.get('score', 0)
-                    score = max(-1.0, min(1.0, float(score)))
-                    
-                    confidence = sentiment_data.get('confidence', 0.5)
-                    confidence = max(0.0, min(1.0, float(confidence)))
-                    
-                    return {
-                        'score': score,
-                        'confidence': confidence,
-                        'method': 'ai'
-                    }
-            
-            # Fallback to rule-based if AI parsing fails
-            return self._analyze_sentiment_rule_based(articles, symbol)
+                    score = max(-1.0, min(1.0, float(sentiment_data.get('score', 0))))
+                    confidence = max(0.0, min(1.0, float(sentiment_data.get('confidence', 0.5))))
+                except (AttributeError, TypeError, ValueError):
+                    # Fallback to rule-based if AI parsing fails for this symbol
+                    sentiment_results[symbol] = self._analyze_sentiment_rule_based(articles, symbol)
+                    continue
+                
+                sentiment_results[symbol] = {
+                    'score': score,
+                    'confidence': confidence,
+                    'method': 'ai'
+                }
+            
+            return sentiment_results
             
         except Exception as e:
             print(f"Error in AI sentiment analysis: {str(e)}")
             # Fallback to rule-based sentiment analysis
-            return self._analyze_sentiment_rule_based(articles, symbol)
+            return {
+                symbol: self._analyze_sentiment_rule_based(articles, symbol)
+                for symbol, articles in articles_by_symbol.items()
+            }
     
     def _analyze_sentiment_rule_based(self, articles, symbol):
         """Simple rule-based sentiment analysis"""
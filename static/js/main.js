@@ -208,14 +208,42 @@ async function fetchPortfolio() {
 
 /**
  * Fetch news data from API
+ *
+ * The endpoint streams NDJSON (one article per line), so the news list
+ * is updated as articles arrive rather than after the whole response.
  */
 async function fetchNews() {
+    const news = [];
+    
+    const addLine = line => {
+        if (!line.trim()) return;
+        const item = JSON.parse(line);
+        if (!item.error) news.push(item);
+    };
+    
     try {
         const response = await fetch('/api/news');
-        return await response.json();
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.forEach(addLine);
+            
+            updateNewsUI(news);
+        }
+        
+        addLine(buffer + decoder.decode());
+        return news;
     } catch (error) {
         console.error("Error fetching news:", error);
-        return [];
+        return news;
     }
 }
 
@@ -0,0 +1,46 @@
+import time
+import app
+
+class StubNewsService:
+    """News service that counts fetches instead of calling NewsAPI"""
+    newsapi = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_news_for_portfolio(self, portfolio):
+        self.calls += 1
+        return [{"title": "Test article", "related_symbol": "TEST"}]
+
+def test_news_refetched_after_breaker_closes():
+    """An open-circuit error must not be memoized, so news is fetched once the breaker closes"""
+    guard = app.provider_guards['news']
+    news_service = StubNewsService()
+    original_service = app._services.get('news')
+    app._services['news'] = news_service
+
+    try:
+        with app.app.app_context():
+            app.cache.clear()
+
+            # Open the breaker with no last good result to fall back on
+            guard.opened_at = time.monotonic()
+            result = app.fetch_news('acct')
+            assert app.is_error_payload(result)
+            assert news_service.calls == 0
+
+            # Close it again; the next request must reach the service
+            guard.opened_at = None
+            guard.fail_counter = 0
+            result = app.fetch_news('acct')
+            assert result == [{"title": "Test article", "related_symbol": "TEST"}]
+            assert news_service.calls == 1
+    finally:
+        guard.opened_at = None
+        guard.fail_counter = 0
+        if original_service is None:
+            app._services.pop('news', None)
+        else:
+            app._services['news'] = original_service
+        with app.app.app_context():
+            app.cache.clear()
@@ -0,0 +1,12 @@
+# Production entry point, served with gevent workers:
+#   gunicorn -c gunicorn.conf.py wsgi:app  (gevent workers, see gunicorn.conf.py)
+# Monkey-patch before anything imports sockets so the broker/news/market
+# HTTP calls yield to other requests instead of blocking the worker
+from gevent import monkey
+monkey.patch_all()
+
+from app import app
+
+if __name__ == "__main__":
+    from gevent.pywsgi import WSGIServer
+    WSGIServer(('0.0.0.0', 5000), app).serve_forever()